@@ -0,0 +1,114 @@
+# 파일명: core/cache.py
+
+import asyncio
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+from app.core.config import get_cache_backend, get_cache_ttl_seconds, get_redis_url
+
+
+# ✅ 프로세스 내부용 LRU 캐시
+# - 동기 라우트는 스레드풀에서 실행되므로 Lock으로 보호
+# - maxsize를 넘으면 가장 오래 사용되지 않은 항목부터 제거
+class LRUCache:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    # ✅ 응답 캐시 공통 인터페이스 (async 라우트용, RedisCache와 동일)
+    # - 메모리 조회라 이벤트 루프를 막지 않으므로 그대로 호출
+    async def aget(self, key: Hashable, default: Any = None) -> Any:
+        return self.get(key, default)
+
+    async def aset(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ✅ 인메모리 색인 재생성용 single-flight 잠금 (async 라우트용)
+# - 세대가 바뀐 직후 동시 요청이 몰려도 색인은 한 번만 생성하고, 나머지 요청은 기다렸다가 재사용
+# - asyncio.Lock은 이벤트 루프에 묶이므로 루프별로 따로 생성
+class AsyncBuildLock:
+    def __init__(self):
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __call__(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+
+# ✅ 여러 워커/호스트가 공유하는 Redis 캐시
+# - redis 패키지가 필요하며, 값은 bytes로 저장
+# - 키에 데이터 세대가 포함되므로 오래된 항목은 TTL로 자연 소멸
+# - redis.asyncio 클라이언트로 조회/저장 → async 라우트의 이벤트 루프를 막지 않음
+#   (클라이언트 연결은 이벤트 루프에 묶이므로 루프별로 따로 생성)
+class RedisCache:
+    def __init__(self, url: str, ttl_seconds: int = 3600, prefix: str = "jobnav:"):
+        try:
+            import redis.asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis 사용 시 redis 패키지가 필요합니다.") from e
+        self._redis = redis_asyncio
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.url = url
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+
+    def _client(self):
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = self._redis.Redis.from_url(self.url)
+        return client
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        value = await self._client().get(self.prefix + key)
+        return default if value is None else value
+
+    async def aset(self, key: str, value: bytes) -> None:
+        await self._client().set(self.prefix + key, value, ex=self.ttl_seconds)
+
+    async def clear(self) -> None:
+        client = self._client()
+        async for key in client.scan_iter(match=self.prefix + "*"):
+            await client.delete(key)
+
+
+# ✅ 응답 캐시 백엔드 (CACHE_BACKEND 환경변수로 선택, 프로세스당 1개)
+@lru_cache(maxsize=None)
+def get_response_cache(backend: Optional[str] = None):
+    backend = backend or get_cache_backend()
+    if backend == "redis":
+        return RedisCache(get_redis_url(), ttl_seconds=get_cache_ttl_seconds())
+    return LRUCache(maxsize=2048)
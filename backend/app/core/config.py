@@ -52,6 +52,11 @@ def get_settings() -> dict:
         # ✅ OpenAI 설정
         "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", ""),
 
+        # ✅ 응답 캐시 설정 (memory: 프로세스 내부 LRU, redis: 워커 간 공유)
+        "CACHE_BACKEND": get_cache_backend(),
+        "REDIS_URL": get_redis_url(),
+        "CACHE_TTL_SECONDS": get_cache_ttl_seconds(),
+
     }
 
 
@@ -85,4 +90,14 @@ def get_access_token_expiry_minutes() -> int:
 
 # ✅ OpenAI API 키 Getter
 def get_openai_api_key() -> str:
-    return os.getenv("OPENAI_API_KEY", "")
\ No newline at end of file
+    return os.getenv("OPENAI_API_KEY", "")
+
+# ✅ 응답 캐시 설정 Getter
+def get_cache_backend() -> str:
+    return os.getenv("CACHE_BACKEND", "memory")
+
+def get_redis_url() -> str:
+    return os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+def get_cache_ttl_seconds() -> int:
+    return int(os.getenv("CACHE_TTL_SECONDS", 3600))
@@ -1,5 +1,6 @@
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
 
@@ -24,6 +25,11 @@ if ENV == "production":
     SQLALCHEMY_DATABASE_URL = (
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
+
+    # ✅ 비동기 드라이버(asyncpg) 접속 URL
+    ASYNC_SQLALCHEMY_DATABASE_URL = (
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    )
 else:
     # 👉 SQLite 설정 (개발/로컬 테스트 환경)
     SQLITE_PATH = os.getenv("SQLITE_DB_PATH", "./app/sqlite.db")
@@ -31,6 +37,9 @@ else:
     # ✅ SQLite 접속 URL 생성
     SQLALCHEMY_DATABASE_URL = f"sqlite:///{SQLITE_PATH}"
 
+    # ✅ 비동기 드라이버(aiosqlite) 접속 URL
+    ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{SQLITE_PATH}"
+
 # ✅ SQLite는 멀티스레드 접근을 허용하지 않기 때문에 옵션 설정 필요
 connect_args = (
     {"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
@@ -46,6 +55,17 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# ✅ 비동기 엔진 / 세션 팩토리
+# - async 라우트에서 사용 (이벤트 루프를 막지 않고, 스레드풀 크기에 동시성이 묶이지 않음)
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # 공통 Base 클래스 정의
 Base = declarative_base()
 
@@ -58,3 +78,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# ✅ FastAPI Dependency로 사용할 수 있는 비동기 DB 세션 생성 함수
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
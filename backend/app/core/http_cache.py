@@ -0,0 +1,29 @@
+# 파일명: core/http_cache.py
+
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+
+# ✅ 강한(strong) ETag 생성: 응답 내용을 결정하는 값들의 해시
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+# ✅ If-None-Match 헤더가 현재 ETag와 일치하는지 확인 (여러 값, "*", W/ 접두사 지원)
+# - "*"는 리소스가 있을 때만 일치 → 존재 확인 전에 호출할 때는 match_any=False
+def is_not_modified(request: Request, etag: str, match_any: bool = True) -> bool:
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [value.strip() for value in header.split(",")]
+    return (match_any and "*" in candidates) or any(
+        candidate.removeprefix("W/") == etag for candidate in candidates
+    )
+
+
+# ✅ 304 Not Modified 응답 (본문 직렬화 없음)
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
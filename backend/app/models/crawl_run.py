@@ -0,0 +1,59 @@
+# 파일명: crawl_run.py
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text, func
+from app.models.json_type import JSONType
+from app.core.database import Base
+
+
+# 크롤러 실행 1회의 기록 (크롤러가 시작 시 running으로 만들고 종료 시 결과를 채움)
+# 단계별 소요 시간과 건수를 남겨 크롤링이 느려지거나 카드가 누락되는 회귀를 추적합니다.
+class CrawlRunORM(Base):
+    __tablename__ = "crawl_runs"
+
+    # 실행 ID
+    run_id = Column(Integer, primary_key=True, index=True)
+
+    # 이번 크롤링의 데이터 세대 번호 (시작 시 예약, 실행마다 고유)
+    generation = Column(Integer, nullable=False)
+
+    # 상태 (running / succeeded / failed)
+    status = Column(String(20), nullable=False, default="running")
+
+    # 수집한 사이트 이름 목록 (예: ["jumpit"])
+    sources = Column(JSONType, nullable=True)
+
+    # 시작 / 종료 시각, 전체 소요 시간(초)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+
+    # 단계별 소요 시간(초) (예: {"fetch": 12.3, "parse": 0.4, "classify": 0.2, "upsert": 3.1, ...})
+    stage_seconds = Column(JSONType, nullable=True)
+
+    # 사이트별 건수 (예: {"jumpit": {"completed": 1, "cards_seen": 1200, ...}})
+    source_stats = Column(JSONType, nullable=True)
+
+    # 건수: 수집한 원본 카드 / 파싱 실패 / 이어받기로 건너뜀
+    cards_seen = Column(Integer, nullable=False, default=0)
+    parse_failures = Column(Integer, nullable=False, default=0)
+    skipped = Column(Integer, nullable=False, default=0)
+
+    # 건수: 신규 / 갱신 / 변경 없음 / 마감 / 중복 연결
+    inserted = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    unchanged = Column(Integer, nullable=False, default=0)
+    closed = Column(Integer, nullable=False, default=0)
+    duplicates = Column(Integer, nullable=False, default=0)
+
+    # 건수: 상세 페이지 새 본문 저장 / 변경 없음(304·같은 본문) / 실패
+    details_fetched = Column(Integer, nullable=False, default=0)
+    details_not_modified = Column(Integer, nullable=False, default=0)
+    details_failed = Column(Integer, nullable=False, default=0)
+
+    # 실패 시 오류 메시지
+    error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # 최근 실행 목록(상태 필터 + 최신순)용 인덱스
+        Index("ix_crawl_runs_status_id", "status", "run_id"),
+    )
@@ -0,0 +1,19 @@
+# 파일명: data_generation.py
+
+from sqlalchemy import Column, Integer, String, DateTime, func
+from app.core.database import Base
+
+
+# 크롤러가 데이터를 갱신할 때마다 증가시키는 "데이터 세대" 번호를 저장하는 ORM 모델입니다.
+# 백엔드 캐시는 이 값을 키에 포함하여, 세대가 바뀌면 자동으로 무효화됩니다.
+class DataGenerationORM(Base):
+    __tablename__ = "data_generations"
+
+    # 데이터셋 이름 (예: "jobs")
+    name = Column(String(50), primary_key=True)
+
+    # 세대 번호 (크롤링 완료 시마다 +1)
+    generation = Column(Integer, nullable=False, default=0)
+
+    # 마지막 갱신 시각
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,6 +1,7 @@
 # 파일명: job.py
 
-from sqlalchemy import Column, Integer, String, Text, Boolean
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text, Boolean, Index
+from sqlalchemy.sql import func
 from app.models.json_type import JSONType
 from app.core.database import Base
 
@@ -36,11 +37,44 @@ class JobORM(Base):
     # 직무분야 (ex: backend, frontend)
     job_type = Column(String, nullable=True)
 
+    # 수집한 채용 사이트 (크롤러 수집 플러그인 이름, 예: "jumpit")
+    source = Column(String(50), nullable=False, default="jumpit", server_default="jumpit")
+
     # 마감 여부 (True: 활성 공고, False: 마감된 공고)
     is_active = Column(Boolean, nullable=False, default=True)
 
-    # 최소 경력
+    # 최소 경력 (연 단위, 크롤러가 experience 텍스트를 파싱하여 저장)
     min_experience = Column(Integer, nullable=True)
 
-    # 최대 경력 
-    max_experience = Column(Integer, nullable=True)
\ No newline at end of file
+    # 최대 경력 (상한이 없으면 99)
+    max_experience = Column(Integer, nullable=True)
+
+    # 중복 공고(같은 회사의 재게시)일 경우 대표 공고 ID (대표 공고 자신은 NULL, 크롤러가 채움)
+    canonical_job_id = Column(
+        Integer, ForeignKey("jobs.job_post_id", ondelete="SET NULL"), nullable=True
+    )
+
+    # 공고 내용 해시 (크롤러가 계산, 값이 같으면 행을 다시 쓰지 않음)
+    content_hash = Column(String(32), nullable=True)
+
+    # 최초 수집 시각
+    first_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 마지막으로 크롤링에서 확인된 시각
+    last_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # 내용이 마지막으로 바뀐(신규/수정/마감/재오픈) 크롤링의 데이터 세대 번호
+    changed_generation = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # 기술 스택 포함 검색(@>)용 GIN 인덱스 (PostgreSQL JSONB 전용)
+        Index("ix_jobs_tech_stack_gin", "tech_stack", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        # 활성 공고 목록의 PK 순 페이징(offset / keyset)용 복합 인덱스
+        Index("ix_jobs_active_id", "is_active", "job_post_id"),
+        # 경력 범위 필터(min_experience / max_experience)용 복합 인덱스
+        Index("ix_jobs_active_experience", "is_active", "min_experience", "max_experience"),
+        # 변경분 조회(changed_generation > N)용 인덱스
+        Index("ix_jobs_changed_generation", "changed_generation", "job_post_id"),
+    )
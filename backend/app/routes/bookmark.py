@@ -1,8 +1,8 @@
 # 파일명: routes/bookmark.py
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.core.database import get_db  # 기존 SessionLocal → get_db로 대체
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db  # ✅ 비동기 세션 (이벤트 루프를 막지 않음)
 from app.schemas.bookmark import BookmarkCreate, BookmarkOut
 from app.services.bookmark_service import (
     add_bookmark,
@@ -17,29 +17,29 @@ router = APIRouter()  # ✅ prefix, tags는 main.py에서 명시한다고 하셨
 
 # ✅ 북마크 추가 (POST)
 @router.post("/", response_model=BookmarkOut)
-def create_bookmark(
+async def create_bookmark(
     bookmark_data: BookmarkCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserORM = Depends(get_current_user),
 ):
-    return add_bookmark(db, current_user.user_id, bookmark_data.job_post_id)
+    return await add_bookmark(db, current_user.user_id, bookmark_data.job_post_id)
 
 
 # ✅ 북마크 삭제 (DELETE)
 @router.delete("/{job_post_id}")
-def delete_bookmark(
+async def delete_bookmark(
     job_post_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserORM = Depends(get_current_user),
 ):
-    remove_bookmark(db, current_user.user_id, job_post_id)
+    await remove_bookmark(db, current_user.user_id, job_post_id)
     return {"detail": "북마크 삭제 완료"}
 
 
 # ✅ 북마크 목록 조회 (GET)
 @router.get("/", response_model=list[BookmarkOut])
-def read_bookmarks(
-    db: Session = Depends(get_db),
+async def read_bookmarks(
+    db: AsyncSession = Depends(get_async_db),
     current_user: UserORM = Depends(get_current_user),
 ):
-    return get_user_bookmarks(db, current_user.user_id)
+    return await get_user_bookmarks(db, current_user.user_id)
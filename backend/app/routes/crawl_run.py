@@ -0,0 +1,38 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_async_db
+from app.schemas.crawl_run import CrawlRunListResponse, CrawlRunOut
+from app.services import crawl_run_service
+from app.services.crawl_run_service import MAX_RUN_LIMIT
+
+router = APIRouter()
+
+RunStatus = Literal["running", "succeeded", "failed"]
+
+
+# ✅ 최근 크롤링 실행 목록 (단계별 소요 시간 + 건수 → 모니터링용)
+@router.get("/", response_model=CrawlRunListResponse, summary="최근 크롤링 실행 기록 조회")
+async def list_crawl_runs(
+    limit: int = Query(20, ge=1, le=MAX_RUN_LIMIT),
+    status: Optional[RunStatus] = Query(None, description="running / succeeded / failed"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await crawl_run_service.list_crawl_runs(db, limit, status)
+
+
+# ✅ 가장 최근 크롤링 실행
+@router.get("/latest", response_model=CrawlRunOut, summary="가장 최근 크롤링 실행 기록 조회")
+async def get_latest_crawl_run(
+    status: Optional[RunStatus] = Query(None, description="running / succeeded / failed"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await crawl_run_service.get_latest_crawl_run(db, status)
+
+
+# ✅ 크롤링 실행 1건
+@router.get("/{run_id}", response_model=CrawlRunOut, summary="크롤링 실행 기록 단건 조회")
+async def get_crawl_run(run_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await crawl_run_service.get_crawl_run(db, run_id)
@@ -1,34 +1,45 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, Path
+from fastapi import APIRouter, Depends, Query, HTTPException, Path, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Literal, Optional
 
 from app.schemas import job as job_schema
-from app.services import job_service
-from app.core.database import get_db
+from app.services import job_service, response_cache
+from app.core.database import get_async_db, get_db
 
 router = APIRouter(tags=["Jobs"])
 
 
 # ✅ 1. 채용공고 목록 조회 (페이징 + 필터)
 @router.get("/", response_model=job_schema.JobListResponse)
-def read_jobs(
+async def read_jobs(
+    request: Request,
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
+    q: Optional[str] = Query(None, max_length=100, description="제목/회사명 검색어 (관련도 순 정렬)"),
     location: Optional[str] = None,
     job_type: Optional[str] = None,
-    tech_stack: Optional[str] = None,
+    tech_stack: Optional[str] = Query(None, description="쉼표로 구분된 기술 목록 (예: Python,FastAPI)"),
+    tech_match: Literal["all", "any"] = Query("all", description="all: 모두 포함, any: 하나 이상 포함"),
     min_experience: Optional[int] = Query(None, ge=0),
     max_experience: Optional[int] = Query(None, ge=0),
     experience: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
+    include_total: bool = Query(True, description="false면 total_count 계산 생략"),
+    count_mode: Literal["exact", "estimated"] = Query(
+        "exact", description="estimated: PostgreSQL 통계 기반 추정치 허용"
+    ),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     채용공고 목록을 조회합니다.
-    - 페이징: page, size
+    - 페이징: page, size 또는 cursor (keyset)
     - 필터: location, job_type, tech_stack
+    - 검색: q (제목/회사명, 관련도 순)
+    - 응답은 데이터 세대(크롤링)가 바뀌기 전까지 캐시됨 (ETag / If-None-Match 지원)
     """
-    return job_service.get_jobs(
-        db=db,
+    params = dict(
         page=page,
         size=size,
         location=location,
@@ -37,34 +48,168 @@ def read_jobs(
         min_experience=min_experience,
         max_experience=max_experience,
         experience=experience,
+        tech_match=tech_match,
+        cursor=cursor,
+        include_total=include_total,
+        count_mode=count_mode,
+        q=q,
+    )
+    return await response_cache.cached_json_response(
+        request, db, "jobs:list", params,
+        lambda: job_service.get_jobs_json(db=db, **params),
+    )
+
+
+# ✅ 1-1. 패싯 조회 (직무/지역/기술 스택별 개수)
+# - "/{job_id}"보다 먼저 등록해야 경로가 충돌하지 않음
+@router.get("/facets", response_model=job_schema.JobFacetsResponse)
+async def read_job_facets(
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    tech_stack: Optional[str] = Query(None, description="쉼표로 구분된 기술 목록 (예: Python,FastAPI)"),
+    tech_match: Literal["all", "any"] = Query("all", description="all: 모두 포함, any: 하나 이상 포함"),
+    min_experience: Optional[int] = Query(None, ge=0),
+    max_experience: Optional[int] = Query(None, ge=0),
+    top_n: int = Query(20, ge=1, le=100, description="반환할 기술 스택 패싯 개수"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    현재 필터 조건에 해당하는 공고의 직무/지역/기술 스택별 개수를 한 번에 조회합니다.
+    - 필터 조건은 목록 조회(GET /jobs)와 동일
+    """
+    return await job_service.get_job_facets(
+        db=db,
+        location=location,
+        job_type=job_type,
+        tech_stack=tech_stack,
+        min_experience=min_experience,
+        max_experience=max_experience,
+        tech_match=tech_match,
+        top_n=top_n,
+    )
+
+
+# ✅ 1-2. 채용공고 일괄 조회 (예: /batch?ids=3,1,2)
+@router.get("/batch", response_model=job_schema.JobBatchResponse)
+async def read_jobs_batch(
+    request: Request,
+    ids: str = Query(..., description="쉼표로 구분된 공고 ID 목록 (최대 100개)"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    여러 채용공고를 한 번에 조회합니다.
+    - 요청한 ID 순서 유지, 없는 ID는 missing_ids로 반환
+    """
+    try:
+        job_ids = [int(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids는 쉼표로 구분된 정수여야 합니다.")
+    if not job_ids or len(job_ids) > 100:
+        raise HTTPException(status_code=400, detail="ids는 1개 이상 100개 이하로 지정해야 합니다.")
+
+    return await response_cache.cached_json_response(
+        request, db, "jobs:batch", {"ids": job_ids},
+        lambda: job_service.get_jobs_by_ids(db, job_ids),
+    )
+
+
+# ✅ 1-2-1. 크롤링 세대 N 이후 변경된 공고 조회 (예: /changes?since=41)
+@router.get("/changes", response_model=job_schema.JobChangesResponse)
+async def read_job_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="기준 데이터 세대 (이전 응답의 generation)"),
+    size: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    크롤링 세대 since 이후 신규/수정/마감/재오픈된 공고를 조회합니다. (마감된 공고는 is_active=false)
+    - 응답의 generation을 다음 요청의 since로 사용하면 변경분만 이어서 받을 수 있음
+    """
+    params = {"since": since, "size": size, "cursor": cursor}
+    return await response_cache.cached_json_response(
+        request, db, "jobs:changes", params,
+        lambda: job_service.get_job_changes(db, **params),
+    )
+
+
+# ✅ 1-3. 활성 채용공고 전체 내보내기 (NDJSON / CSV 스트리밍)
+@router.get("/export")
+def export_jobs(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    tech_stack: Optional[str] = Query(None, description="쉼표로 구분된 기술 목록 (예: Python,FastAPI)"),
+    tech_match: Literal["all", "any"] = Query("all", description="all: 모두 포함, any: 하나 이상 포함"),
+    min_experience: Optional[int] = Query(None, ge=0),
+    max_experience: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+):
+    """
+    필터 조건에 해당하는 활성 채용공고 전체를 스트리밍으로 내보냅니다.
+    - 페이지 단위 반복 조회 대신 분석용 일괄 수집에 사용
+    """
+    media_type = "text/csv; charset=utf-8" if export_format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        job_service.iter_jobs_export(
+            db,
+            export_format=export_format,
+            location=location,
+            job_type=job_type,
+            tech_stack=tech_stack,
+            min_experience=min_experience,
+            max_experience=max_experience,
+            tech_match=tech_match,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{export_format}"'},
     )
 
 
 # ✅ 2. 채용공고 단건 조회
 @router.get("/{job_id}", response_model=job_schema.JobOut)
-def read_job(
+async def read_job(
+    request: Request,
     job_id: int = Path(..., ge=1),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
-    특정 ID의 채용공고를 조회합니다.
+    특정 ID의 채용공고를 조회합니다. (데이터 세대별 캐시)
     """
-    job = job_service.get_job_by_id(db, job_id)
-    if not job:
+    async def build() -> Optional[job_schema.JobOut]:
+        job = await job_service.get_job_by_id(db, job_id)
+        if not job:
+            return None
+
+        # ✅ 명시적으로 Pydantic 스키마로 변환 (id 필드 매핑 포함)
+        return job_service.to_job_out(job)
+
+    response = await response_cache.cached_json_response(
+        request, db, "jobs:detail", {"job_id": job_id}, build
+    )
+    if response is None:
         raise HTTPException(status_code=404, detail="Job not found")
+    return response
 
-    # ✅ 명시적으로 Pydantic 스키마로 변환 (id 필드 매핑 포함)
-    return job_schema.JobOut(
-        id=job.job_post_id,
-        title=job.title,
-        company=job.company,
-        location=job.location,
-        tech_stack=job.tech_stack or [],
-        url=job.url,
-        due_date_text=job.due_date_text,
-        job_type=job.job_type,
-        experience=job.experience,
+
+# ✅ 2-1. 유사 채용공고 조회 (기술스택/제목 기준)
+@router.get("/{job_id}/similar", response_model=job_schema.SimilarJobsResponse)
+async def read_similar_jobs(
+    request: Request,
+    job_id: int = Path(..., ge=1),
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    특정 채용공고와 기술스택/제목이 비슷한 공고를 유사도 순으로 조회합니다. (데이터 세대별 캐시)
+    """
+    response = await response_cache.cached_json_response(
+        request, db, "jobs:similar", {"job_id": job_id, "limit": limit},
+        lambda: job_service.get_similar_jobs(db, job_id, limit),
     )
+    if response is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return response
 
 
 # ✅ 3. 채용공고 생성
@@ -1,15 +1,17 @@
 # 📄 backend/app/routes/resume.py
 
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.routes.auth_utils.jwt_utils import get_current_user
 from app.services.resume_service import extract_and_save_keywords, delete_resume_by_id
 from app.services.resume_analysis_service import analyze_resume_with_gpt
-from app.core.database import get_db
-from app.core.database import SessionLocal
+from app.services.resume_match_service import MAX_MATCH_LIMIT, get_resume_matches
+from app.core.database import get_async_db, get_db
 from app.models.resume import ResumeORM
 from app.models.user import UserORM
-from app.schemas.resume import ResumeOut
+from app.schemas.resume import ResumeMatchResponse, ResumeOut
 from typing import List
 import logging
 
@@ -38,34 +40,55 @@ async def upload_resume_and_extract_keywords(
 
 # ✅ 2. 내 이력서 목록 조회
 @router.get("/", response_model=List[ResumeOut])
-async def get_my_resumes(current_user: UserORM = Depends(get_current_user)):
+async def get_my_resumes(
+    current_user: UserORM = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     로그인한 사용자의 이력서 목록을 조회합니다.
     """
-    db: Session = SessionLocal()
-    resumes = db.query(ResumeORM).filter(ResumeORM.user_id == current_user.user_id).all()
-    db.close()
+    resumes = (await db.execute(
+        select(ResumeORM).where(ResumeORM.user_id == current_user.user_id)
+    )).scalars().all()
     return [ResumeOut.model_validate(r) for r in resumes]
 
 
 # ✅ 3. 특정 이력서 상세 조회
 @router.get("/{resume_id}", response_model=ResumeOut)
-async def get_resume_detail(resume_id: int, current_user: UserORM = Depends(get_current_user)):
+async def get_resume_detail(
+    resume_id: int,
+    current_user: UserORM = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
     """
     특정 이력서(resume_id)의 키워드 및 직무 분류 정보를 조회합니다.
     """
-    db: Session = SessionLocal()
-    resume = db.query(ResumeORM).filter(
-        ResumeORM.resume_id == resume_id,
-        ResumeORM.user_id == current_user.user_id
-    ).first()
-    db.close()
+    resume = (await db.execute(
+        select(ResumeORM).where(
+            ResumeORM.resume_id == resume_id,
+            ResumeORM.user_id == current_user.user_id
+        )
+    )).scalars().first()
 
     if not resume:
         raise HTTPException(status_code=404, detail="해당 이력서를 찾을 수 없습니다.")
     return ResumeOut.model_validate(resume)
 
 
+# ✅ 이력서 기반 추천 공고 조회
+@router.get("/{resume_id}/matches", response_model=ResumeMatchResponse)
+async def read_resume_matches(
+    resume_id: int,
+    limit: int = Query(20, ge=1, le=MAX_MATCH_LIMIT, description="추천 공고 최대 개수"),
+    current_user: UserORM = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    이력서 키워드와 기술스택이 잘 맞는 활성 채용공고를 점수 순으로 조회합니다.
+    """
+    return await get_resume_matches(db, resume_id, current_user.user_id, limit)
+
+
 # ✅ 4. 분석 엔드포인트
 @router.post("/{resume_id}/analysis")
 async def analyze_resume_api(
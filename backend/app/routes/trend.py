@@ -1,10 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, Path
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Any
 from datetime import datetime
 from pydantic import BaseModel
 
-from app.core.database import get_db
+from app.core.database import get_async_db
+from app.core.http_cache import is_not_modified, make_etag, not_modified_response
 from app.models.summary import TrendSummaryORM
 from app.models.tech_trend import TechTrendORM
 from app.models.market_trends import MarketTrendORM
@@ -31,19 +33,26 @@ class RoleTrendResponse(BaseModel):
     response_model=RoleTrendResponse,
     summary="직무별 트렌드 키워드 및 요약 조회"
 )
-def get_role_trends(
+async def get_role_trends(
+    request: Request,
     role: str = Path(..., examples={"example": {"value": "backend"}}),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    summary_obj = db.query(TrendSummaryORM).filter(
-        TrendSummaryORM.job_category == role
-    ).first()
+    # ✅ 같은 직무의 요약이 여러 개면 가장 최근 행(id 최대)을 사용
+    summary_obj = (await db.execute(
+        select(TrendSummaryORM)
+        .where(TrendSummaryORM.job_category == role)
+        .order_by(TrendSummaryORM.id.desc())
+        .limit(1)
+    )).scalars().first()
     if not summary_obj:
         raise HTTPException(status_code=404, detail=f"[{role}] 요약 정보가 없습니다.")
 
-    all_tech = db.query(TechTrendORM).filter(
-        TechTrendORM.job_category == role
-    ).order_by(TechTrendORM.percentage.desc()).all()
+    all_tech = (await db.execute(
+        select(TechTrendORM)
+        .where(TechTrendORM.job_category == role)
+        .order_by(TechTrendORM.percentage.desc())
+    )).scalars().all()
 
     tech_list = [
         TechnologyTrend(
@@ -65,12 +74,24 @@ def get_role_trends(
         for row in all_tech if row.top_percentage and row.top_percentage > 0
     ][:5]
 
-    return RoleTrendResponse(
+    response = RoleTrendResponse(
         role=role,
         technologies=tech_list,
         top_5=top_5,
         summary=summary_obj.summary
     )
+    # ✅ ETag: 직렬화된 응답 본문의 해시 (요약/기술 트렌드 행을 제자리에서 수정해도 바뀜, 같으면 304)
+    # - 트렌드 테이블에는 수정 시각 컬럼이 없어 행 ID/생성 시각만으로는 변경을 알 수 없음
+    content = response.model_dump_json()
+    etag = make_etag("trends:roles", role, content)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 # ✅ 마켓 트렌드 응답 스키마
@@ -88,8 +109,25 @@ class MarketTrendOut(BaseModel):
     response_model=MarketTrendOut,
     summary="직무별 마켓 트렌드 통계 조회"
 )
-def get_market_trend(role: str, db: Session = Depends(get_db)):
-    trend = db.query(MarketTrendORM).filter(MarketTrendORM.role == role).first()
+async def get_market_trend(request: Request, role: str, db: AsyncSession = Depends(get_async_db)):
+    # ✅ 같은 직무의 행이 여러 개면 가장 최근 행(trend_id 최대)을 사용
+    trend = (await db.execute(
+        select(MarketTrendORM)
+        .where(MarketTrendORM.role == role)
+        .order_by(MarketTrendORM.trend_id.desc())
+        .limit(1)
+    )).scalars().first()
     if not trend:
         raise HTTPException(status_code=404, detail="해당 직무의 마켓 트렌드 정보가 없습니다.")
-    return trend
+
+    # ✅ ETag: 직렬화된 응답 본문의 해시 (updated_at은 수정 시 갱신되지 않아 data 변경을 알 수 없음)
+    content = MarketTrendOut.model_validate(trend, from_attributes=True).model_dump_json()
+    etag = make_etag("trends:market", role, content)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+
+    return Response(
+        content=content,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
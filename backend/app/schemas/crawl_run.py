@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+# ✅ 크롤링 실행 1회 기록
+class CrawlRunOut(BaseModel):
+    run_id: int
+    generation: int  # 이번 크롤링의 데이터 세대 번호
+    status: str  # running / succeeded / failed
+    sources: Optional[List[str]] = None  # 수집한 사이트 이름 목록
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None  # 전체 소요 시간(초)
+    stage_seconds: Optional[Dict[str, float]] = None  # 단계별 소요 시간(초): fetch / parse / classify / upsert / close_out / dedup / details
+    source_stats: Optional[Dict[str, Dict[str, int]]] = None  # 사이트별 건수 (실행 중이면 None)
+    cards_seen: int  # 수집한 원본 카드 수
+    parse_failures: int  # 파싱 실패 수
+    skipped: int  # 이어받기로 건너뛴 수
+    inserted: int  # 신규
+    updated: int  # 갱신
+    unchanged: int  # 변경 없음
+    closed: int  # 마감 처리
+    duplicates: int  # 중복 공고로 연결
+    details_fetched: int  # 상세 페이지 새 본문 저장
+    details_not_modified: int  # 상세 페이지 변경 없음 (304 / 같은 본문)
+    details_failed: int  # 상세 페이지 요청·파싱 실패
+    error: Optional[str] = None  # 실패 시 오류 메시지
+
+    class Config:
+        from_attributes = True
+
+
+# ✅ 최근 실행 목록 응답 (최신순)
+class CrawlRunListResponse(BaseModel):
+    items: List[CrawlRunOut]
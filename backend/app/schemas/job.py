@@ -41,4 +41,52 @@ class JobOut(JobBase):
 # ✅ 공고 리스트 + 총 개수 응답용
 class JobListResponse(BaseModel):
     items: List[JobOut]  # 공고 리스트
-    total_count: int  # 전체 개수 (페이지네이션용)
+    total_count: Optional[int] = None  # 전체 개수 (include_total=false면 None)
+    count_estimated: bool = False  # total_count가 플래너 추정치인지 여부
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+# ✅ 여러 공고 일괄 조회 응답용
+class JobBatchResponse(BaseModel):
+    items: List[JobOut]  # 요청한 순서대로 정렬된 공고 리스트
+    missing_ids: List[int]  # 존재하지 않는 공고 ID
+
+
+# ✅ 패싯 항목 (값 + 개수)
+class FacetCount(BaseModel):
+    value: str  # 패싯 값 (예: "backend", "서울", "Python")
+    count: int  # 해당 값을 가진 공고 수
+
+
+# ✅ 패싯 조회 응답용 (직무/지역/기술 스택별 개수)
+class JobFacetsResponse(BaseModel):
+    total_count: int  # 필터 조건에 해당하는 전체 공고 수
+    job_type: List[FacetCount]  # 직무별 개수
+    location: List[FacetCount]  # 지역별 개수
+    tech_stack: List[FacetCount]  # 기술 스택별 개수 (상위 top_n)
+
+
+# ✅ 유사 공고 항목 (공고 + 유사도)
+class SimilarJob(BaseModel):
+    job: JobOut  # 유사 공고
+    similarity: float  # 기술스택/제목 토큰 기준 Jaccard 유사도 (0~1)
+
+
+# ✅ 유사 공고 조회 응답용
+class SimilarJobsResponse(BaseModel):
+    job_id: int  # 기준 공고 ID
+    items: List[SimilarJob]  # 유사도 순 정렬
+
+
+# ✅ 변경된 공고 항목 (마감된 공고 포함)
+class JobChange(JobOut):
+    is_active: bool  # False면 이번 변경이 마감 처리
+    changed_generation: int  # 내용이 바뀐 크롤링 세대 번호
+
+
+# ✅ 변경분 조회 응답용 ("크롤링 N 이후 바뀐 공고")
+class JobChangesResponse(BaseModel):
+    since: int  # 요청한 기준 세대
+    generation: int  # 현재 세대 (다음 요청의 since로 사용)
+    items: List[JobChange]  # job_post_id 순 정렬
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
@@ -2,6 +2,8 @@ from pydantic import BaseModel
 from typing import List, Optional, Any  # ✅ Optional 추가
 from datetime import datetime
 
+from app.schemas.job import JobOut
+
 # ✅ 이력서 조회 응답 스키마 (Pydantic v2 기준 + user_id 포함)
 class ResumeOut(BaseModel):
     resume_id: int                     # 이력서 ID
@@ -16,3 +18,16 @@ class ResumeOut(BaseModel):
     model_config = {
         "from_attributes": True        # ✅ Pydantic v2 방식: ORM 객체 → 스키마 변환 허용
     }
+
+
+# ✅ 이력서 기반 추천 공고 1건 (공고 + 매칭 점수 + 일치 기술)
+class JobMatch(BaseModel):
+    job: JobOut                        # 추천 공고
+    score: float                       # 매칭 점수 (이력서 키워드 IDF 합 대비 비율, 0~1)
+    matched_keywords: List[str]        # 일치한 기술 (소문자 정규화)
+
+
+# ✅ 이력서 기반 추천 공고 목록 응답
+class ResumeMatchResponse(BaseModel):
+    resume_id: int
+    items: List[JobMatch]
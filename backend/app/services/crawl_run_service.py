@@ -0,0 +1,40 @@
+# 파일명: services/crawl_run_service.py
+
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.crawl_run import CrawlRunORM
+from app.schemas.crawl_run import CrawlRunListResponse, CrawlRunOut
+
+# ✅ 목록 조회 최대 개수
+MAX_RUN_LIMIT = 200
+
+
+# ✅ 최근 크롤링 실행 목록 (최신순)
+async def list_crawl_runs(db: AsyncSession, limit: int = 20, status: Optional[str] = None) -> CrawlRunListResponse:
+    query = select(CrawlRunORM)
+    if status:
+        query = query.where(CrawlRunORM.status == status)
+    runs = (await db.execute(
+        query.order_by(CrawlRunORM.run_id.desc()).limit(min(limit, MAX_RUN_LIMIT))
+    )).scalars().all()
+    return CrawlRunListResponse(items=[CrawlRunOut.model_validate(run) for run in runs])
+
+
+# ✅ 가장 최근 크롤링 실행 (status를 주면 해당 상태 중 최신)
+async def get_latest_crawl_run(db: AsyncSession, status: Optional[str] = None) -> CrawlRunOut:
+    runs = await list_crawl_runs(db, limit=1, status=status)
+    if not runs.items:
+        raise HTTPException(status_code=404, detail="크롤링 실행 기록이 없습니다.")
+    return runs.items[0]
+
+
+# ✅ 크롤링 실행 1건 조회
+async def get_crawl_run(db: AsyncSession, run_id: int) -> CrawlRunOut:
+    run = await db.get(CrawlRunORM, run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail="해당 크롤링 실행 기록을 찾을 수 없습니다.")
+    return CrawlRunOut.model_validate(run)
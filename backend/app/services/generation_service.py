@@ -0,0 +1,61 @@
+# 파일명: services/generation_service.py
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.crawl_run import CrawlRunORM
+from app.models.data_generation import DataGenerationORM
+
+
+# ✅ 현재 데이터 세대 번호 조회 (행이 없으면 0)
+def get_data_generation(db: Session, name: str = "jobs") -> int:
+    generation = (
+        db.query(DataGenerationORM.generation)
+        .filter(DataGenerationORM.name == name)
+        .scalar()
+    )
+    return generation or 0
+
+
+# ✅ 현재 데이터 세대 번호 조회 (async 라우트용)
+async def get_data_generation_async(db: AsyncSession, name: str = "jobs") -> int:
+    generation = await db.scalar(
+        select(DataGenerationORM.generation).where(DataGenerationORM.name == name)
+    )
+    return generation or 0
+
+
+# ✅ 변경 피드용 확정 세대 (이 값 이하의 changed_generation은 더 이상 바뀌지 않음)
+async def get_committed_generation_async(db: AsyncSession, name: str = "jobs") -> int:
+    """
+    현재 세대와 (진행 중인 크롤링이 예약한 가장 작은 세대 - 1) 중 작은 값을 반환합니다.
+    - 크롤링은 시작 시 세대를 예약하고 그 세대로 변경분을 기록하므로,
+      진행 중인 실행이 있으면 그 세대부터는 아직 공고가 추가될 수 있음
+    - 두 값을 한 쿼리(같은 스냅샷)에서 읽어야 예약 직후의 실행을 놓치지 않음
+    """
+    current = (
+        select(DataGenerationORM.generation)
+        .where(DataGenerationORM.name == name)
+        .scalar_subquery()
+    )
+    oldest_running = (
+        select(func.min(CrawlRunORM.generation))
+        .where(CrawlRunORM.status == "running")
+        .scalar_subquery()
+    )
+    generation, running = (await db.execute(select(current, oldest_running))).one()
+    generation = generation or 0
+    if running is not None:
+        generation = min(generation, running - 1)
+    return generation
+
+
+# ✅ 데이터 세대 번호 증가 (백엔드에서 직접 데이터를 수정한 경우 사용)
+def bump_data_generation(db: Session, name: str = "jobs") -> int:
+    row = db.query(DataGenerationORM).filter(DataGenerationORM.name == name).first()
+    if row is None:
+        row = DataGenerationORM(name=name, generation=0)
+        db.add(row)
+    row.generation += 1
+    db.commit()
+    return row.generation
@@ -1,16 +1,309 @@
+import asyncio
+import base64
+import csv
+import io
+import json
+from collections import Counter
+
+import orjson
+
+from fastapi import HTTPException
+from sqlalchemy import and_, exists, func, literal, literal_column, or_, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import Optional
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from typing import Iterator, List, Optional, Tuple, Union
+
+from app.core.cache import LRUCache
 
 # ✅ ORM: DB 테이블 매핑
 from app.models.job import JobORM
 
 # ✅ 스키마: Pydantic 데이터 모델
-from app.schemas.job import JobOut, JobListResponse
+from app.schemas.job import (
+    FacetCount,
+    JobBatchResponse,
+    JobChange,
+    JobChangesResponse,
+    JobFacetsResponse,
+    JobListResponse,
+    JobOut,
+    SimilarJob,
+    SimilarJobsResponse,
+)
 
+# ✅ 데이터 세대 (크롤링 시마다 증가 → 캐시 무효화 기준)
+from app.services.generation_service import (
+    get_committed_generation_async,
+    get_data_generation_async,
+)
 
-# ✅ 채용공고 목록 조회 서비스 (필터 + 페이징 + 총 개수 포함)
-def get_jobs(
-    db: Session,
+# ✅ 검색어(q) 처리용 인메모리 BM25 색인 (PostgreSQL 외 환경)
+from app.services.search_index import get_search_index
+
+# ✅ 유사 공고 조회용 MinHash LSH 색인
+from app.services.similar_index import get_similar_index, job_features
+
+
+# ✅ 필터별 전체 개수 캐시 (키: 데이터 세대 + 정규화된 필터 + count_mode)
+_count_cache = LRUCache(maxsize=1024)
+
+# ✅ 패싯 결과 캐시 (키: 데이터 세대 + 정규화된 필터 + top_n)
+_facet_cache = LRUCache(maxsize=256)
+
+# ✅ 추정치가 이보다 작으면 정확한 COUNT 사용 (작은 결과는 COUNT도 저렴하고 추정 오차가 큼)
+ESTIMATE_MIN_ROWS = 1000
+
+# ✅ BM25 검색 후보에 필터를 적용할 때 IN 조회 1회당 공고 수
+SEARCH_FILTER_CHUNK = 1000
+
+# ✅ 내보내기(export) 컬럼 및 배치 크기
+EXPORT_COLUMNS = (
+    "job_post_id", "title", "company", "location", "experience", "tech_stack",
+    "due_date_text", "url", "job_type", "min_experience", "max_experience",
+)
+EXPORT_BATCH_SIZE = 1000
+
+
+# ✅ 커서 인코딩/디코딩 (클라이언트에는 불투명한 문자열로 노출)
+def _encode_cursor(last_job_id: int) -> str:
+    raw = json.dumps({"id": last_job_id}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서 값입니다.")
+
+
+# ✅ 쉼표로 구분된 쿼리 파라미터 → 리스트 ("Python, FastAPI" → ["Python", "FastAPI"])
+def _split_csv(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# ✅ 기술 스택 포함 조건 생성 (정확히 일치하는 원소 기준)
+def _tech_stack_filter(db: Union[Session, AsyncSession], techs: List[str], match: str = "all"):
+    """
+    tech_stack 배열에 주어진 기술이 포함된 공고만 남기는 조건을 만듭니다.
+    - PostgreSQL: JSONB @> 연산 (GIN 인덱스 사용)
+    - SQLite: json_each() 기반 EXISTS 서브쿼리
+    - match: "all"이면 모두 포함(AND), "any"면 하나 이상 포함(OR)
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        column = type_coerce(JobORM.tech_stack, JSONB)
+        if match == "any":
+            return or_(*[column.contains([tech]) for tech in techs])
+        return column.contains(techs)
+
+    def has_tech(*candidates: str):
+        elements = func.json_each(JobORM.tech_stack).table_valued("value")
+        return exists(select(1).select_from(elements).where(elements.c.value.in_(candidates)))
+
+    if match == "any":
+        return has_tech(*techs)
+    return and_(*[has_tech(tech) for tech in techs])
+
+
+# ✅ EXPLAIN (FORMAT JSON) 실행용 구문 (PostgreSQL 플래너 통계 기반 행 수 추정)
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _estimate_count(db: AsyncSession, statement: Select) -> Optional[int]:
+    """
+    PostgreSQL 플래너가 예상하는 결과 행 수를 반환합니다. (그 외 DB는 None)
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    plan = (await db.execute(_Explain(statement))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def _count_jobs(
+    db: AsyncSession, statement: Select, filter_key: tuple, count_mode: str = "exact"
+) -> Tuple[int, bool]:
+    """
+    필터 조건에 해당하는 전체 개수를 반환합니다. (개수, 추정치 여부)
+    - 결과는 데이터 세대별로 캐시되며, 크롤러가 세대를 올리면 자동으로 무효화됩니다.
+    - count_mode="estimated"이면 PostgreSQL 통계 기반 추정치를 우선 사용합니다.
+    """
+    cache_key = (await get_data_generation_async(db), filter_key, count_mode)
+    cached = _count_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    result = None
+    if count_mode == "estimated":
+        estimate = await _estimate_count(db, statement)
+        if estimate is not None and estimate >= ESTIMATE_MIN_ROWS:
+            result = (estimate, True)
+    if result is None:
+        count = await db.scalar(select(func.count()).select_from(statement.subquery()))
+        result = (count, False)
+
+    _count_cache.set(cache_key, result)
+    return result
+
+
+# ✅ ORM → 응답 스키마 변환 (id 필드 매핑 포함)
+def to_job_out(job: JobORM) -> JobOut:
+    return JobOut(
+        id=job.job_post_id,
+        title=job.title,
+        company=job.company,
+        location=job.location,
+        tech_stack=job.tech_stack or [],  # PostgreSQL JSONB는 이미 list
+        url=job.url,
+        due_date_text=job.due_date_text,
+        job_type=job.job_type,
+        experience=job.experience,
+    )
+
+
+# ✅ 검색어 기반 공고 조회 (관련도 순, offset 페이징)
+async def _search_jobs(
+    db: AsyncSession,
+    statement: Select,
+    q: str,
+    page: int,
+    size: int,
+    include_total: bool,
+    filter_key: tuple,
+) -> Tuple[List[JobORM], Optional[int]]:
+    """
+    제목/회사명 검색 결과를 관련도 순으로 반환합니다. (공고 목록, 전체 개수)
+    - PostgreSQL: pg_trgm word_similarity (ix_jobs_search_trgm GIN 인덱스 사용)
+    - 그 외: 인메모리 BM25 색인에서 후보(질의 토큰 대부분이 일치하는 공고)를 찾은 뒤,
+      관련도 순으로 SEARCH_FILTER_CHUNK건씩 필터를 적용 (전체 개수는 필터를 통과한 후보 기준)
+    """
+    offset = (page - 1) * size
+
+    if db.get_bind().dialect.name == "postgresql":
+        # 인덱스 표현식과 동일해야 함: (title || ' ' || company)
+        document = JobORM.title.op("||")(literal_column("' '")).op("||")(JobORM.company)
+        statement = statement.where(literal(q).op("<%")(document))
+        total_count = None
+        if include_total:
+            total_count, _ = await _count_jobs(db, statement, filter_key + (q,))
+        jobs = (
+            await db.execute(
+                statement.order_by(func.word_similarity(q, document).desc(), JobORM.job_post_id)
+                .offset(offset)
+                .limit(size)
+            )
+        ).all()
+        return jobs, total_count
+
+    index = await get_search_index(db)
+    ranked = await asyncio.to_thread(index.search, q, None)
+
+    # ✅ 관련도 순서를 유지하며 필터 통과 공고 ID 수집 (전체 개수가 필요 없으면 현재 페이지까지만)
+    filtered_ids: List[int] = []
+    id_statement = statement.with_only_columns(JobORM.job_post_id)
+    for start in range(0, len(ranked), SEARCH_FILTER_CHUNK):
+        chunk = [job_id for job_id, _ in ranked[start:start + SEARCH_FILTER_CHUNK]]
+        passed = set((await db.scalars(id_statement.where(JobORM.job_post_id.in_(chunk)))).all())
+        filtered_ids.extend(job_id for job_id in chunk if job_id in passed)
+        if not include_total and len(filtered_ids) >= offset + size:
+            break
+
+    page_ids = filtered_ids[offset:offset + size]
+    total_count = len(filtered_ids) if include_total else None
+    if not page_ids:
+        return [], total_count
+    rows = {row.job_post_id: row for row in (
+        await db.execute(statement.where(JobORM.job_post_id.in_(page_ids)))
+    ).all()}
+    return [rows[job_id] for job_id in page_ids if job_id in rows], total_count
+
+
+# ✅ 공통 필터 적용 (목록/개수/패싯 조회가 동일한 조건을 사용)
+def _apply_job_filters(
+    statement: Select,
+    db: Union[Session, AsyncSession],
+    location: Optional[str],
+    job_type: Optional[str],
+    techs: List[str],
+    tech_match: str,
+    min_experience: Optional[int],
+    max_experience: Optional[int],
+) -> Select:
+    statement = statement.where(JobORM.is_active == True)
+
+    # ✅ 중복 공고(재게시) 제외: 대표 공고만 노출
+    statement = statement.where(JobORM.canonical_job_id.is_(None))
+
+    # ✅ 기본 필터: job_type이 'other'가 아닌 것만
+    statement = statement.where(JobORM.job_type != "other")
+
+    # ✅ 필터 조건 처리 (부분 일치)
+    if location:
+        statement = statement.where(JobORM.location.ilike(f"%{location}%"))
+    if job_type:
+        statement = statement.where(JobORM.job_type == job_type)
+    if techs:
+        statement = statement.where(_tech_stack_filter(db, techs, tech_match))
+    if min_experience is not None:
+        statement = statement.where(JobORM.max_experience >= min_experience)
+    if max_experience is not None:
+        statement = statement.where(JobORM.min_experience <= max_experience)
+    return statement
+
+
+# ✅ 캐시 키용 정규화된 필터 튜플 (순서/대소문자 차이를 같은 조건으로 취급)
+def _filter_key(
+    location: Optional[str],
+    job_type: Optional[str],
+    techs: List[str],
+    tech_match: str,
+    min_experience: Optional[int],
+    max_experience: Optional[int],
+) -> tuple:
+    return (
+        (location or "").strip().lower(),
+        job_type,
+        tuple(sorted(techs)),
+        tech_match if len(techs) > 1 else "all",
+        min_experience,
+        max_experience,
+    )
+
+
+# ✅ 목록 응답에 필요한 컬럼만 조회 (ORM 엔티티 로딩 없이 튜플로 반환)
+_LIST_COLUMNS = (
+    JobORM.job_post_id,
+    JobORM.title,
+    JobORM.company,
+    JobORM.location,
+    JobORM.tech_stack,
+    JobORM.url,
+    JobORM.due_date_text,
+    JobORM.job_type,
+    JobORM.experience,
+)
+
+
+# ✅ 목록 페이지 조회 (필터 + 페이징 + 총 개수) → (행 목록, 전체 개수, 추정치 여부, 다음 커서)
+async def _fetch_job_page(
+    db: AsyncSession,
     page: int = 1,
     size: int = 20,
     location: Optional[str] = None,
@@ -18,61 +311,302 @@ def get_jobs(
     tech_stack: Optional[str] = None,
     min_experience: Optional[int] = None,
     max_experience: Optional[int] = None,
-    experience: Optional[str] = None
-) -> JobListResponse:
+    experience: Optional[str] = None,
+    tech_match: str = "all",
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    count_mode: str = "exact",
+    q: Optional[str] = None,
+) -> Tuple[list, Optional[int], bool, Optional[str]]:
+    techs = _split_csv(tech_stack)
+    statement = _apply_job_filters(
+        select(*_LIST_COLUMNS), db, location, job_type, techs, tech_match,
+        min_experience, max_experience,
+    )
+
+    filter_key = _filter_key(
+        location, job_type, techs, tech_match, min_experience, max_experience
+    )
+    total_count, count_estimated, next_cursor = None, False, None
+
+    q = (q or "").strip()
+    if q:
+        # ✅ 검색 모드: 관련도 순 정렬
+        jobs, total_count = await _search_jobs(
+            db, statement, q, page, size, include_total, filter_key
+        )
+    else:
+        # ✅ 전체 개수 계산 (필요한 경우에만, 정규화된 필터 기준 캐시)
+        if include_total:
+            total_count, count_estimated = await _count_jobs(db, statement, filter_key, count_mode)
+
+        # ✅ 페이징 처리: 커서가 있으면 PK 기준 keyset, 없으면 기존 offset
+        statement = statement.order_by(JobORM.job_post_id)
+        if cursor:
+            statement = statement.where(JobORM.job_post_id > _decode_cursor(cursor))
+        else:
+            statement = statement.offset((page - 1) * size)
+
+        # ✅ 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        jobs = (await db.execute(statement.limit(size + 1))).all()
+        has_next = len(jobs) > size
+        jobs = jobs[:size]
+        next_cursor = _encode_cursor(jobs[-1].job_post_id) if has_next else None
+
+    return jobs, total_count, count_estimated, next_cursor
+
+
+# ✅ 채용공고 목록 조회 서비스 (필터 + 페이징 + 총 개수 포함)
+async def get_jobs(db: AsyncSession, **params) -> JobListResponse:
     """
     채용공고를 조회합니다.
-    - 필터링: location, job_type, tech_stack
-    - 페이징: page, size
-    - 반환: JobOut 목록 + 전체 개수
+    - 필터링: location, job_type, tech_stack (쉼표 구분, tech_match=all/any)
+    - 페이징: page, size (cursor가 주어지면 page 대신 keyset 페이징 사용)
+    - 반환: JobOut 목록 + 전체 개수(include_total=False면 생략) + next_cursor
+    - 전체 개수: 데이터 세대별 캐시, count_mode="estimated"면 플래너 추정치 허용
+    - 검색: q가 주어지면 제목/회사명 관련도 순 정렬 (offset 페이징, next_cursor 없음)
     """
+    jobs, total_count, count_estimated, next_cursor = await _fetch_job_page(db, **params)
 
-    query = db.query(JobORM).filter(JobORM.is_active == True)
+    # ✅ Pydantic 응답 스키마에 맞게 반환
+    return JobListResponse(
+        items=[to_job_out(job) for job in jobs],
+        total_count=total_count,
+        count_estimated=count_estimated,
+        next_cursor=next_cursor,
+    )
 
-    # ✅ 기본 필터: job_type이 'other'가 아닌 것만
-    query = query.filter(JobORM.job_type != "other")
 
-    # ✅ 필터 조건 처리 (부분 일치)
-    if location:
-        query = query.filter(JobORM.location.ilike(f"%{location}%"))
-    if job_type:
-        query = query.filter(JobORM.job_type == job_type)
-    if tech_stack:
-        query = query.filter(JobORM.tech_stack.cast(String).ilike(f"%{tech_stack}%"))
-    if min_experience is not None:
-        query = query.filter(JobORM.max_experience >= min_experience)
-    if max_experience is not None:
-        query = query.filter(JobORM.min_experience <= max_experience)
-
-
-    total_count = query.count()  # 전체 개수 계산
-
-    # ✅ 페이징 처리
-    jobs = query.offset((page - 1) * size).limit(size).all()
-
-    # ✅ 결과 변환: ORM → Pydantic 스키마
-    job_items = [
-        JobOut(
-            id=job.job_post_id,  # <- 수정됨
-            title=job.title,
-            company=job.company,
-            location=job.location,
-            tech_stack=job.tech_stack or [],  # PostgreSQL JSONB는 이미 list
-            url=job.url,
-            due_date_text=job.due_date_text,
-            job_type=job.job_type,
-            experience=job.experience,
-        )
+# ✅ 채용공고 목록 조회 (JSON bytes 직렬화 fast path)
+async def get_jobs_json(db: AsyncSession, **params) -> bytes:
+    """
+    get_jobs와 같은 결과를 Pydantic 모델 생성/검증 없이 바로 JSON bytes로 직렬화합니다.
+    - 필드 순서와 구조는 JobListResponse와 동일
+    - 페이지 최대 100건 → orjson으로 바로 직렬화 (스레드로 넘기지 않음)
+    """
+    jobs, total_count, count_estimated, next_cursor = await _fetch_job_page(db, **params)
+    items = [
+        {
+            "title": job.title,
+            "company": job.company,
+            "location": job.location,
+            "tech_stack": job.tech_stack or [],
+            "url": job.url,
+            "due_date_text": job.due_date_text,
+            "job_type": job.job_type,
+            "experience": job.experience,
+            "id": job.job_post_id,
+        }
         for job in jobs
     ]
+    return orjson.dumps({
+        "items": items,
+        "total_count": total_count,
+        "count_estimated": count_estimated,
+        "next_cursor": next_cursor,
+    })
+
+
+# ✅ 패싯 집계 (한 번의 순회로 직무/지역/기술 스택별 개수 계산)
+def _aggregate_facets(rows: list, top_n: int) -> JobFacetsResponse:
+    job_types, locations, tech_counts = Counter(), Counter(), Counter()
+    for row_job_type, row_location, row_tech_stack in rows:
+        job_types[row_job_type or "미상"] += 1
+        locations[row_location or "미상"] += 1
+        tech_counts.update(set(row_tech_stack or []))
+
+    def to_facets(counter: Counter, limit: Optional[int] = None) -> List[FacetCount]:
+        return [FacetCount(value=value, count=count) for value, count in counter.most_common(limit)]
+
+    return JobFacetsResponse(
+        total_count=len(rows),
+        job_type=to_facets(job_types),
+        location=to_facets(locations),
+        tech_stack=to_facets(tech_counts, top_n),
+    )
+
+
+# ✅ 패싯(직무/지역/기술 스택별 개수) 조회 서비스
+async def get_job_facets(
+    db: AsyncSession,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    tech_stack: Optional[str] = None,
+    min_experience: Optional[int] = None,
+    max_experience: Optional[int] = None,
+    tech_match: str = "all",
+    top_n: int = 20,
+) -> JobFacetsResponse:
+    """
+    현재 필터 조건(get_jobs와 동일)에 해당하는 공고의 패싯별 개수를 조회합니다.
+    - 필요한 컬럼만 한 번 조회하고, 집계는 스레드에서 한 번의 순회로 처리
+    - 기술 스택은 상위 top_n개만 반환
+    - 결과는 데이터 세대 + 필터 조건별로 캐시
+    """
+    techs = _split_csv(tech_stack)
+    cache_key = (
+        await get_data_generation_async(db),
+        _filter_key(location, job_type, techs, tech_match, min_experience, max_experience),
+        top_n,
+    )
+    cached = _facet_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    statement = _apply_job_filters(
+        select(JobORM.job_type, JobORM.location, JobORM.tech_stack),
+        db, location, job_type, techs, tech_match, min_experience, max_experience,
+    )
+    rows = (await db.execute(statement)).all()
+    result = await asyncio.to_thread(_aggregate_facets, rows, top_n)
+    _facet_cache.set(cache_key, result)
+    return result
 
-    # ✅ Pydantic 응답 스키마에 맞게 반환
-    return JobListResponse(items=job_items, total_count=total_count)
 
 # ✅ 단일 채용공고 조회 함수 추가
-def get_job_by_id(db: Session, job_id: int) -> Optional[JobORM]:
+async def get_job_by_id(db: AsyncSession, job_id: int) -> Optional[JobORM]:
     """
     특정 ID에 해당하는 채용공고 1건을 조회합니다.
     """
-    return db.query(JobORM).filter(JobORM.job_post_id == job_id).first()
+    return await db.get(JobORM, job_id)
+
+
+# ✅ 여러 채용공고 일괄 조회 (북마크 목록 등 N+1 요청 방지)
+async def get_jobs_by_ids(db: AsyncSession, job_ids: List[int]) -> JobBatchResponse:
+    """
+    주어진 ID 목록의 채용공고를 IN 쿼리 한 번으로 조회합니다.
+    - 요청한 순서대로 반환 (중복 ID는 한 번만)
+    - 존재하지 않는 ID는 missing_ids로 반환
+    """
+    unique_ids = list(dict.fromkeys(job_ids))
+    jobs = (
+        (await db.scalars(select(JobORM).where(JobORM.job_post_id.in_(unique_ids)))).all()
+        if unique_ids else []
+    )
+    by_id = {job.job_post_id: job for job in jobs}
+    return JobBatchResponse(
+        items=[to_job_out(by_id[job_id]) for job_id in unique_ids if job_id in by_id],
+        missing_ids=[job_id for job_id in unique_ids if job_id not in by_id],
+    )
+
+
+# ✅ 유사 채용공고 조회 (MinHash LSH)
+async def get_similar_jobs(db: AsyncSession, job_id: int, limit: int = 10) -> Optional[SimilarJobsResponse]:
+    """
+    기술스택/제목이 비슷한 활성 채용공고를 유사도 순으로 조회합니다.
+    - 기준 공고가 없으면 None (마감된 공고도 기준으로 사용 가능)
+    """
+    job = (
+        await db.execute(
+            select(JobORM.title, JobORM.tech_stack).where(JobORM.job_post_id == job_id)
+        )
+    ).first()
+    if job is None:
+        return None
+
+    index = await get_similar_index(db)
+    matches = index.query(job_features(job.title, job.tech_stack), limit, exclude=job_id)
+    match_ids = [match_id for match_id, _ in matches]
+    jobs = (
+        (await db.scalars(select(JobORM).where(JobORM.job_post_id.in_(match_ids)))).all()
+        if match_ids else []
+    )
+    by_id = {row.job_post_id: row for row in jobs}
+    return SimilarJobsResponse(
+        job_id=job_id,
+        items=[
+            SimilarJob(job=to_job_out(by_id[match_id]), similarity=round(similarity, 4))
+            for match_id, similarity in matches
+            if match_id in by_id
+        ],
+    )
+
+
+# ✅ 크롤링 세대 N 이후 변경된 공고 조회 (증분 동기화용)
+async def get_job_changes(
+    db: AsyncSession, since: int, size: int = 100, cursor: Optional[str] = None
+) -> JobChangesResponse:
+    """
+    changed_generation이 since보다 큰(= 크롤링 since 이후 신규/수정/마감/재오픈된) 공고를 조회합니다.
+    - 확정된 세대(진행 중인 크롤링이 예약한 세대 직전)까지만 제공 → 응답의 generation을 다음 since로
+      사용해도 동시에 실행 중인 크롤링의 변경분을 놓치지 않음
+    - job_post_id 기준 keyset 페이징 (cursor)
+    """
+    generation = await get_committed_generation_async(db)
+    statement = select(JobORM).where(
+        JobORM.changed_generation > since,
+        JobORM.changed_generation <= generation,
+    )
+    if cursor:
+        statement = statement.where(JobORM.job_post_id > _decode_cursor(cursor))
+
+    jobs = (await db.scalars(statement.order_by(JobORM.job_post_id).limit(size + 1))).all()
+    has_next = len(jobs) > size
+    jobs = jobs[:size]
+    return JobChangesResponse(
+        since=since,
+        generation=generation,
+        items=[
+            JobChange(
+                **to_job_out(job).model_dump(),
+                is_active=job.is_active,
+                changed_generation=job.changed_generation,
+            )
+            for job in jobs
+        ],
+        next_cursor=_encode_cursor(jobs[-1].job_post_id) if has_next else None,
+    )
+
+
+# ✅ 활성 채용공고 스트리밍 내보내기 (NDJSON / CSV)
+def iter_jobs_export(
+    db: Session,
+    export_format: str = "ndjson",
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    tech_stack: Optional[str] = None,
+    min_experience: Optional[int] = None,
+    max_experience: Optional[int] = None,
+    tech_match: str = "all",
+) -> Iterator[str]:
+    """
+    필터 조건(get_jobs와 동일)에 해당하는 공고를 서버 측 커서로 EXPORT_BATCH_SIZE씩 읽어
+    NDJSON 또는 CSV 텍스트 조각으로 내보냅니다. 전체 건수와 관계없이 메모리 사용량이 일정합니다.
+    - 스트리밍 도중 요청 세션이 닫혀도 되도록 같은 엔진에 별도 세션을 엽니다.
+    """
+    techs = _split_csv(tech_stack)
+    with Session(bind=db.get_bind()) as session:
+        statement = _apply_job_filters(
+            select(*[getattr(JobORM, column) for column in EXPORT_COLUMNS]),
+            session, location, job_type, techs, tech_match, min_experience, max_experience,
+        )
+        rows = session.execute(
+            statement.order_by(JobORM.job_post_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+
+        if export_format == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            buffer.write("\ufeff")  # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+            writer.writerow(EXPORT_COLUMNS)
+            for count, row in enumerate(rows, start=1):
+                record = dict(zip(EXPORT_COLUMNS, row))
+                record["tech_stack"] = json.dumps(record["tech_stack"] or [], ensure_ascii=False)
+                writer.writerow(record.values())
+                if count % EXPORT_BATCH_SIZE == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue()
+            return
 
+        lines = []
+        for row in rows:
+            record = dict(zip(EXPORT_COLUMNS, row))
+            record["tech_stack"] = record["tech_stack"] or []
+            lines.append(json.dumps(record, ensure_ascii=False))
+            if len(lines) >= EXPORT_BATCH_SIZE:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
@@ -0,0 +1,69 @@
+# 파일명: services/response_cache.py
+
+import hashlib
+import json
+from typing import Awaitable, Callable, Optional, Union
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_response_cache
+from app.core.http_cache import is_not_modified, make_etag, not_modified_response
+from app.services.generation_service import get_data_generation_async
+
+
+# ✅ 캐시 키 생성: 네임스페이스 + 데이터 세대 + 파라미터 해시
+def _cache_key(namespace: str, generation: int, params: dict) -> str:
+    digest = hashlib.sha1(
+        json.dumps(params, sort_keys=True, ensure_ascii=False, default=str).encode()
+    ).hexdigest()
+    return f"{namespace}:{generation}:{digest}"
+
+
+# ✅ 응답 생성 함수: Pydantic 모델 또는 이미 직렬화된 JSON bytes를 반환 (None이면 404)
+ResponseBuilder = Callable[[], Awaitable[Optional[Union[BaseModel, bytes]]]]
+
+
+# ✅ Read-through 캐시: 캐시에 있으면 JSON bytes 그대로, 없으면 생성 후 저장
+# - 캐시 조회/저장은 await (Redis 백엔드도 이벤트 루프를 막지 않음)
+async def _get_or_build(key: str, build: ResponseBuilder) -> Optional[bytes]:
+    cache = get_response_cache()
+    body = await cache.aget(key)
+    if body is not None:
+        return body
+
+    result = await build()
+    if result is None:
+        return None
+    body = result if isinstance(result, bytes) else result.model_dump_json().encode()
+    await cache.aset(key, body)
+    return body
+
+
+# ✅ 캐시 + ETag 응답: If-None-Match가 ETag와 일치하면 DB 조회/직렬화 없이 304
+async def cached_json_response(
+    request: Request,
+    db: AsyncSession,
+    namespace: str,
+    params: dict,
+    build: ResponseBuilder,
+) -> Optional[Response]:
+    """
+    ETag는 캐시 키(네임스페이스 + 데이터 세대 + 파라미터)에서 파생되므로,
+    크롤링으로 세대가 바뀌기 전까지 동일합니다.
+    - build()는 코루틴 함수 (캐시 미스일 때만 호출)
+    - build()가 None을 반환하면 None을 반환 (호출 측에서 404 처리)
+    - If-None-Match: * 는 리소스 존재를 확인한 뒤에만 304 (없는 공고는 404)
+    """
+    key = _cache_key(namespace, await get_data_generation_async(db), params)
+    etag = make_etag(key)
+    if is_not_modified(request, etag, match_any=False):
+        return not_modified_response(etag)
+
+    body = await _get_or_build(key, build)
+    if body is None:
+        return None
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -0,0 +1,52 @@
+# 파일명: services/resume_match_service.py
+
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import JobORM
+from app.models.resume import ResumeORM
+from app.schemas.resume import JobMatch, ResumeMatchResponse
+from app.services.job_service import to_job_out
+from app.services.tech_match_index import match_jobs
+
+# ✅ 추천 공고 최대 개수
+MAX_MATCH_LIMIT = 100
+
+
+# ✅ 이력서 키워드 기반 추천 공고 조회
+async def get_resume_matches(
+    db: AsyncSession, resume_id: int, user_id: int, limit: int = 20
+) -> ResumeMatchResponse:
+    """
+    이력서의 추출 키워드와 활성 공고의 기술스택을 IDF 가중 매칭하여 상위 공고를 반환합니다.
+    - 매칭은 크롤링마다 갱신되는 기술 역색인으로 수행 (요청마다 전체 공고를 스캔하지 않음)
+    """
+    resume = (await db.execute(
+        select(ResumeORM).where(
+            ResumeORM.resume_id == resume_id,
+            ResumeORM.user_id == user_id
+        )
+    )).scalars().first()
+    if not resume:
+        raise HTTPException(status_code=404, detail="해당 이력서를 찾을 수 없습니다.")
+
+    matches = await match_jobs(db, resume.extracted_keywords or [], limit)
+    if not matches:
+        return ResumeMatchResponse(resume_id=resume_id, items=[])
+
+    # ✅ 상위 공고만 한 번에 조회 (색인 갱신 사이에 마감된 공고는 제외)
+    jobs = (await db.execute(
+        select(JobORM).where(
+            JobORM.job_post_id.in_([job_id for job_id, _, _ in matches]),
+            JobORM.is_active == True
+        )
+    )).scalars().all()
+    jobs_by_id = {job.job_post_id: job for job in jobs}
+
+    items = [
+        JobMatch(job=to_job_out(jobs_by_id[job_id]), score=round(score, 4), matched_keywords=matched)
+        for job_id, score, matched in matches
+        if job_id in jobs_by_id
+    ]
+    return ResumeMatchResponse(resume_id=resume_id, items=items)
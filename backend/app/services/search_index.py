@@ -0,0 +1,143 @@
+# 파일명: services/search_index.py
+
+"""
+🔎 채용공고 제목/회사명 검색용 인메모리 BM25 역색인 (SQLite 등 pg_trgm이 없는 환경용)
+
+- 토큰화: 라틴 문자 기술 용어는 단어 단위("node.js", "c++"), 한글은 음절 바이그램("백엔드" → "백엔", "엔드")
+  → 띄어쓰기/조사 차이("백엔드개발자", "백엔드 개발자")에도 부분 일치 가능
+- 검색 시 질의 토큰의 MIN_TERM_COVERAGE 이상이 일치하는 문서만 반환
+  → "백엔드"(백엔, 엔드)가 "엔드"만 공유하는 "프론트엔드"와 일치하지 않도록
+- 색인은 데이터 세대(generation)별로 한 번만 생성하고, 세대가 바뀌면 다시 생성합니다.
+"""
+
+import asyncio
+import heapq
+import math
+import re
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import AsyncBuildLock
+from app.models.job import JobORM
+from app.services.generation_service import get_data_generation_async
+
+# ✅ 라틴 기술 용어: 영문/숫자로 시작하고 + # . 포함 허용 (예: c++, c#, node.js)
+_LATIN_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+# ✅ 한글 음절 연속 구간
+_HANGUL_RUN = re.compile(r"[가-힣]+")
+
+# ✅ 문서가 포함해야 하는 질의 토큰 비율 (올림)
+# - 2~4개 토큰이면 모두, 5개면 4개 일치 필요 ("백엔드개발자"의 "드개"처럼 띄어쓰기에 걸친 바이그램 1개는 허용)
+MIN_TERM_COVERAGE = 0.8
+
+
+# ✅ 한글 + 라틴 혼합 텍스트 토큰화
+def tokenize(text: Optional[str]) -> List[str]:
+    if not text:
+        return []
+    text = text.lower()
+    tokens = [token.rstrip(".") for token in _LATIN_TOKEN.findall(text)]
+    for run in _HANGUL_RUN.findall(text):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return [token for token in tokens if token]
+
+
+# ✅ BM25 역색인 (토큰 → [(문서 ID, 가중치)])
+# - 문서 길이 정규화까지 반영한 TF 가중치를 색인 시점에 미리 계산해 두고,
+#   검색 시에는 IDF만 곱해 누적합니다.
+class BM25Index:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, List[Tuple[int, float]]] = {}
+        self.idf: Dict[str, float] = {}
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, str]]) -> "BM25Index":
+        index = cls()
+        term_counts = [(doc_id, Counter(tokenize(text))) for doc_id, text in documents]
+        if not term_counts:
+            return index
+
+        total_docs = len(term_counts)
+        avg_doc_length = sum(sum(terms.values()) for _, terms in term_counts) / total_docs or 1.0
+        postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for doc_id, terms in term_counts:
+            norm = index.k1 * (1 - index.b + index.b * sum(terms.values()) / avg_doc_length)
+            for term, tf in terms.items():
+                postings[term].append((doc_id, tf * (index.k1 + 1) / (tf + norm)))
+
+        index.postings = dict(postings)
+        index.idf = {
+            term: math.log(1 + (total_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in index.postings.items()
+        }
+        return index
+
+    def search(
+        self, query: str, limit: Optional[int] = 1000, min_coverage: float = MIN_TERM_COVERAGE
+    ) -> List[Tuple[int, float]]:
+        """
+        질의와 관련도가 높은 순으로 (문서 ID, 점수)를 최대 limit개(None이면 전부) 반환합니다.
+        - 질의 토큰 중 min_coverage 비율 이상을 포함한 문서만 후보
+        """
+        terms = set(tokenize(query))
+        required = math.ceil(len(terms) * min_coverage)
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, int] = defaultdict(int)
+        for term in terms:
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for doc_id, weight in postings:
+                scores[doc_id] += idf * weight
+                matched[doc_id] += 1
+        candidates = [(doc_id, score) for doc_id, score in scores.items() if matched[doc_id] >= required]
+        if limit is None:
+            return sorted(candidates, key=itemgetter(1), reverse=True)
+        return heapq.nlargest(limit, candidates, key=itemgetter(1))
+
+
+# ✅ 데이터 세대별 색인 캐시
+_build_lock = AsyncBuildLock()
+_cached_index: Optional[Tuple[int, BM25Index]] = None
+
+
+async def get_search_index(db: AsyncSession) -> BM25Index:
+    """
+    현재 데이터 세대의 활성 공고 색인을 반환합니다. (세대가 바뀌었으면 재생성)
+    - 재생성은 한 요청만 수행하고, 동시에 들어온 요청은 기다렸다가 같은 색인을 사용 (single-flight)
+    - 토큰화/가중치 계산은 CPU 작업 → 스레드에서 실행해 이벤트 루프를 막지 않음
+    """
+    global _cached_index
+    generation = await get_data_generation_async(db)
+    cached = _cached_index
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    async with _build_lock():
+        cached = _cached_index
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        rows = (
+            await db.execute(
+                select(JobORM.job_post_id, JobORM.title, JobORM.company)
+                .where(JobORM.is_active == True)
+            )
+        ).all()
+        index = await asyncio.to_thread(
+            BM25Index.build,
+            [(job_id, f"{title or ''} {company or ''}") for job_id, title, company in rows],
+        )
+        _cached_index = (generation, index)
+    return index
@@ -0,0 +1,147 @@
+# 파일명: services/similar_index.py
+
+"""
+🧬 유사 채용공고 조회용 MinHash LSH 색인
+
+- 공고 특징 집합: 기술스택("t:python") + 제목 토큰("w:백엔", "w:node.js")
+- MinHash 서명(NUM_PERM개)을 BANDS개 밴드로 나눠 버킷팅 → 같은 버킷을 공유하는 공고만 후보로 비교
+  (밴드 16 × 행 4: Jaccard 약 0.5 이상이면 높은 확률로 후보에 포함)
+- 후보는 실제 Jaccard 유사도로 다시 정렬하며, 색인은 데이터 세대(크롤링)별로 한 번만 생성합니다.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import random
+from collections import defaultdict
+from operator import itemgetter
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import AsyncBuildLock
+from app.models.job import JobORM
+from app.services.generation_service import get_data_generation_async
+from app.services.search_index import tokenize
+
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# ✅ 고정 시드 순열 계수 (프로세스가 달라도 같은 서명 생성)
+_rng = random.Random(20261018)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)
+]
+
+
+# ✅ 공고 특징 집합 (기술스택 + 제목 토큰)
+def job_features(title: Optional[str], tech_stack: Optional[Iterable[str]]) -> FrozenSet[str]:
+    features = {f"w:{token}" for token in tokenize(title)}
+    if tech_stack and not isinstance(tech_stack, str):
+        features.update(f"t:{tech.strip().lower()}" for tech in tech_stack if tech and tech.strip())
+    return frozenset(features)
+
+
+def _feature_hashes(feature: str) -> Tuple[int, ...]:
+    base = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+    return tuple(((a * base + b) % _MERSENNE_PRIME) & _MAX_HASH for a, b in _PERMUTATIONS)
+
+
+class MinHashLSH:
+    def __init__(self):
+        self.buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        self.features: Dict[int, FrozenSet[str]] = {}
+        self._hash_cache: Dict[str, Tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def signature(self, features: FrozenSet[str]) -> Tuple[int, ...]:
+        # 특징별 해시 벡터는 공고 간에 재사용 (같은 기술/토큰이 반복되므로)
+        vectors = []
+        for feature in features:
+            hashes = self._hash_cache.get(feature)
+            if hashes is None:
+                hashes = self._hash_cache[feature] = _feature_hashes(feature)
+            vectors.append(hashes)
+        return tuple(map(min, zip(*vectors)))
+
+    @staticmethod
+    def _bands(signature: Sequence[int]):
+        for band in range(BANDS):
+            start = band * ROWS_PER_BAND
+            yield band, tuple(signature[start:start + ROWS_PER_BAND])
+
+    def add(self, job_id: int, features: FrozenSet[str]):
+        if not features:
+            return
+        self.features[job_id] = features
+        for key in self._bands(self.signature(features)):
+            self.buckets[key].append(job_id)
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, FrozenSet[str]]]) -> "MinHashLSH":
+        index = cls()
+        for job_id, features in documents:
+            index.add(job_id, features)
+        return index
+
+    def query(
+        self, features: FrozenSet[str], limit: int = 10, exclude: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        특징 집합과 유사한 공고를 Jaccard 유사도 순으로 (공고 ID, 유사도) 최대 limit개 반환합니다.
+        """
+        if not features:
+            return []
+        candidates = set()
+        for key in self._bands(self.signature(features)):
+            candidates.update(self.buckets.get(key, ()))
+        candidates.discard(exclude)
+
+        scored = []
+        for job_id in candidates:
+            other = self.features[job_id]
+            scored.append((job_id, len(features & other) / len(features | other)))
+        return heapq.nlargest(limit, scored, key=itemgetter(1))
+
+
+# ✅ 데이터 세대별 색인 캐시
+_build_lock = AsyncBuildLock()
+_cached_index: Optional[Tuple[int, MinHashLSH]] = None
+
+
+async def get_similar_index(db: AsyncSession) -> MinHashLSH:
+    """
+    현재 데이터 세대의 활성 공고 MinHash LSH 색인을 반환합니다. (세대가 바뀌었으면 재생성)
+    - 재생성은 한 요청만 수행 (single-flight), MinHash 서명 계산은 스레드에서 실행
+    """
+    global _cached_index
+    generation = await get_data_generation_async(db)
+    cached = _cached_index
+    if cached is not None and cached[0] == generation:
+        return cached[1]
+
+    async with _build_lock():
+        cached = _cached_index
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        rows = (
+            await db.execute(
+                select(JobORM.job_post_id, JobORM.title, JobORM.tech_stack)
+                .where(JobORM.is_active == True, JobORM.canonical_job_id.is_(None))
+            )
+        ).all()
+        index = await asyncio.to_thread(
+            lambda: MinHashLSH.build(
+                (job_id, job_features(title, tech_stack)) for job_id, title, tech_stack in rows
+            )
+        )
+        _cached_index = (generation, index)
+    return index
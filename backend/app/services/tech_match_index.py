@@ -0,0 +1,156 @@
+# 파일명: services/tech_match_index.py
+
+"""
+🧩 이력서 키워드 ↔ 채용공고 기술스택 매칭용 역색인 (기술 → 공고 ID 집합)
+
+- 점수: 이력서 키워드와 공고 기술스택의 교집합에 대해 IDF(활성 공고 기준)를 합산
+  → 흔한 기술(예: Git)보다 희소한 기술(예: Kafka) 일치에 더 높은 가중치
+- 색인은 데이터 세대(generation)가 바뀔 때만 갱신하며,
+  이전 스냅샷과 비교해 추가/변경/마감된 공고의 게시 목록만 증분 반영합니다.
+"""
+
+import asyncio
+import heapq
+import math
+from collections import defaultdict
+from threading import Lock
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import AsyncBuildLock
+from app.models.job import JobORM
+from app.services.generation_service import get_data_generation_async
+
+
+# ✅ 기술명 정규화 (대소문자/공백 차이 무시)
+def normalize_tech(name: Optional[str]) -> str:
+    return (name or "").strip().lower()
+
+
+def _tech_set(tech_stack: Optional[Iterable[str]]) -> FrozenSet[str]:
+    if not tech_stack or isinstance(tech_stack, str):
+        return frozenset()
+    return frozenset(term for term in map(normalize_tech, tech_stack) if term)
+
+
+# ✅ 기술 역색인 (기술 → 공고 ID 집합, 공고 ID → 기술 집합)
+class TechMatchIndex:
+    def __init__(self):
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.job_terms: Dict[int, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.job_terms)
+
+    def sync(self, snapshot: Dict[int, FrozenSet[str]]) -> Tuple[int, int]:
+        """
+        활성 공고 스냅샷(공고 ID → 기술 집합)과 비교해 달라진 공고만 색인에 반영합니다.
+        반환값: (추가/변경된 공고 수, 제거된 공고 수)
+        """
+        removed = [job_id for job_id in self.job_terms if job_id not in snapshot]
+        for job_id in removed:
+            self._remove(job_id)
+
+        changed = 0
+        for job_id, terms in snapshot.items():
+            if self.job_terms.get(job_id) == terms:
+                continue
+            self._remove(job_id)
+            for term in terms:
+                self.postings[term].add(job_id)
+            self.job_terms[job_id] = terms
+            changed += 1
+        return changed, len(removed)
+
+    def _remove(self, job_id: int):
+        for term in self.job_terms.pop(job_id, ()):
+            docs = self.postings.get(term)
+            if docs is None:
+                continue
+            docs.discard(job_id)
+            if not docs:
+                del self.postings[term]
+
+    def idf(self, term: str) -> float:
+        docs = self.postings.get(term)
+        if not docs:
+            return 0.0
+        return math.log(1 + len(self.job_terms) / len(docs))
+
+    def match(self, keywords: Iterable[str], limit: int = 20) -> List[Tuple[int, float, List[str]]]:
+        """
+        키워드와 겹치는 기술의 IDF 합이 큰 순으로 (공고 ID, 점수, 일치 기술)을 최대 limit개 반환합니다.
+        - 점수는 이력서 키워드 전체 IDF 합 대비 비율(0~1)
+        """
+        terms = {term for term in map(normalize_tech, keywords) if term in self.postings}
+        if not terms:
+            return []
+
+        weights = {term: self.idf(term) for term in terms}
+        total_weight = sum(weights.values()) or 1.0
+        scores: Dict[int, float] = defaultdict(float)
+        matched: Dict[int, List[str]] = defaultdict(list)
+        for term in sorted(terms):
+            for job_id in self.postings[term]:
+                scores[job_id] += weights[term]
+                matched[job_id].append(term)
+
+        # 점수 동률이면 최신 공고(ID 큰 순) 우선
+        top = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], item[0]))
+        return [(job_id, score / total_weight, matched[job_id]) for job_id, score in top]
+
+
+# ✅ 데이터 세대별 색인 캐시 (세대가 바뀌면 증분 갱신)
+# - _build_lock: 스냅샷 로딩/반영을 한 요청만 수행 (single-flight)
+# - _index_lock: 색인은 제자리에서 증분 갱신되므로, 스레드에서 실행되는 반영/매칭을 서로 보호
+_build_lock = AsyncBuildLock()
+_index_lock = Lock()
+_index = TechMatchIndex()
+_index_generation: Optional[int] = None
+
+
+def _sync_snapshot(rows: Sequence[Tuple[int, Optional[Iterable[str]]]]) -> Tuple[int, int]:
+    snapshot = {job_id: _tech_set(tech_stack) for job_id, tech_stack in rows}
+    with _index_lock:
+        return _index.sync(snapshot)
+
+
+def _match_locked(keywords: Iterable[str], limit: int) -> List[Tuple[int, float, List[str]]]:
+    with _index_lock:
+        return _index.match(keywords, limit)
+
+
+async def get_tech_match_index(db: AsyncSession) -> TechMatchIndex:
+    """
+    현재 데이터 세대가 반영된 기술 매칭 색인을 반환합니다.
+    - 세대가 바뀐 직후 동시 요청이 몰려도 스냅샷 로딩/반영은 한 번만 수행하고,
+      나머지 요청은 기다렸다가 갱신된 색인을 사용합니다. (스냅샷 변환/반영은 스레드에서 실행)
+    """
+    global _index_generation
+    generation = await get_data_generation_async(db)
+    if _index_generation == generation:
+        return _index
+
+    async with _build_lock():
+        if _index_generation != generation:
+            rows = (
+                await db.execute(
+                    select(JobORM.job_post_id, JobORM.tech_stack)
+                    .where(JobORM.is_active == True, JobORM.canonical_job_id.is_(None))
+                )
+            ).all()
+            await asyncio.to_thread(_sync_snapshot, rows)
+            _index_generation = generation
+    return _index
+
+
+async def match_jobs(
+    db: AsyncSession, keywords: Iterable[str], limit: int = 20
+) -> List[Tuple[int, float, List[str]]]:
+    """
+    키워드와 가장 잘 맞는 활성 공고를 (공고 ID, 점수, 일치 기술) 목록으로 반환합니다.
+    """
+    await get_tech_match_index(db)
+    return await asyncio.to_thread(_match_locked, list(keywords), limit)
@@ -0,0 +1,128 @@
+# 📄 scripts/bench_job_list.py
+#
+# 채용공고 목록 100건 페이지 직렬화 성능 비교 (p50 / p99)
+# - before: JobORM 엔티티 전체 로딩 → JobOut 생성 → response_model 재검증 후 직렬화
+# - after : 필요한 컬럼만 튜플로 조회 → orjson으로 바로 직렬화 (job_service.get_jobs_json)
+#
+# 사용법 (backend 디렉터리에서):
+#   python scripts/bench_job_list.py [공고 수] [반복 횟수]
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.job import JobORM
+from app.schemas.job import JobListResponse, JobOut
+from app.services import job_service
+
+TECHS = ["Python", "Java", "Spring", "FastAPI", "React", "TypeScript", "AWS", "Docker", "Kotlin"]
+PAGE_SIZE = 100
+
+
+def seed(session, total: int):
+    session.bulk_save_objects(
+        JobORM(
+            title=f"백엔드 서버 개발자 {i}",
+            company=f"회사{i % 500}",
+            location="서울 강남구",
+            experience="경력 3~5년",
+            min_experience=3,
+            max_experience=5,
+            tech_stack=[TECHS[(i + k) % len(TECHS)] for k in range(4)],
+            due_date_text="상시채용",
+            url=f"https://example.com/position/{i}",
+            job_type="backend",
+            is_active=True,
+        )
+        for i in range(total)
+    )
+    session.commit()
+
+
+def legacy_page(session) -> bytes:
+    jobs = (
+        session.query(JobORM)
+        .filter(JobORM.is_active == True, JobORM.job_type != "other")
+        .order_by(JobORM.job_post_id)
+        .limit(PAGE_SIZE)
+        .all()
+    )
+    response = JobListResponse(
+        items=[
+            JobOut(
+                id=job.job_post_id,
+                title=job.title,
+                company=job.company,
+                location=job.location,
+                tech_stack=job.tech_stack or [],
+                url=job.url,
+                due_date_text=job.due_date_text,
+                job_type=job.job_type,
+                experience=job.experience,
+            )
+            for job in jobs
+        ],
+    )
+    # FastAPI response_model 처리와 동일하게 한 번 더 검증 후 직렬화
+    return JobListResponse.model_validate(response.model_dump()).model_dump_json().encode()
+
+
+# ✅ get_jobs_json은 async 서비스 → 같은 이벤트 루프에서 AsyncSession으로 반복 실행
+def make_fast_page(async_session: AsyncSession, loop: asyncio.AbstractEventLoop):
+    def fast_page(session) -> bytes:
+        return loop.run_until_complete(
+            job_service.get_jobs_json(async_session, size=PAGE_SIZE, include_total=False)
+        )
+    return fast_page
+
+
+def measure(label: str, func, session, repeat: int):
+    for _ in range(10):  # warm-up
+        func(session)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(session)
+        samples.append((time.perf_counter() - start) * 1000)
+        session.expunge_all()
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    print(f"{label:<8} p50={p50:7.3f}ms  p99={p99:7.3f}ms")
+
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        seed(session, total)
+
+        loop = asyncio.new_event_loop()
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async_session = AsyncSession(bind=async_engine)
+
+        print(f"📊 공고 {total}건, {PAGE_SIZE}건 페이지, {repeat}회 반복")
+        measure("before", legacy_page, session, repeat)
+        measure("after", make_fast_page(async_session, loop), session, repeat)
+        loop.run_until_complete(async_session.close())
+        loop.run_until_complete(async_engine.dispose())
+        loop.close()
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
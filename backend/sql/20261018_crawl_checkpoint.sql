@@ -0,0 +1,10 @@
+--
+-- 크롤링 체크포인트: 이번 크롤링에서 이미 저장된 공고 URL
+-- (crawler/repository/save_jobs.py 가 배치 저장과 같은 트랜잭션으로 기록하고,
+--  마감 처리 후 비움 → 중단 후 재시작 시 이어서 진행)
+--
+
+CREATE TABLE IF NOT EXISTS public.crawl_checkpoint (
+    url character varying(1000) PRIMARY KEY,
+    saved_at timestamp with time zone NOT NULL DEFAULT now()
+);
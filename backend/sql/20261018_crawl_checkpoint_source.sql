@@ -0,0 +1,11 @@
+--
+-- 크롤링 체크포인트에 수집 사이트 기록
+-- - 사이트별 크롤링이 동시에 실행돼도 각자 자기 사이트의 체크포인트만 마감 처리/비움
+--   (crawler/repository/crawl_lock.py 가 사이트별로 한 번에 하나의 크롤링만 실행되도록 보장)
+--
+
+ALTER TABLE public.crawl_checkpoint
+    ADD COLUMN IF NOT EXISTS source character varying(50) NOT NULL DEFAULT 'jumpit';
+
+CREATE INDEX IF NOT EXISTS ix_crawl_checkpoint_source
+    ON public.crawl_checkpoint USING btree (source);
@@ -0,0 +1,29 @@
+--
+-- 크롤링 실행 기록: 실행마다 단계별 소요 시간 + 건수
+-- (crawler/repository/crawl_runs.py 가 시작 시 running 행을 만들고 종료 시 결과 기록,
+--  백엔드 GET /api/v1/crawl-runs 로 조회)
+--
+
+CREATE TABLE IF NOT EXISTS public.crawl_runs (
+    run_id serial PRIMARY KEY,
+    generation integer NOT NULL,
+    status character varying(20) NOT NULL DEFAULT 'running',
+    sources jsonb,
+    started_at timestamp with time zone DEFAULT now(),
+    finished_at timestamp with time zone,
+    duration_seconds double precision,
+    stage_seconds jsonb,
+    source_stats jsonb,
+    cards_seen integer NOT NULL DEFAULT 0,
+    parse_failures integer NOT NULL DEFAULT 0,
+    skipped integer NOT NULL DEFAULT 0,
+    inserted integer NOT NULL DEFAULT 0,
+    updated integer NOT NULL DEFAULT 0,
+    unchanged integer NOT NULL DEFAULT 0,
+    closed integer NOT NULL DEFAULT 0,
+    duplicates integer NOT NULL DEFAULT 0,
+    error text
+);
+
+CREATE INDEX IF NOT EXISTS ix_crawl_runs_status_id
+    ON public.crawl_runs USING btree (status, run_id);
@@ -0,0 +1,13 @@
+--
+-- 크롤링 데이터 세대 번호 테이블
+-- (크롤러가 저장/마감 처리 후 증가 → 백엔드 캐시 무효화 기준)
+--
+
+CREATE TABLE IF NOT EXISTS public.data_generations (
+    name character varying(50) PRIMARY KEY,
+    generation integer NOT NULL DEFAULT 0,
+    updated_at timestamp with time zone DEFAULT now()
+);
+
+INSERT INTO public.data_generations (name, generation) VALUES ('jobs', 0)
+ON CONFLICT (name) DO NOTHING;
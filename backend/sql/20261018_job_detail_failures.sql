@@ -0,0 +1,13 @@
+--
+-- 공고 상세 수집 실패 기록: 실패한 공고는 지수 백오프로 다음 시도 시각까지 상세 수집 대상에서 제외
+-- (crawler/repository/job_details.py 가 실패 시 기록, 수집에 성공하면 삭제)
+-- - 404 / 본문 추출 실패처럼 계속 실패하는 공고가 매 실행 대상 앞쪽을 차지해 뒤쪽 공고가 밀리는 것 방지
+--
+
+CREATE TABLE IF NOT EXISTS public.job_detail_failures (
+    job_post_id integer PRIMARY KEY REFERENCES public.jobs (job_post_id) ON DELETE CASCADE,
+    attempts integer NOT NULL DEFAULT 1,
+    last_error text,
+    failed_at timestamp with time zone NOT NULL DEFAULT now(),
+    next_attempt_at timestamp with time zone NOT NULL
+);
@@ -0,0 +1,24 @@
+--
+-- 공고 상세 본문: 크롤러 상세 수집 단계가 신규/변경된 공고의 상세 페이지 본문을 압축 저장
+-- - jobs 행을 좁게 유지(목록 조회/HOT 업데이트)하기 위해 별도 테이블로 분리
+-- - etag / last_modified: 다음 수집 때 조건부 요청(If-None-Match / If-Modified-Since)에 사용
+-- - body는 이미 zstd/gzip으로 압축 → TOAST 재압축 생략(STORAGE EXTERNAL)
+--
+
+CREATE TABLE IF NOT EXISTS public.job_details (
+    job_post_id integer PRIMARY KEY REFERENCES public.jobs (job_post_id) ON DELETE CASCADE,
+    body bytea NOT NULL,
+    encoding character varying(10) NOT NULL,
+    body_hash character varying(32) NOT NULL,
+    etag character varying(255),
+    last_modified character varying(64),
+    fetched_at timestamp with time zone NOT NULL DEFAULT now()
+);
+
+ALTER TABLE public.job_details ALTER COLUMN body SET STORAGE EXTERNAL;
+
+-- 크롤링 실행 기록에 상세 수집 건수 추가
+ALTER TABLE public.crawl_runs
+    ADD COLUMN IF NOT EXISTS details_fetched integer NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS details_not_modified integer NOT NULL DEFAULT 0,
+    ADD COLUMN IF NOT EXISTS details_failed integer NOT NULL DEFAULT 0;
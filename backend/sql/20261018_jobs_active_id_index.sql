@@ -0,0 +1,6 @@
+--
+-- 활성 공고 목록 PK 순 페이징(offset / keyset)용 복합 인덱스
+--
+
+CREATE INDEX IF NOT EXISTS ix_jobs_active_id
+    ON public.jobs USING btree (is_active, job_post_id);
@@ -0,0 +1,16 @@
+--
+-- 중복 공고(같은 회사의 재게시) → 대표 공고 연결
+-- (crawler/repository/dedup_jobs.py 가 크롤링마다 채움, 대표 공고 자신은 NULL)
+--
+
+ALTER TABLE public.jobs
+    ADD COLUMN IF NOT EXISTS canonical_job_id integer
+    REFERENCES public.jobs (job_post_id) ON DELETE SET NULL;
+
+CREATE INDEX IF NOT EXISTS ix_jobs_canonical_job_id
+    ON public.jobs USING btree (canonical_job_id)
+    WHERE canonical_job_id IS NOT NULL;
+
+-- 트렌드 집계 등에서 중복을 제외할 때 사용하는 뷰
+CREATE OR REPLACE VIEW public.canonical_jobs AS
+    SELECT * FROM public.jobs WHERE canonical_job_id IS NULL;
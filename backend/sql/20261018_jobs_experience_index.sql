@@ -0,0 +1,7 @@
+--
+-- 경력 범위 필터용 복합 인덱스
+-- (min_experience / max_experience 값은 crawler/backfill_experience.py 로 채움)
+--
+
+CREATE INDEX IF NOT EXISTS ix_jobs_active_experience
+    ON public.jobs USING btree (is_active, min_experience, max_experience);
@@ -0,0 +1,18 @@
+--
+-- 증분 크롤링: 공고 내용 해시 + 최초/마지막 수집 시각 + 변경 세대
+-- - 크롤러는 content_hash가 같은 공고를 다시 쓰지 않고 last_seen_at만 일괄 갱신
+-- - changed_generation > N 으로 "크롤링 N 이후 바뀐 공고" 조회 (GET /api/v1/jobs/changes?since=N)
+--
+
+ALTER TABLE public.jobs
+    ADD COLUMN IF NOT EXISTS content_hash character varying(32),
+    ADD COLUMN IF NOT EXISTS first_seen_at timestamp with time zone DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS last_seen_at timestamp with time zone DEFAULT now(),
+    ADD COLUMN IF NOT EXISTS changed_generation integer NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS ix_jobs_changed_generation
+    ON public.jobs USING btree (changed_generation, job_post_id);
+
+-- last_seen_at 갱신이 HOT 업데이트(인덱스 갱신 없음)로 처리되도록 페이지 여유 공간 확보
+-- (기존 페이지에는 VACUUM FULL 또는 pg_repack 후 적용)
+ALTER TABLE public.jobs SET (fillfactor = 90);
@@ -0,0 +1,9 @@
+--
+-- 채용공고 제목/회사명 검색용 trigram 인덱스
+-- (job_service._search_jobs 의 word_similarity 검색에서 사용, 표현식이 동일해야 함)
+--
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS ix_jobs_search_trgm
+    ON public.jobs USING gin (((title || ' ' || company)) gin_trgm_ops);
@@ -0,0 +1,8 @@
+--
+-- 다중 사이트 수집: 공고를 수집한 채용 사이트(크롤러 수집 플러그인 이름)
+-- - 기존 공고는 모두 Jumpit에서 수집됨
+-- - 크롤러는 끝까지 수집한 사이트의 공고만 마감 처리 (source = ANY(...))
+--
+
+ALTER TABLE public.jobs
+    ADD COLUMN IF NOT EXISTS source character varying(50) NOT NULL DEFAULT 'jumpit';
@@ -0,0 +1,6 @@
+--
+-- jobs.tech_stack 포함 검색(@>)용 GIN 인덱스
+-- (job_service._tech_stack_filter 에서 사용)
+--
+
+CREATE INDEX IF NOT EXISTS ix_jobs_tech_stack_gin ON public.jobs USING gin (tech_stack);
@@ -0,0 +1,13 @@
+--
+-- Selenium 크롤러가 저장한 중복 접두어 URL 정리
+-- (예: https://jumpit.saramin.co.krhttps://jumpit.saramin.co.kr/position/1 → https://jumpit.saramin.co.kr/position/1)
+-- 목록 API 수집(crawler/services/jumpit_api.py)과 같은 URL이어야 upsert / 마감 처리가 기존 공고와 맞물림
+--
+
+UPDATE public.jobs AS j
+SET url = substring(j.url FROM length('https://jumpit.saramin.co.kr') + 1)
+WHERE j.url LIKE 'https://jumpit.saramin.co.krhttps://%'
+  AND NOT EXISTS (
+      SELECT 1 FROM public.jobs AS clean
+      WHERE clean.url = substring(j.url FROM length('https://jumpit.saramin.co.kr') + 1)
+  );
@@ -1,10 +1,11 @@
 import os
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.models.job import Base  # JobORM 포함
-from app.core.database import get_db
+from app.core.database import get_async_db, get_db
 from app.main import app
 
 from fastapi.testclient import TestClient
@@ -14,6 +15,10 @@ TEST_DB_PATH = "tests/test.db"
 TEST_DATABASE_URL = f"sqlite:///./{TEST_DB_PATH}"
 engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+async_engine = create_async_engine(f"sqlite+aiosqlite:///./{TEST_DB_PATH}")
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 
 
 # ✅ DB 세션 오버라이드
@@ -25,7 +30,13 @@ def override_get_db():
         db.close()
 
 
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
 
 
 # ✅ 테이블 및 샘플 데이터 준비
@@ -45,19 +56,25 @@ def setup_database():
                 title="백엔드 개발자",
                 company="테스트회사",
                 location="서울",
-                tech_stack='["Python", "FastAPI"]',
+                tech_stack=["Python", "FastAPI"],
                 url="https://example.com/job1",
                 due_date_text="상시채용",
                 job_type="backend",
+                experience="신입-3년",
+                min_experience=0,
+                max_experience=3,
             ),
             JobORM(
                 title="프론트엔드 개발자",
                 company="테스트회사",
                 location="부산",
-                tech_stack='["React", "JavaScript"]',
+                tech_stack=["React", "JavaScript"],
                 url="https://example.com/job2",
                 due_date_text="채용시 마감",
                 job_type="frontend",
+                experience="경력 5년↑",
+                min_experience=5,
+                max_experience=99,
             ),
         ]
     )
@@ -75,3 +92,54 @@ def setup_database():
 @pytest.fixture
 def client():
     return TestClient(app)
+
+
+# ✅ 로그인 사용자(user_id=1) 고정 (JWT 없이 인증이 필요한 API 호출)
+@pytest.fixture
+def login_user():
+    from types import SimpleNamespace
+
+    from app.routes.auth_utils.jwt_utils import get_current_user
+
+    user = SimpleNamespace(user_id=1)
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user
+    app.dependency_overrides.pop(get_current_user)
+
+
+# ✅ 데이터 세대 증가 (크롤러가 저장을 마친 상황 → 응답 캐시 무효화), 새 세대 반환
+def bump_generation() -> int:
+    from app.services.generation_service import bump_data_generation
+
+    db = TestingSessionLocal()
+    try:
+        return bump_data_generation(db)
+    finally:
+        db.close()
+
+
+# ✅ 테스트 전용 행 추가 + 세대 증가 → 테스트 종료 시 삭제 + 세대 증가
+# - seed_rows(*rows, bump=True): 추가한 ORM 객체를 반환 (1개면 객체, 여러 개면 튜플 / ID 등 접근 가능)
+# - bump=False: 세대를 올리지 않음 (캐시가 유지되는지 확인할 때)
+@pytest.fixture
+def seed_rows():
+    from app.services.generation_service import bump_data_generation
+
+    db = TestingSessionLocal()
+    seeded = []
+
+    def seed(*rows, bump=True):
+        db.add_all(rows)
+        db.commit()
+        seeded.extend(rows)
+        if bump:
+            bump_data_generation(db)
+        return rows if len(rows) > 1 else rows[0]
+
+    yield seed
+
+    for row in reversed(seeded):
+        db.delete(row)
+    db.commit()
+    bump_data_generation(db)
+    db.close()
@@ -0,0 +1,18 @@
+# 📄 파일명: tests/test_bookmark.py
+
+
+def test_bookmark_add_list_delete(client, login_user):
+    created = client.post("/api/v1/bookmarks/", json={"job_post_id": 1})
+    assert created.status_code == 200
+    assert created.json()["job_post_id"] == 1
+    assert created.json()["created_at"]
+
+    # 같은 공고 중복 북마크 → 400
+    assert client.post("/api/v1/bookmarks/", json={"job_post_id": 1}).status_code == 400
+
+    listing = client.get("/api/v1/bookmarks/")
+    assert [item["job_post_id"] for item in listing.json()] == [1]
+
+    assert client.delete("/api/v1/bookmarks/1").status_code == 200
+    assert client.get("/api/v1/bookmarks/").json() == []
+    assert client.delete("/api/v1/bookmarks/1").status_code == 404
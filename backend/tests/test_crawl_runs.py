@@ -0,0 +1,64 @@
+# 📄 파일명: tests/test_crawl_runs.py
+
+import pytest
+
+from app.models.crawl_run import CrawlRunORM
+from tests.conftest import TestingSessionLocal
+
+
+# ✅ 크롤링 실행 기록 샘플 (테스트 종료 시 삭제)
+@pytest.fixture
+def crawl_runs():
+    db = TestingSessionLocal()
+    rows = [
+        CrawlRunORM(
+            generation=1,
+            status="succeeded",
+            sources=["jumpit"],
+            duration_seconds=42.0,
+            stage_seconds={"fetch": 30.5, "parse": 1.2, "classify": 0.8, "upsert": 6.0, "close_out": 0.3},
+            source_stats={"jumpit": {"completed": 1, "cards_seen": 1200, "emitted": 1195, "failed": 5}},
+            cards_seen=1200, parse_failures=5, inserted=100, updated=20, unchanged=1075, closed=12,
+            details_fetched=110, details_not_modified=10,
+        ),
+        CrawlRunORM(generation=2, status="failed", sources=["jumpit"], error="ConnectError()"),
+        CrawlRunORM(generation=3, status="running", sources=["jumpit"]),
+    ]
+    db.add_all(rows)
+    db.commit()
+    ids = [row.run_id for row in rows]
+    yield ids
+    for row in rows:
+        db.delete(row)
+    db.commit()
+    db.close()
+
+
+def test_list_crawl_runs_newest_first(client, crawl_runs):
+    response = client.get("/api/v1/crawl-runs/")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["run_id"] for item in items] == crawl_runs[::-1]
+    assert items[0]["stage_seconds"] is None  # 실행 중이면 아직 기록 없음
+
+    succeeded = client.get("/api/v1/crawl-runs/", params={"status": "succeeded"}).json()["items"]
+    assert [item["run_id"] for item in succeeded] == [crawl_runs[0]]
+    assert succeeded[0]["stage_seconds"]["fetch"] == 30.5
+    assert succeeded[0]["source_stats"]["jumpit"]["cards_seen"] == 1200
+    assert succeeded[0]["closed"] == 12
+    assert succeeded[0]["details_fetched"] == 110
+
+    assert client.get("/api/v1/crawl-runs/", params={"status": "unknown"}).status_code == 422
+
+
+def test_latest_and_single_crawl_run(client, crawl_runs):
+    latest = client.get("/api/v1/crawl-runs/latest", params={"status": "failed"})
+    assert latest.status_code == 200
+    assert latest.json()["run_id"] == crawl_runs[1]
+    assert latest.json()["error"] == "ConnectError()"
+
+    single = client.get(f"/api/v1/crawl-runs/{crawl_runs[0]}")
+    assert single.status_code == 200
+    assert single.json()["parse_failures"] == 5
+
+    assert client.get("/api/v1/crawl-runs/999999").status_code == 404
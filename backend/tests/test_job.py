@@ -1,7 +1,16 @@
 # 📄 파일명: tests/test_job.py
 
+import asyncio
+import csv
+import io
+import json
+
 import pytest
 
+from app.models.job import JobORM
+from app.services import job_service
+from tests.conftest import TestingAsyncSessionLocal, TestingSessionLocal, bump_generation
+
 
 # ✅ client fixture 사용
 def test_read_jobs_default(client):
@@ -28,6 +37,34 @@ def test_read_jobs_with_tech_stack(client):
     assert_job_response_structure(response.json())
 
 
+def test_read_jobs_tech_stack_exact_match(client):
+    # "Java"는 "JavaScript"와 일치하지 않아야 함
+    response = client.get("/api/v1/jobs", params={"tech_stack": "Java"})
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+def test_read_jobs_tech_stack_all_and_any(client):
+    both = client.get("/api/v1/jobs", params={"tech_stack": "Python,FastAPI"})
+    assert [job["title"] for job in both.json()["items"]] == ["백엔드 개발자"]
+
+    none = client.get("/api/v1/jobs", params={"tech_stack": "Python,React"})
+    assert none.json()["items"] == []
+
+    either = client.get(
+        "/api/v1/jobs", params={"tech_stack": "Python,React", "tech_match": "any"}
+    )
+    assert either.json()["total_count"] == 2
+
+
+def test_read_jobs_experience_range(client):
+    senior = client.get("/api/v1/jobs", params={"min_experience": 4})
+    assert [job["title"] for job in senior.json()["items"]] == ["프론트엔드 개발자"]
+
+    junior = client.get("/api/v1/jobs", params={"max_experience": 2})
+    assert [job["title"] for job in junior.json()["items"]] == ["백엔드 개발자"]
+
+
 def test_read_jobs_with_all_filters(client):
     response = client.get(
         "/api/v1/jobs",
@@ -43,6 +80,318 @@ def test_read_jobs_with_all_filters(client):
     assert_job_response_structure(response.json())
 
 
+def test_read_jobs_cursor_pagination(client):
+    first = client.get("/api/v1/jobs", params={"size": 1})
+    assert first.status_code == 200
+    first_data = first.json()
+    assert len(first_data["items"]) == 1
+    assert first_data["next_cursor"]
+
+    second = client.get(
+        "/api/v1/jobs", params={"size": 1, "cursor": first_data["next_cursor"]}
+    )
+    assert second.status_code == 200
+    second_data = second.json()
+    assert len(second_data["items"]) == 1
+    assert second_data["items"][0]["id"] > first_data["items"][0]["id"]
+    assert second_data["next_cursor"] is None
+
+
+def test_read_jobs_without_total(client):
+    response = client.get("/api/v1/jobs", params={"include_total": False})
+    assert response.status_code == 200
+    assert response.json()["total_count"] is None
+
+
+def test_read_jobs_invalid_cursor(client):
+    response = client.get("/api/v1/jobs", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_total_count_cached_until_generation_bump(client, seed_rows):
+    before = client.get("/api/v1/jobs").json()["total_count"]
+
+    seed_rows(
+        JobORM(
+            title="데이터 엔지니어",
+            company="테스트회사",
+            location="서울",
+            tech_stack=["Python"],
+            url="https://example.com/job-count-cache",
+            job_type="backend",
+        ),
+        bump=False,
+    )
+    # 세대가 그대로면 캐시된 개수를 반환
+    assert client.get("/api/v1/jobs").json()["total_count"] == before
+
+    # 크롤러가 세대를 올리면 캐시 무효화
+    bump_generation()
+    assert client.get("/api/v1/jobs").json()["total_count"] == before + 1
+
+
+def test_read_job_detail_cached_until_generation_bump(client):
+    db = TestingSessionLocal()
+    job = db.query(JobORM).filter(JobORM.url == "https://example.com/job1").first()
+    original_title = job.title
+
+    first = client.get(f"/api/v1/jobs/{job.job_post_id}")
+    assert first.status_code == 200
+    assert first.json()["title"] == original_title
+
+    job.title = "수정된 제목"
+    db.commit()
+    try:
+        # 세대가 그대로면 캐시된 응답을 반환
+        assert client.get(f"/api/v1/jobs/{job.job_post_id}").json()["title"] == original_title
+
+        bump_generation()
+        assert client.get(f"/api/v1/jobs/{job.job_post_id}").json()["title"] == "수정된 제목"
+    finally:
+        job.title = original_title
+        db.commit()
+        bump_generation()
+        db.close()
+
+
+def test_read_jobs_etag_not_modified(client):
+    first = client.get("/api/v1/jobs")
+    etag = first.headers["etag"]
+
+    second = client.get("/api/v1/jobs", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+
+    other_params = client.get(
+        "/api/v1/jobs", params={"job_type": "backend"}, headers={"If-None-Match": etag}
+    )
+    assert other_params.status_code == 200
+
+
+def test_if_none_match_wildcard_does_not_hide_missing_job(client):
+    assert client.get("/api/v1/jobs/999999", headers={"If-None-Match": "*"}).status_code == 404
+    assert client.get("/api/v1/jobs", headers={"If-None-Match": "*"}).status_code == 304
+
+
+def test_read_jobs_batch_preserves_order_and_reports_missing(client):
+    ids = [job["id"] for job in client.get("/api/v1/jobs").json()["items"]]
+    requested = [ids[1], 99999, ids[0]]
+
+    response = client.get(
+        "/api/v1/jobs/batch", params={"ids": ",".join(map(str, requested))}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [job["id"] for job in data["items"]] == [ids[1], ids[0]]
+    assert data["missing_ids"] == [99999]
+
+
+def test_read_jobs_batch_invalid_ids(client):
+    response = client.get("/api/v1/jobs/batch", params={"ids": "1,abc"})
+    assert response.status_code == 400
+
+
+def test_export_jobs_ndjson(client):
+    response = client.get("/api/v1/jobs/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert {record["title"] for record in records} == {"백엔드 개발자", "프론트엔드 개발자"}
+    assert records[0]["tech_stack"] == ["Python", "FastAPI"]
+
+
+def test_export_jobs_csv_with_filter(client):
+    response = client.get("/api/v1/jobs/export", params={"format": "csv", "job_type": "frontend"})
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text.lstrip("\ufeff"))))
+    assert [row["title"] for row in rows] == ["프론트엔드 개발자"]
+
+
+def test_get_jobs_json_matches_pydantic_response():
+    async def fetch():
+        async with TestingAsyncSessionLocal() as db:
+            return await job_service.get_jobs_json(db, size=10), await job_service.get_jobs(db, size=10)
+
+    fast, slow = asyncio.run(fetch())
+    assert json.loads(fast) == slow.model_dump()
+
+
+def test_read_job_not_found(client):
+    response = client.get("/api/v1/jobs/99999")
+    assert response.status_code == 404
+
+
+def test_read_jobs_estimated_count_falls_back_to_exact(client):
+    # SQLite에는 플래너 통계가 없으므로 정확한 개수를 반환
+    response = client.get("/api/v1/jobs", params={"count_mode": "estimated"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["count_estimated"] is False
+    assert data["total_count"] == 2
+
+
+def test_read_jobs_search_query(client):
+    response = client.get("/api/v1/jobs", params={"q": "백엔드개발자"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["items"][0]["title"] == "백엔드 개발자"
+    assert data["next_cursor"] is None
+
+
+def test_read_jobs_search_query_with_filter(client):
+    response = client.get("/api/v1/jobs", params={"q": "개발자", "location": "부산"})
+    assert response.status_code == 200
+    assert [job["title"] for job in response.json()["items"]] == ["프론트엔드 개발자"]
+    assert response.json()["total_count"] == 1
+
+
+def test_read_jobs_search_query_excludes_partial_matches(client):
+    response = client.get("/api/v1/jobs", params={"q": "백엔드"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [job["title"] for job in data["items"]] == ["백엔드 개발자"]
+    assert data["total_count"] == 1
+
+    paged = client.get("/api/v1/jobs", params={"q": "개발자", "size": 1, "page": 2, "include_total": "false"})
+    assert len(paged.json()["items"]) == 1
+
+
+def test_read_job_facets(client):
+    response = client.get("/api/v1/jobs/facets")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_count"] == 2
+    assert {f["value"]: f["count"] for f in data["job_type"]} == {"backend": 1, "frontend": 1}
+    assert {f["value"] for f in data["tech_stack"]} == {"Python", "FastAPI", "React", "JavaScript"}
+
+
+def test_read_job_facets_with_filters(client):
+    response = client.get("/api/v1/jobs/facets", params={"location": "서울"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_count"] == 1
+    assert data["location"] == [{"value": "서울", "count": 1}]
+
+
+def test_similar_jobs_returns_overlapping_postings(client, seed_rows):
+    similar = seed_rows(
+        JobORM(
+            title="백엔드 개발자 (Python)",
+            company="유사회사",
+            location="서울",
+            tech_stack=["Python", "FastAPI", "Docker"],
+            url="https://example.com/similar-backend",
+            due_date_text="상시채용",
+            job_type="backend",
+            experience="경력 1년↑",
+            min_experience=1,
+            max_experience=99,
+        )
+    )
+    base_id = job_id_by_url("https://example.com/job1")
+
+    response = client.get(f"/api/v1/jobs/{base_id}/similar")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert items[0]["job"]["id"] == similar.job_post_id
+    assert 0 < items[0]["similarity"] <= 1
+    assert base_id not in [item["job"]["id"] for item in items]
+
+    assert client.get("/api/v1/jobs/999999/similar").status_code == 404
+
+
+def test_duplicate_postings_are_collapsed_in_listing(client, seed_rows):
+    duplicate = seed_rows(
+        JobORM(
+            title="[급구] 백엔드 개발자",
+            company="테스트회사",
+            location="서울",
+            tech_stack=["Python", "FastAPI"],
+            url="https://example.com/job1-repost",
+            due_date_text="상시채용",
+            job_type="backend",
+            experience="신입-3년",
+            min_experience=0,
+            max_experience=3,
+            canonical_job_id=job_id_by_url("https://example.com/job1"),
+        )
+    )
+
+    listing = client.get("/api/v1/jobs/").json()
+    assert duplicate.job_post_id not in [item["id"] for item in listing["items"]]
+    assert listing["total_count"] == 2
+
+    facets = client.get("/api/v1/jobs/facets").json()
+    assert facets["total_count"] == 2
+
+    # 단건 조회는 중복 공고도 그대로 가능
+    assert client.get(f"/api/v1/jobs/{duplicate.job_post_id}").status_code == 200
+
+
+def test_job_changes_since_generation(client, seed_rows):
+    previous = bump_generation()
+    changed, pending = seed_rows(
+        changed_job("https://example.com/changes-1", previous + 1),
+        # 아직 확정되지 않은(진행 중인 크롤링) 세대의 변경분은 제외되어야 함
+        changed_job("https://example.com/changes-2", previous + 2),
+    )
+
+    response = client.get(f"/api/v1/jobs/changes?since={previous}")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["generation"] == previous + 1
+    assert [item["id"] for item in body["items"]] == [changed.job_post_id]
+    assert body["items"][0]["is_active"] is True
+
+    assert client.get(f"/api/v1/jobs/changes?since={previous + 1}").json()["items"] == []
+
+
+def test_job_changes_stop_before_running_crawl_generation(client, seed_rows):
+    from app.models.crawl_run import CrawlRunORM
+
+    committed = bump_generation()
+    # 진행 중인 크롤링이 세대를 예약하고, 그 뒤 다른 크롤링이 먼저 끝나 세대가 더 올라간 상황 (seed_rows의 세대 증가)
+    reserved = bump_generation()
+    running, done_job, pending_job = seed_rows(
+        CrawlRunORM(generation=reserved, status="running", sources=["jumpit"]),
+        changed_job("https://example.com/changes-done", committed),
+        changed_job("https://example.com/changes-pending", reserved),
+    )
+
+    body = client.get(f"/api/v1/jobs/changes?since={committed - 1}").json()
+    assert body["generation"] == committed
+    assert [item["id"] for item in body["items"]] == [done_job.job_post_id]
+
+    db = TestingSessionLocal()
+    db.query(CrawlRunORM).filter(CrawlRunORM.run_id == running.run_id).update({CrawlRunORM.status: "succeeded"})
+    db.commit()
+    db.close()
+    current = bump_generation()
+
+    body = client.get(f"/api/v1/jobs/changes?since={committed}").json()
+    assert body["generation"] == current
+    assert [item["id"] for item in body["items"]] == [pending_job.job_post_id]
+
+
+def job_id_by_url(url):
+    db = TestingSessionLocal()
+    try:
+        return db.query(JobORM.job_post_id).filter(JobORM.url == url).scalar()
+    finally:
+        db.close()
+
+
+def changed_job(url, generation):
+    return JobORM(
+        title="변경된 공고",
+        company="테스트회사",
+        location="서울",
+        tech_stack=["Python"],
+        url=url,
+        job_type="backend",
+        changed_generation=generation,
+    )
+
+
 # ✅ 공통 응답 구조 검증 함수
 def assert_job_response_structure(json_data):
     assert "items" in json_data
@@ -0,0 +1,99 @@
+# 📄 파일명: tests/test_resume_matches.py
+
+import asyncio
+
+from app.models.resume import ResumeORM
+from app.services import tech_match_index
+from app.services.tech_match_index import TechMatchIndex
+from tests.conftest import TestingAsyncSessionLocal, TestingSessionLocal
+
+
+def test_tech_match_index_prefers_rare_technologies():
+    index = TechMatchIndex()
+    index.sync(
+        {
+            1: frozenset({"git", "python"}),
+            2: frozenset({"git", "kafka"}),
+            3: frozenset({"git"}),
+        }
+    )
+    results = index.match(["Git", "Kafka"])
+    assert [job_id for job_id, _, _ in results][0] == 2
+    assert results[0][2] == ["git", "kafka"]
+    assert results[0][1] == 1.0
+
+
+def test_tech_match_index_sync_applies_only_changes():
+    index = TechMatchIndex()
+    index.sync({1: frozenset({"python"}), 2: frozenset({"react"})})
+
+    changed, removed = index.sync({1: frozenset({"python"}), 3: frozenset({"python", "django"})})
+    assert (changed, removed) == (1, 1)
+    assert "react" not in index.postings
+    assert index.postings["python"] == {1, 3}
+
+
+def test_concurrent_requests_sync_index_once(monkeypatch):
+    syncs = []
+    original_sync = TechMatchIndex.sync
+
+    def counting_sync(self, snapshot):
+        syncs.append(1)
+        return original_sync(self, snapshot)
+
+    monkeypatch.setattr(TechMatchIndex, "sync", counting_sync)
+    monkeypatch.setattr(tech_match_index, "_index", TechMatchIndex())
+    monkeypatch.setattr(tech_match_index, "_index_generation", None)
+
+    async def fetch_matches():
+        async with TestingAsyncSessionLocal() as db:
+            return await tech_match_index.match_jobs(db, ["React"])
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(fetch_matches() for _ in range(5)))
+
+    results = asyncio.run(fetch_concurrently())
+    assert len(syncs) == 1
+    assert all(result == results[0] for result in results)
+    assert results[0][0][2] == ["react"]
+
+
+def test_resume_matches_endpoint(client, login_user):
+    db = TestingSessionLocal()
+    resume = ResumeORM(
+        user_id=1,
+        file_path="temp/resume.pdf",
+        extracted_keywords=["Python", "FastAPI", "Docker"],
+        job_category="backend",
+    )
+    db.add(resume)
+    db.commit()
+    resume_id = resume.resume_id
+    db.close()
+
+    response = client.get(f"/api/v1/resume/{resume_id}/matches")
+    other_user = client.get(f"/api/v1/resume/{resume_id + 1}/matches")
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["job"]["url"] for item in items] == ["https://example.com/job1"]
+    assert items[0]["matched_keywords"] == ["fastapi", "python"]
+    assert other_user.status_code == 404
+
+
+def test_my_resumes_listing_and_detail(client, login_user):
+    db = TestingSessionLocal()
+    mine = ResumeORM(user_id=1, file_path="temp/mine.pdf", extracted_keywords=["Go"], job_category="backend")
+    others = ResumeORM(user_id=2, file_path="temp/others.pdf", extracted_keywords=["Go"], job_category="backend")
+    db.add_all([mine, others])
+    db.commit()
+    mine_id, others_id = mine.resume_id, others.resume_id
+    db.close()
+
+    listing = client.get("/api/v1/resume/")
+    assert listing.status_code == 200
+    listed_ids = [item["resume_id"] for item in listing.json()]
+    assert mine_id in listed_ids and others_id not in listed_ids
+
+    assert client.get(f"/api/v1/resume/{mine_id}").json()["file_path"] == "temp/mine.pdf"
+    assert client.get(f"/api/v1/resume/{others_id}").status_code == 404
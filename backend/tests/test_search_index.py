@@ -0,0 +1,65 @@
+# 📄 파일명: tests/test_search_index.py
+
+import asyncio
+
+from app.services import search_index
+from app.services.search_index import BM25Index, tokenize
+from tests.conftest import TestingAsyncSessionLocal
+
+
+def test_tokenize_hangul_bigrams_and_latin_terms():
+    tokens = tokenize("백엔드 서버 개발자 (Node.js, C++)")
+    assert "백엔" in tokens and "엔드" in tokens
+    assert "node.js" in tokens
+    assert "c++" in tokens
+
+
+def test_bm25_ranks_more_relevant_document_first():
+    index = BM25Index.build(
+        [
+            (1, "프론트엔드 개발자 테스트회사"),
+            (2, "백엔드 서버 개발자 테스트회사"),
+            (3, "데이터 분석가 다른회사"),
+        ]
+    )
+    results = index.search("백엔드 서버 개발자")
+    assert results[0][0] == 2
+    assert 3 not in [doc_id for doc_id, _ in results]
+
+
+def test_bm25_requires_most_query_terms():
+    index = BM25Index.build(
+        [
+            (1, "프론트엔드 개발자 테스트회사"),
+            (2, "백엔드 개발자 테스트회사"),
+        ]
+    )
+    # "백엔드"는 "엔드"만 공유하는 프론트엔드와 일치하지 않아야 함
+    assert [doc_id for doc_id, _ in index.search("백엔드")] == [2]
+    assert [doc_id for doc_id, _ in index.search("백엔드 개발자")] == [2]
+    # 띄어쓰기 없는 질의("드개" 바이그램은 문서에 없음)도 일치
+    assert [doc_id for doc_id, _ in index.search("백엔드개발자")] == [2]
+    assert {doc_id for doc_id, _ in index.search("개발자")} == {1, 2}
+
+
+def test_concurrent_requests_build_index_once(monkeypatch):
+    builds = []
+    original_build = BM25Index.build
+
+    def counting_build(documents):
+        builds.append(1)
+        return original_build(documents)
+
+    monkeypatch.setattr(BM25Index, "build", staticmethod(counting_build))
+    monkeypatch.setattr(search_index, "_cached_index", None)
+
+    async def fetch_index():
+        async with TestingAsyncSessionLocal() as db:
+            return await search_index.get_search_index(db)
+
+    async def fetch_concurrently():
+        return await asyncio.gather(*(fetch_index() for _ in range(5)))
+
+    indexes = asyncio.run(fetch_concurrently())
+    assert len(builds) == 1
+    assert all(index is indexes[0] for index in indexes)
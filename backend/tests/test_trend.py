@@ -0,0 +1,115 @@
+# 📄 파일명: tests/test_trend.py
+
+import pytest
+
+from app.models.market_trends import MarketTrendORM
+from app.models.summary import TrendSummaryORM
+from app.models.tech_trend import TechTrendORM
+from tests.conftest import TestingSessionLocal
+
+
+# ✅ 트렌드 샘플 데이터 (테스트 종료 시 삭제)
+@pytest.fixture
+def trend_data():
+    from datetime import date
+
+    db = TestingSessionLocal()
+    rows = [
+        MarketTrendORM(role="backend", data={"role": "backend", "radar_score": []}),
+        TrendSummaryORM(job_category="backend", summary="백엔드 요약"),
+        TechTrendORM(
+            keyword="Python",
+            job_category="backend",
+            count=10,
+            trend_date=date(2025, 7, 1),
+            category="language",
+            percentage=50.0,
+            top_percentage=50.0,
+        ),
+    ]
+    db.add_all(rows)
+    db.commit()
+    yield
+    for row in rows:
+        db.delete(row)
+    db.commit()
+    db.close()
+
+
+def test_market_trend_etag_not_modified(client, trend_data):
+    first = client.get("/api/v1/trends/market/backend")
+    assert first.status_code == 200
+    assert first.json()["role"] == "backend"
+    etag = first.headers["etag"]
+
+    second = client.get("/api/v1/trends/market/backend", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_market_trend_etag_changes_on_in_place_edit(client, trend_data):
+    first = client.get("/api/v1/trends/market/backend")
+    assert first.status_code == 200
+
+    # updated_at은 그대로, data만 수정
+    db = TestingSessionLocal()
+    db.query(MarketTrendORM).filter(MarketTrendORM.role == "backend").update(
+        {"data": {"role": "backend", "radar_score": [1]}}
+    )
+    db.commit()
+    db.close()
+
+    second = client.get("/api/v1/trends/market/backend", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["data"]["radar_score"] == [1]
+
+
+def test_market_trend_serves_latest_row(client, trend_data):
+    db = TestingSessionLocal()
+    newer = MarketTrendORM(role="backend", data={"role": "backend", "radar_score": [2]})
+    db.add(newer)
+    db.commit()
+    try:
+        response = client.get("/api/v1/trends/market/backend")
+        assert response.json()["data"]["radar_score"] == [2]
+    finally:
+        db.delete(newer)
+        db.commit()
+        db.close()
+
+
+def test_role_trends_etag_not_modified(client, trend_data):
+    first = client.get("/api/v1/trends/roles/backend")
+    assert first.status_code == 200
+    assert first.json()["technologies"][0]["name"] == "Python"
+
+    second = client.get(
+        "/api/v1/trends/roles/backend", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert second.status_code == 304
+
+
+def test_role_trends_etag_changes_on_in_place_edit(client, trend_data):
+    first = client.get("/api/v1/trends/roles/backend")
+    assert first.status_code == 200
+
+    # 행 ID/생성 시각/개수는 그대로, 값만 수정
+    db = TestingSessionLocal()
+    db.query(TechTrendORM).filter(TechTrendORM.job_category == "backend").update({"percentage": 60.0})
+    db.query(TrendSummaryORM).filter(TrendSummaryORM.job_category == "backend").update({"summary": "수정된 요약"})
+    db.commit()
+    db.close()
+
+    second = client.get(
+        "/api/v1/trends/roles/backend", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert second.status_code == 200
+    assert second.headers["etag"] != first.headers["etag"]
+    assert second.json()["summary"] == "수정된 요약"
+    assert second.json()["technologies"][0]["percentage"] == 60.0
+
+
+def test_market_trend_not_found(client):
+    response = client.get("/api/v1/trends/market/unknown")
+    assert response.status_code == 404
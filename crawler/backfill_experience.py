@@ -0,0 +1,70 @@
+# 🧮 기존 공고의 경력 텍스트(experience)를 min_experience / max_experience로 일괄 변환하는 스크립트
+#
+# 사용법 (crawler 디렉터리에서 실행):
+#   python backfill_experience.py          # 아직 변환되지 않은 공고만
+#   python backfill_experience.py --all    # 모든 공고 다시 계산
+
+import sys
+from sqlalchemy import text
+
+from repository.database import engine
+from repository.data_generation import bump_data_generation  # 🔢 세대 번호 증가 → 백엔드 캐시 무효화
+from services.experience_parser import parse_experience
+
+BATCH_SIZE = 1000
+
+
+def backfill_experience(recompute_all: bool = False) -> int:
+    """
+    jobs.experience를 파싱하여 min_experience / max_experience를 채웁니다.
+
+    Parameters:
+        recompute_all (bool): True면 이미 값이 있는 공고도 다시 계산
+
+    Returns:
+        int: 갱신된 공고 수
+    """
+    condition = "experience IS NOT NULL"
+    if not recompute_all:
+        condition += " AND min_experience IS NULL"
+
+    updated = 0
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text(f"SELECT job_post_id, experience FROM jobs WHERE {condition}")
+        ).fetchall()
+
+        params = []
+        for job_post_id, experience in rows:
+            min_experience, max_experience = parse_experience(experience)
+            if min_experience is None:
+                continue
+            params.append({
+                "job_post_id": job_post_id,
+                "min_experience": min_experience,
+                "max_experience": max_experience,
+            })
+
+        stmt = text("""
+            UPDATE jobs
+            SET min_experience = :min_experience,
+                max_experience = :max_experience
+            WHERE job_post_id = :job_post_id
+        """)
+        for start in range(0, len(params), BATCH_SIZE):
+            batch = params[start:start + BATCH_SIZE]
+            conn.execute(stmt, batch)  # executemany
+            updated += len(batch)
+
+        conn.commit()
+
+    # ✅ 경력 필터 결과가 바뀌었으므로 캐시(목록/개수/패싯)가 이전 값을 내보내지 않도록 세대 증가
+    if updated:
+        bump_data_generation()
+
+    print(f"🧮 경력 범위 변환 완료: {updated}건 (대상 {len(rows)}건)")
+    return updated
+
+
+if __name__ == "__main__":
+    backfill_experience(recompute_all="--all" in sys.argv)
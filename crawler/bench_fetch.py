@@ -0,0 +1,58 @@
+# ⏱️ 목록 API 수집(fetch → parse → classify) 처리량 오프라인 벤치마크
+#
+# 사용법 (crawler 디렉터리에서 실행):
+#   python bench_fetch.py                                   # 가상 공고 10,000건, 지연 50ms
+#   python bench_fetch.py --synthetic 20000 --latency-ms 100 --concurrency 1 4 8 16
+#   python bench_fetch.py --rate 10                         # 초당 10회 요청 제한 적용 시
+
+import argparse
+import asyncio
+import threading
+import time
+
+import httpx
+
+from fixture_server import create_server
+from services.job_classifier import classify_posting
+from services.rate_limit import TokenBucket
+from sources.jumpit import JumpitApiSource
+
+
+async def collect(source: JumpitApiSource, rate: float) -> int:
+    """플러그인 1개를 fetch → parse → normalize → classify 까지 실행하고 건수를 반환합니다."""
+    count = 0
+    limiter = TokenBucket(rate, source.burst)
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        async for raw in source.fetch(client, limiter):
+            job = source.parse(raw)
+            if job is not None:
+                classify_posting(source.normalize(job))
+                count += 1
+    return count
+
+
+def run(api_url: str, concurrency: int, rate: float) -> tuple:
+    started = time.perf_counter()
+    count = asyncio.run(collect(JumpitApiSource(api_url=api_url, concurrency=concurrency), rate))
+    return count, time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="목록 API 수집 처리량 측정")
+    parser.add_argument("--synthetic", type=int, default=10000)
+    parser.add_argument("--latency-ms", type=int, default=50)
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16])
+    parser.add_argument("--rate", type=float, default=1000.0, help="초당 요청 수 제한 (토큰 버킷)")
+    args = parser.parse_args()
+
+    server = create_server(args.port, args.synthetic, args.latency_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{args.port}/api/positions"
+
+    print(f"🧪 가상 공고 {args.synthetic}건, 응답 지연 {args.latency_ms}ms")
+    for concurrency in args.concurrency:
+        count, seconds = run(api_url, concurrency, args.rate)
+        print(f"  동시 요청 {concurrency:>2}: {count}건 / {seconds:.2f}s ({count / seconds:,.0f}건/s)")
+
+    server.shutdown()
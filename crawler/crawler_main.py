@@ -1,45 +1,179 @@
 """
 sequenceDiagram
   participant Main as 🧠 crawler_main.py
-  participant Crawler as 📡 jumpit_crawler.py
+  participant Runner as 🏃 crawl_runner.py
+  participant Sources as 🧩 sources/ (사이트별 플러그인)
   participant DBSave as 💾 save_jobs.py
-  participant Mark as 🚫 mark_closed.py
+  participant Dedup as 🧬 dedup_jobs.py
+  participant Runs as 📒 crawl_runs.py
+  participant Lock as 🔒 crawl_lock.py
 
-  Main->>Crawler: get_jumpit_jobs()
-  Crawler-->>Main: 채용 공고 리스트 반환 (List[Dict])
+  Main->>Lock: crawl_locks(사이트 목록)
+  Lock-->>Main: 잠금을 얻은 사이트 (다른 크롤링이 실행 중인 사이트는 제외)
 
-  Main->>DBSave: save_jobs_to_db(jobs)
-  DBSave-->>Main: 저장 완료
+  Main->>DBSave: load_checkpoint(sources)
+  DBSave-->>Main: 중단된 이전 크롤링에서 저장된 URL (없으면 빈 집합)
 
-  Main->>Mark: mark_closed_jobs(url_list)
-  Mark-->>Main: 마감 처리 완료
+  Main->>Runs: start_crawl_run(sources)
+  Runs-->>Main: 실행 ID + 이번 크롤링의 세대 번호 (실행마다 고유하게 예약)
+
+  Main->>Runner: CrawlRunner(get_sources()).run()
+  par 사이트마다 asyncio 작업 1개 (호스트별 토큰 버킷)
+    Sources-->>Runner: fetch(실패 시 fallback) → parse → normalize → classify → 큐
+  and BATCH_SIZE건마다
+    Runner->>DBSave: save_job_batch(batch, generation)
+    DBSave-->>Runner: 변경분만 upsert + 나머지는 last_seen_at 갱신 + 체크포인트 기록 (배치 단위 커밋)
+  end
+  Runner-->>Main: 끝까지 수집한 사이트 목록
+
+  Main->>DBSave: close_unseen_jobs(generation, sources)
+  DBSave-->>Main: 해당 사이트의 마감 건수 (체크포인트 안티 조인) + 체크포인트 비움
+
+  Main->>Dedup: link_duplicate_jobs(generation)
+  Dedup-->>Main: 재게시 공고 → 대표 공고 연결
+
+  Main->>Main: fetch_details(generation, sources)
+  Note over Main: 신규/변경 공고 상세 페이지 → 조건부 요청(304 생략) → 압축 본문 저장
+
+  Main->>Runs: finish_crawl_run(status, stage_seconds, counts)
+  Runs-->>Main: 단계별 소요 시간 + 건수 기록 (실패 시에도 기록) + 세대 번호 증가 (백엔드 캐시 무효화)
+
+  Main->>Lock: 잠금 해제 (with 블록 종료)
 """
 
 # 🚀 크롤링 전체 프로세스 실행 스크립트
 
-# 📡 Jumpit 사이트에서 채용공고 크롤링 함수
-from services.jumpit_crawler import get_jumpit_jobs
+import asyncio
+import os
+from collections import Counter
+from functools import partial
+from typing import List, Optional
+
+# 🧩 채용 사이트 수집 플러그인 (CRAWLER_SOURCES로 선택, 기본: 전체)
+from sources import JobSource, get_sources
+
+# 🏃 사이트별 동시 수집(호스트별 속도 제한) → 공통 normalize/classify → 배치 저장
+from services.crawl_runner import CrawlRunner
+
+# 💾 배치 저장(upsert + 체크포인트) / 사라진 공고 마감처리
+from repository.save_jobs import close_unseen_jobs, load_checkpoint, save_job_batch
+
+# 🧬 같은 회사의 재게시(중복) 공고를 대표 공고에 연결
+from repository.dedup_jobs import link_duplicate_jobs
+
+# 📒 크롤링 실행 기록(단계별 소요 시간 + 건수) → GET /api/v1/crawl-runs
+#    + 세대 번호 예약(시작) / 증가(종료) → 변경 피드 확정 범위 + 백엔드 캐시 무효화
+from repository.crawl_runs import finish_crawl_run, start_crawl_run
+
+# 🔒 사이트별 중복 실행 방지 (PostgreSQL advisory lock)
+from repository.crawl_lock import crawl_locks
+
+# 📄 신규/변경 공고의 상세 페이지 동시 수집(조건부 요청) → 압축 본문 저장
+from services.detail_fetcher import DetailFetcher
+from repository.job_details import (
+    record_detail_failures,
+    save_job_details,
+    select_detail_targets,
+    touch_job_details,
+)
+
+# ✅ 몇 건마다 DB에 저장(커밋)할지 → 중단 시 최대 이만큼만 다시 수집
+BATCH_SIZE = 200
+
+# ✅ 상세 페이지 수집 여부 / 한 번 실행에서 받을 최대 건수 (나머지는 다음 실행에서 이어서)
+FETCH_DETAILS = os.getenv("CRAWLER_FETCH_DETAILS", "1") == "1"
+DETAIL_MAX_PER_RUN = int(os.getenv("CRAWLER_DETAIL_MAX_PER_RUN", "2000"))
+
+
+def main(source_names: Optional[str] = None) -> List[str]:
+    """
+    크롤링 1회 실행: 세대 예약 → 수집 + 저장 → 마감 처리 → 중복 연결 → 종료 기록 + 세대 번호 증가
+
+    Parameters:
+        source_names: 수집할 사이트 이름 (쉼표 구분, None이면 CRAWLER_SOURCES 또는 전체)
+
+    Returns:
+        List[str]: 끝까지 수집하지 못한 사이트 이름 (스케줄러가 재시도)
+    """
+    sources = get_sources(source_names)
+
+    # ✅ 사이트별 잠금: 같은 사이트를 수집 중인 다른 크롤링(다른 서버 포함)이 있으면 건너뜀
+    with crawl_locks([source.name for source in sources]) as locked:
+        busy = [source.name for source in sources if source.name not in locked]
+        if busy:
+            print(f"⏭️ 다른 크롤링이 실행 중인 사이트 건너뜀: {', '.join(busy)}")
+        sources = [source for source in sources if source.name in locked]
+        if not sources:
+            return []
+        return _crawl(sources)
+
+
+def fetch_details(generation: int, sources: List[JobSource]) -> Counter:
+    """
+    이번 크롤링에서 신규/변경된 공고(+ 본문이 없는 공고)의 상세 페이지를 수집해 저장합니다.
+    (실패한 공고는 재시도 대기 시간이 지날 때까지 건너뜀)
+    """
+    targets = select_detail_targets(generation, [source.name for source in sources], DETAIL_MAX_PER_RUN)
+    fetcher = DetailFetcher(
+        {source.name: source for source in sources}, save_job_details, touch_job_details, record_detail_failures
+    )
+    return asyncio.run(fetcher.run(targets))
+
+
+def _crawl(sources: List[JobSource]) -> List[str]:
+    source_names = [source.name for source in sources]
 
-# 💾 수집한 공고를 DB에 저장 (신규/업데이트 구분)
-from repository.save_jobs import save_jobs_to_db
+    # ✅ 중단된 크롤링이 있으면 이미 저장된 공고는 건너뛰고 이어서 진행
+    saved_urls = load_checkpoint(source_names)
+    if saved_urls:
+        print(f"♻️ 이전 크롤링 이어서 진행: 저장된 공고 {len(saved_urls)}건 건너뜀")
 
-# 🚫 DB에 저장된 공고 중, 현재 페이지에서 사라진 공고를 마감처리
-from repository.mark_closed import mark_closed_jobs
+    # ✅ 실행 기록(crawl_runs) 시작 + 이번 크롤링의 세대 번호 예약 (변경된 공고에 기록, 종료 기록과 함께 확정)
+    # → 성공/실패와 관계없이 단계별 소요 시간 + 건수 기록
+    run_id, generation = start_crawl_run(source_names)
 
+    runner = CrawlRunner(
+        sources,
+        save_batch=partial(save_job_batch, generation=generation),  # ⬅️ 배치 단위 upsert + 체크포인트 기록
+        batch_size=BATCH_SIZE,
+        skip_urls=saved_urls,
+    )
+    counts = {}
+    try:
+        print(f"📡 채용 공고 수집 + 저장 시작 (사이트: {', '.join(source_names)}, 세대 {generation})")
+        asyncio.run(runner.run())
+        counts.update(runner.counts())
+        completed = runner.completed_sources()
 
-def main():
-    print("📡 Jumpit 채용 공고 수집 시작")
-    jobs = get_jumpit_jobs()  # ⬅️ 채용공고 리스트 크롤링
-    print(f"📦 수집된 공고 수: {len(jobs)}개")
+        print("📛 마감된 공고 처리 시작")
+        with runner.timed("close_out"):
+            # ⬅️ 끝까지 수집한 사이트에서 이번 크롤링(체크포인트)에 없는 공고만 마감 처리
+            counts["closed"] = close_unseen_jobs(generation, sources=completed)
 
-    print("💾 DB 저장 시작")
-    save_jobs_to_db(jobs)  # ⬅️ DB에 insert/update 처리
+        print("🧬 중복 공고 연결 시작")
+        with runner.timed("dedup"):
+            counts["duplicates"] = link_duplicate_jobs(generation)  # ⬅️ 활성 공고 기준으로 대표 공고(canonical_job_id) 갱신
 
-    print("📛 마감된 공고 처리 시작")
-    latest_urls = [job["url"] for job in jobs]
-    mark_closed_jobs(latest_urls)  # ⬅️ DB 내 기존 공고 중 사라진 공고 마감 처리
+        if FETCH_DETAILS:
+            print("📄 상세 페이지 수집 시작")
+            with runner.timed("details"):
+                details = fetch_details(generation, sources)  # ⬅️ 대표 공고만, 조건부 요청으로 변경분만 저장
+            counts.update(
+                details_fetched=details["fetched"],
+                details_not_modified=details["not_modified"],
+                details_failed=details["failed"],
+            )
+    except BaseException as e:
+        finish_crawl_run(
+            run_id, "failed", runner.stage_seconds, {**runner.counts(), **counts},
+            runner.source_stats, error=repr(e),
+        )
+        raise
 
+    # ⬅️ 저장/마감/중복 처리가 모두 끝난 뒤 종료 기록 + 세대 번호 증가 (한 트랜잭션)
+    finish_crawl_run(run_id, "succeeded", runner.stage_seconds, counts, runner.source_stats)
     print("✅ 모든 작업 완료")
+    return [name for name in source_names if name not in completed]
 
 
 if __name__ == "__main__":
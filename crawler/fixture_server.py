@@ -0,0 +1,132 @@
+# 🧪 Jumpit 목록 API 재현용 로컬 fixture 서버 (오프라인 크롤링 처리량 측정용)
+#
+# 사용법 (crawler 디렉터리에서 실행):
+#   python fixture_server.py record --pages 5              # 실제 API 응답을 fixtures/jumpit/page_N.json 으로 저장
+#   python fixture_server.py serve                         # 저장된 응답 재생 (http://127.0.0.1:8765/api/positions)
+#   python fixture_server.py serve --synthetic 10000       # 저장된 응답 없이 가상 공고 10,000건 생성
+#   python fixture_server.py serve --latency-ms 80         # 응답마다 네트워크 지연 흉내
+#
+#   JUMPIT_API_URL=http://127.0.0.1:8765/api/positions python crawler_main.py
+
+import argparse
+import json
+import os
+import random
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "jumpit")
+DEFAULT_PORT = 8765
+PAGE_SIZE = 16
+
+_TITLES = ["백엔드 개발자", "프론트엔드 개발자", "데이터 엔지니어", "iOS 개발자", "Android 개발자", "DevOps 엔지니어"]
+_TECHS = ["Python", "Java", "Spring Boot", "React", "TypeScript", "Kotlin", "Swift", "AWS", "Docker", "Kafka"]
+_LOCATIONS = ["서울 강남구", "서울 마포구", "경기 성남시", "부산 해운대구"]
+
+
+def _fixture_path(page: int) -> str:
+    return os.path.join(FIXTURE_DIR, f"page_{page}.json")
+
+
+def record(pages: int, api_url: str):
+    """실제 목록 API의 1~pages 페이지 응답을 그대로 저장합니다."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with httpx.Client(timeout=10.0) as client:
+        for page in range(1, pages + 1):
+            response = client.get(api_url, params={"sort": "rsp_rate", "highlight": "false", "page": page})
+            response.raise_for_status()
+            with open(_fixture_path(page), "w", encoding="utf-8") as f:
+                f.write(response.text)
+            print(f"💾 page {page} 저장")
+
+
+def synthetic_page(page: int, total_count: int) -> dict:
+    """실제 응답과 같은 구조의 가상 공고 페이지 (같은 페이지는 항상 같은 내용)"""
+    rng = random.Random(page)
+    start = (page - 1) * PAGE_SIZE
+    positions = []
+    for position_id in range(start + 1, min(start + PAGE_SIZE, total_count) + 1):
+        min_career = rng.choice([0, 0, 1, 3, 5])
+        positions.append({
+            "id": position_id,
+            "title": f"{rng.choice(_TITLES)} ({position_id})",
+            "companyName": f"테스트회사{position_id % 500}",
+            "techStacks": rng.sample(_TECHS, rng.randint(2, 5)),
+            "locations": [rng.choice(_LOCATIONS)],
+            "newcomer": min_career == 0,
+            "minCareer": min_career,
+            "maxCareer": rng.choice([min_career + 2, min_career + 5, None]),
+            "alwaysOpen": rng.random() < 0.3,
+            "closedAt": "2026-12-31T23:59:59",
+        })
+    return {"status": 200, "result": {"totalCount": total_count, "positions": positions}}
+
+
+def make_handler(page_loader: Callable[[int], Optional[bytes]], latency_ms: int):
+    class FixtureHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive → 클라이언트 커넥션 풀 재사용 측정 가능
+
+        def do_GET(self):
+            parsed = urlparse(self.path)
+            if parsed.path != "/api/positions":
+                self.send_error(404)
+                return
+            page = int(parse_qs(parsed.query).get("page", ["1"])[0])
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            body = page_loader(page)
+            if body is None:
+                body = json.dumps({"status": 200, "result": {"totalCount": 0, "positions": []}}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 벤치마크 중 요청 로그 생략
+
+    return FixtureHandler
+
+
+def create_server(port: int = DEFAULT_PORT, synthetic: int = 0, latency_ms: int = 0) -> ThreadingHTTPServer:
+    """
+    fixture 서버를 생성합니다. (serve_forever()는 호출 측에서 실행)
+    - synthetic > 0: 가상 공고 synthetic건 / 그 외: fixtures/jumpit/page_N.json 재생
+    """
+    def load_page(page: int) -> Optional[bytes]:
+        if synthetic:
+            return json.dumps(synthetic_page(page, synthetic), ensure_ascii=False).encode("utf-8")
+        path = _fixture_path(page)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+
+    return ThreadingHTTPServer(("127.0.0.1", port), make_handler(load_page, latency_ms))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jumpit 목록 API fixture 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = sub.add_parser("record", help="실제 API 응답 저장")
+    record_parser.add_argument("--pages", type=int, default=5)
+    record_parser.add_argument("--api-url", default="https://jumpit-api.saramin.co.kr/api/positions")
+
+    serve_parser = sub.add_parser("serve", help="저장된 응답 재생")
+    serve_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve_parser.add_argument("--synthetic", type=int, default=0, help="가상 공고 건수 (0이면 저장된 응답 사용)")
+    serve_parser.add_argument("--latency-ms", type=int, default=0)
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args.pages, args.api_url)
+    else:
+        server = create_server(args.port, args.synthetic, args.latency_ms)
+        print(f"🧪 fixture 서버 실행: http://127.0.0.1:{args.port}/api/positions")
+        server.serve_forever()
@@ -0,0 +1,46 @@
+# 🔒 사이트별 크롤링 중복 실행 방지 잠금
+# - PostgreSQL 세션 advisory lock (여러 서버에서 실행해도 같은 DB 기준으로 하나만 실행)
+#   → 잠금을 잡은 연결이 끊기면(프로세스 종료 등) DB가 자동으로 해제
+
+import hashlib
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import text
+from .database import engine  # 🔗 공통 DB 연결 모듈 불러오기
+
+
+def lock_key(name: str) -> int:
+    """사이트 이름 → advisory lock 키 (signed 64bit, 프로세스/서버가 달라도 항상 같은 값)"""
+    digest = hashlib.blake2b(f"crawl:{name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+@contextmanager
+def _advisory_lock(name: str) -> Iterator[bool]:
+    conn = engine.connect()
+    try:
+        acquired = conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": lock_key(name)}
+        ).scalar()
+        conn.commit()
+        try:
+            yield bool(acquired)
+        finally:
+            if acquired:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": lock_key(name)})
+                conn.commit()
+    finally:
+        conn.close()
+
+
+@contextmanager
+def crawl_locks(names: List[str]) -> Iterator[List[str]]:
+    """
+    사이트별 크롤링 잠금을 시도하고, 잠금을 얻은 사이트 이름 목록을 반환합니다. (기다리지 않음)
+    - 이미 다른 크롤링이 실행 중인 사이트는 목록에서 빠짐 → 호출 측에서 건너뜀
+    - with 블록이 끝나면 모든 잠금 해제
+    """
+    with ExitStack() as stack:
+        acquired = [name for name in names if stack.enter_context(_advisory_lock(name))]
+        yield acquired
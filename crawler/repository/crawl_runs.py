@@ -0,0 +1,101 @@
+# 📒 크롤링 실행 기록(crawl_runs) 저장
+# - 시작 시 이번 실행의 세대 번호를 예약하며 running 행을 만들고, 종료 시 상태 + 단계별 소요 시간 + 건수를 기록
+# - 변경 피드(GET /api/v1/jobs/changes)는 running 실행이 예약한 세대 직전까지만 확정된 것으로 제공
+# - 백엔드 GET /api/v1/crawl-runs 로 조회 → 느려짐 / 카드 누락 / 과도한 마감 모니터링
+
+import json
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from .data_generation import reserve_data_generation  # 🔢 세대 번호 예약 (행 잠금으로 원자적 증가)
+from .database import engine  # 🔗 공통 DB 연결 모듈 불러오기
+
+# ✅ crawl_runs 건수 컬럼 (finish_crawl_run의 counts 키)
+COUNT_COLUMNS = (
+    "cards_seen", "parse_failures", "skipped",
+    "inserted", "updated", "unchanged", "closed", "duplicates",
+    "details_fetched", "details_not_modified", "details_failed",
+)
+
+
+def start_crawl_run(sources: List[str]) -> Tuple[int, int]:
+    """
+    크롤링 시작을 기록하고 (실행 ID, 이번 크롤링의 세대 번호)를 반환합니다. (status = running)
+    - 세대 번호 예약과 running 행 생성을 한 트랜잭션으로 처리 → 동시에 시작한 크롤링도 서로 다른 세대를 받고,
+      백엔드는 예약된 세대가 보이는 순간 진행 중인 실행도 함께 보게 됨
+    - 호출 전 crawl_locks로 사이트 잠금을 잡아야 함: 잠금을 얻었는데 같은 사이트의 running 행이 남아 있다면
+      비정상 종료된 실행이므로 failed로 정리 (변경 피드의 확정 세대가 막히지 않도록)
+
+    Parameters:
+        sources: 수집할 사이트 이름 목록
+    """
+    with engine.begin() as conn:
+        conn.execute(
+            text("""
+                UPDATE crawl_runs
+                SET status = 'failed',
+                    finished_at = NOW(),
+                    error = COALESCE(error, :error)
+                WHERE status = 'running' AND sources ?| CAST(:sources AS text[])
+            """),
+            {"sources": sources, "error": "abandoned: 종료 기록 없이 중단된 실행"},
+        )
+        generation = reserve_data_generation(conn)
+        run_id = conn.execute(
+            text("""
+                INSERT INTO crawl_runs (generation, status, sources)
+                VALUES (:generation, 'running', CAST(:sources AS jsonb))
+                RETURNING run_id
+            """),
+            {"generation": generation, "sources": json.dumps(sources)},
+        ).scalar()
+    return run_id, generation
+
+
+def finish_crawl_run(
+    run_id: int,
+    status: str,
+    stage_seconds: Dict[str, float],
+    counts: Dict[str, int],
+    source_stats: Dict[str, Dict[str, int]],
+    error: Optional[str] = None,
+) -> int:
+    """
+    크롤링 종료를 기록하고, 같은 트랜잭션에서 세대 번호를 올린 새 값을 반환합니다.
+    (실패해도 호출 → 어느 단계까지 진행됐는지 남김 + 이미 저장된 배치가 있으므로 캐시 무효화)
+    - 종료 기록과 세대 증가가 함께 커밋되므로, 새 세대의 캐시에는 이 실행의 변경분이 확정된 상태로 담김
+
+    Parameters:
+        run_id: start_crawl_run이 반환한 실행 ID
+        status: succeeded | failed
+        stage_seconds: 단계별 소요 시간(초) - fetch / parse / classify / upsert / close_out / dedup / details
+        counts: COUNT_COLUMNS 건수 (없는 키는 0)
+        source_stats: 사이트별 건수 (수집 완료 여부, 원본/내보냄/건너뜀/파싱 실패)
+        error: 실패 시 오류 메시지
+    """
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"""
+                UPDATE crawl_runs
+                SET status = :status,
+                    finished_at = NOW(),
+                    duration_seconds = EXTRACT(EPOCH FROM NOW() - started_at),
+                    stage_seconds = CAST(:stage_seconds AS jsonb),
+                    source_stats = CAST(:source_stats AS jsonb),
+                    {", ".join(f"{column} = :{column}" for column in COUNT_COLUMNS)},
+                    error = :error
+                WHERE run_id = :run_id
+            """),
+            {
+                "run_id": run_id,
+                "status": status,
+                "stage_seconds": json.dumps({stage: round(seconds, 3) for stage, seconds in stage_seconds.items()}),
+                "source_stats": json.dumps(source_stats),
+                **{column: counts.get(column, 0) for column in COUNT_COLUMNS},
+                "error": error,
+            },
+        )
+        generation = reserve_data_generation(conn)
+
+    print(f"🔢 데이터 세대 갱신: jobs → {generation}")
+    return generation
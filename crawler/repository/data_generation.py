@@ -0,0 +1,57 @@
+# 🔢 크롤링 데이터 세대(generation) 번호 관리
+# - 백엔드는 이 값을 캐시 키에 포함하므로, 값을 올리면 관련 캐시가 모두 무효화됩니다.
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from .database import engine  # 🔗 공통 DB 연결 모듈 불러오기
+
+
+def reserve_data_generation(conn: Connection, name: str = "jobs") -> int:
+    """
+    호출 측 트랜잭션 안에서 세대 번호를 1 증가시키고 새 값을 반환합니다. (커밋하지 않음)
+    - 행 잠금(ON CONFLICT DO UPDATE)으로 증가하므로 동시에 호출해도 항상 서로 다른 값을 받음
+    - 크롤링 시작 시 이번 실행의 세대 예약 / 종료 시 캐시 무효화에 함께 사용
+
+    Parameters:
+        conn: 트랜잭션 중인 연결
+        name (str): 데이터셋 이름 (기본값: "jobs")
+    """
+    return conn.execute(
+        text("""
+            INSERT INTO data_generations (name, generation, updated_at)
+            VALUES (:name, 1, NOW())
+            ON CONFLICT (name) DO UPDATE
+            SET generation = data_generations.generation + 1,
+                updated_at = NOW()
+            RETURNING generation
+        """),
+        {"name": name},
+    ).scalar()
+
+
+def bump_data_generation(name: str = "jobs") -> int:
+    """
+    data_generations 테이블의 세대 번호를 1 증가시키고 새 값을 반환합니다.
+
+    Parameters:
+        name (str): 데이터셋 이름 (기본값: "jobs")
+    """
+    with engine.begin() as conn:
+        generation = reserve_data_generation(conn, name)
+
+    print(f"🔢 데이터 세대 갱신: {name} → {generation}")
+    return generation
+
+
+def get_data_generation(name: str = "jobs") -> int:
+    """
+    현재 세대 번호를 반환합니다. (행이 없으면 0)
+    - 크롤링의 세대 번호는 이 값을 읽어 계산하지 말고 start_crawl_run이 예약한 값을 사용
+      (동시에 실행되는 크롤링이 같은 세대를 쓰지 않도록)
+    """
+    with engine.connect() as conn:
+        generation = conn.execute(
+            text("SELECT generation FROM data_generations WHERE name = :name"),
+            {"name": name},
+        ).scalar()
+    return generation or 0
@@ -9,7 +9,8 @@ dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.env")
 dotenv.load_dotenv(dotenv_path=dotenv_path)
 
 # 📦 환경변수로부터 PostgreSQL 연결 정보 구성
-DB_URL = (
+# - CRAWLER_DATABASE_URL이 있으면 그대로 사용 (예: 유닉스 소켓 접속, 통합 테스트용 DB)
+DB_URL = os.getenv("CRAWLER_DATABASE_URL") or (
     f"postgresql+psycopg2://{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}"
     f"@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}/{os.getenv('POSTGRES_DB')}"
 )
@@ -0,0 +1,77 @@
+# 🧬 중복 공고(같은 회사의 재게시) → 대표 공고 연결
+# - 회사별로 SimHash 지문을 비교해, 가장 먼저 등록된 공고를 대표(canonical)로 지정합니다.
+# - 목록/트렌드 집계는 canonical_job_id IS NULL 조건만으로 중복을 제외할 수 있습니다.
+
+import json
+from collections import defaultdict
+
+from sqlalchemy import text
+from .database import engine  # 🔗 공통 DB 연결 모듈 불러오기
+from services.job_fingerprint import is_near_duplicate, simhash
+
+
+def link_duplicate_jobs(generation: int) -> int:
+    """
+    활성 공고 중 같은 회사 + 비슷한 제목/기술스택의 공고를 찾아 canonical_job_id를 갱신합니다.
+
+    - 대표 공고: 중복 그룹 중 job_post_id가 가장 작은(먼저 등록된) 공고 → canonical_job_id = NULL
+    - 대표 공고가 마감되면 남은 공고 중 가장 먼저 등록된 공고가 새 대표가 됨
+    - canonical_job_id가 바뀐 공고는 목록에서 빠지거나 다시 나타나므로 changed_generation도 함께 기록
+      (변경 피드 GET /api/v1/jobs/changes 에 포함)
+
+    Parameters:
+        generation: 이번 크롤링의 세대 번호
+
+    Returns:
+        int: 중복으로 연결된 공고 수
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT job_post_id, company, title, tech_stack, canonical_job_id
+                FROM jobs
+                WHERE is_active = TRUE
+                ORDER BY job_post_id
+            """)
+        ).fetchall()
+
+        # ✅ 회사별로 묶어서 비교 (재게시는 같은 회사 안에서만 발생)
+        by_company = defaultdict(list)
+        for row in rows:
+            tech_stack = row.tech_stack
+            if isinstance(tech_stack, str):
+                tech_stack = json.loads(tech_stack)
+            by_company[(row.company or "").strip().lower()].append(
+                (row.job_post_id, simhash(row.title, tech_stack), row.canonical_job_id)
+            )
+
+        updates = []
+        duplicate_count = 0
+        for postings in by_company.values():
+            canonicals = []  # (대표 공고 ID, 지문)
+            for job_post_id, fingerprint, current in postings:
+                canonical_id = next(
+                    (cid for cid, cfp in canonicals if is_near_duplicate(fingerprint, cfp)), None
+                )
+                if canonical_id is None:
+                    canonicals.append((job_post_id, fingerprint))
+                else:
+                    duplicate_count += 1
+                if canonical_id != current:
+                    updates.append({"job_post_id": job_post_id, "canonical_job_id": canonical_id})
+
+        # ✅ 값이 바뀐 공고만 일괄 갱신
+        if updates:
+            conn.execute(
+                text("""
+                    UPDATE jobs
+                    SET canonical_job_id = :canonical_job_id,
+                        changed_generation = :generation
+                    WHERE job_post_id = :job_post_id
+                """),
+                [dict(update, generation=generation) for update in updates],
+            )
+            conn.commit()
+
+    print(f"🧬 중복 공고 연결 완료: 중복 {duplicate_count}건 (변경 {len(updates)}건)")
+    return duplicate_count
@@ -0,0 +1,136 @@
+# 📄 공고 상세 본문(job_details) 조회/저장
+# - 상세 수집 대상: 이번 크롤링에서 신규/변경된 활성 공고 + 아직 본문이 없는 공고 (중복 공고 제외)
+# - 저장: 압축 본문 + 조건부 요청용 ETag/Last-Modified, 본문이 같으면(304 / 같은 해시) fetched_at + ETag/Last-Modified만 갱신
+# - 실패: job_detail_failures에 시도 횟수 + 다음 시도 시각(지수 백오프) 기록
+#   → 404 등 계속 실패하는 공고가 매 실행 대상 앞쪽을 차지해 뒤쪽 공고가 밀리지 않도록
+
+import os
+from typing import List
+
+from psycopg2.extras import execute_values
+from sqlalchemy import text
+from .database import engine  # 🔗 공통 DB 연결 모듈 불러오기
+
+# ✅ 저장 컬럼 (job_post_id 기준 upsert)
+DETAIL_COLUMNS = ("job_post_id", "body", "encoding", "body_hash", "etag", "last_modified")
+
+# ✅ 실패한 상세 페이지 재시도 대기 시간: 기본 × 2^(실패 횟수 - 1), 최대 (시간)
+DETAIL_RETRY_BASE_HOURS = float(os.getenv("CRAWLER_DETAIL_RETRY_BASE_HOURS", "1"))
+DETAIL_RETRY_MAX_HOURS = float(os.getenv("CRAWLER_DETAIL_RETRY_MAX_HOURS", "168"))
+
+
+def select_detail_targets(generation: int, sources: List[str], limit: int) -> List[dict]:
+    """
+    상세 페이지를 받아야 할 공고 목록 (최대 limit건)
+    - 재시도 대기 중인 실패 공고는 제외, 대기 시간이 지난 실패 공고는 처음 받는 공고 뒤로 (각각 job_post_id 순)
+
+    Returns:
+        List[dict]: job_post_id, url, source + 이전 수집 정보(etag, last_modified, body_hash / 없으면 None)
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT j.job_post_id, j.url, j.source, d.etag, d.last_modified, d.body_hash
+                FROM jobs j
+                LEFT JOIN job_details d ON d.job_post_id = j.job_post_id
+                LEFT JOIN job_detail_failures f ON f.job_post_id = j.job_post_id
+                WHERE j.is_active = TRUE
+                  AND j.canonical_job_id IS NULL
+                  AND j.source = ANY(:sources)
+                  AND (j.changed_generation = :generation OR d.job_post_id IS NULL)
+                  AND (f.next_attempt_at IS NULL OR f.next_attempt_at <= NOW())
+                ORDER BY f.job_post_id IS NOT NULL, j.job_post_id
+                LIMIT :limit
+            """),
+            {"generation": generation, "sources": sources, "limit": limit},
+        ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def _clear_failures(conn, job_post_ids: List[int]):
+    """수집에 성공한 공고의 실패 기록 삭제"""
+    conn.execute(
+        text("DELETE FROM job_detail_failures WHERE job_post_id = ANY(:ids)"),
+        {"ids": job_post_ids},
+    )
+
+
+def save_job_details(details: List[dict]):
+    """상세 본문 일괄 upsert + 실패 기록 삭제 (한 트랜잭션)"""
+    if not details:
+        return
+    with engine.begin() as conn:
+        cursor = conn.connection.cursor()
+        try:
+            execute_values(
+                cursor,
+                f"""
+                INSERT INTO job_details ({", ".join(DETAIL_COLUMNS)}) VALUES %s
+                ON CONFLICT (job_post_id) DO UPDATE SET
+                    {", ".join(f"{column} = EXCLUDED.{column}" for column in DETAIL_COLUMNS[1:])},
+                    fetched_at = NOW()
+                """,
+                [tuple(detail[column] for column in DETAIL_COLUMNS) for detail in details],
+            )
+        finally:
+            cursor.close()
+        _clear_failures(conn, [detail["job_post_id"] for detail in details])
+
+
+def touch_job_details(unchanged: List[dict]):
+    """
+    본문이 바뀌지 않은 공고(304 / 같은 해시)는 fetched_at + 조건부 요청용 ETag/Last-Modified만 갱신
+    (같은 해시의 200 응답은 새 ETag를 줄 수 있음 → 저장하지 않으면 다음 요청도 304를 받지 못함)
+
+    Parameters:
+        unchanged: {"job_post_id", "etag", "last_modified"} 목록
+    """
+    if not unchanged:
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text("""
+                UPDATE job_details
+                SET fetched_at = NOW(), etag = :etag, last_modified = :last_modified
+                WHERE job_post_id = :job_post_id
+            """),
+            [
+                {key: detail[key] for key in ("job_post_id", "etag", "last_modified")}
+                for detail in unchanged
+            ],
+        )
+        _clear_failures(conn, [detail["job_post_id"] for detail in unchanged])
+
+
+def record_detail_failures(failures: List[dict]):
+    """
+    실패한 공고의 시도 횟수를 올리고 다음 시도 시각을 기록합니다.
+    - 대기 시간: DETAIL_RETRY_BASE_HOURS × 2^(실패 횟수 - 1), 최대 DETAIL_RETRY_MAX_HOURS
+
+    Parameters:
+        failures: {"job_post_id", "error"} 목록
+    """
+    if not failures:
+        return
+    with engine.begin() as conn:
+        conn.execute(
+            text("""
+                INSERT INTO job_detail_failures (job_post_id, attempts, last_error, failed_at, next_attempt_at)
+                VALUES (:job_post_id, 1, :error, NOW(), NOW() + INTERVAL '1 hour' * LEAST(:base_hours, :max_hours))
+                ON CONFLICT (job_post_id) DO UPDATE SET
+                    attempts = job_detail_failures.attempts + 1,
+                    last_error = EXCLUDED.last_error,
+                    failed_at = NOW(),
+                    next_attempt_at = NOW() + INTERVAL '1 hour'
+                        * LEAST(:base_hours * POWER(2, job_detail_failures.attempts), :max_hours)
+            """),
+            [
+                {
+                    "job_post_id": failure["job_post_id"],
+                    "error": failure["error"][:500],
+                    "base_hours": DETAIL_RETRY_BASE_HOURS,
+                    "max_hours": DETAIL_RETRY_MAX_HOURS,
+                }
+                for failure in failures
+            ],
+        )
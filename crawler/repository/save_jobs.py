@@ -1,71 +1,343 @@
 # 💾 파일 경로: ai/crawler/repository/save_job.py
-# 🔄 크롤링된 공고를 jobs 테이블에 insert/update + 마감 공고 is_active=False 처리
+# 🔄 크롤링된 공고를 jobs 테이블에 배치 단위 upsert + 사라진 공고 is_active=False 처리
+# - 저장된 URL은 crawl_checkpoint 테이블에 기록 → 중단 후 재시작 시 이어서 진행, 마감 처리는 안티 조인 1회
+# - 공고 내용 해시(content_hash)가 같으면 행을 다시 쓰지 않고 last_seen_at만 일괄 갱신 (증분 크롤링)
+# - 내용이 바뀐(신규/수정/마감/재오픈) 공고에는 이번 크롤링의 세대 번호(changed_generation)를 기록
 
-from sqlalchemy import text
-from typing import List
+import hashlib
+import io
 import json
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Set, Tuple
+
+from psycopg2.extras import execute_values
+from sqlalchemy import text
 from .database import engine  # ✅ 공통 DB 연결 모듈 import
+from .crawl_lock import crawl_locks
+from .crawl_runs import finish_crawl_run, start_crawl_run
+
+# ✅ 이 건수 이상이면 임시 테이블 적재에 COPY 사용
+COPY_THRESHOLD = 5000
+
+# ✅ execute_values 한 번에 보내는 행 수 (COPY_THRESHOLD 미만일 때)
+UPSERT_PAGE_SIZE = 1000
+
+# ✅ 이보다 오래된 체크포인트는 이어받지 않음 (중단 후 한참 지나 재실행한 경우)
+CHECKPOINT_MAX_AGE_HOURS = 6
+
+# ✅ 저장 대상 컬럼 (url 기준 upsert, 나머지는 최신 값으로 덮어씀)
+JOB_COLUMNS = (
+    "title", "company", "location", "experience",
+    "min_experience", "max_experience",
+    "tech_stack", "due_date_text", "url", "job_type", "source", "is_active",
+)
+# ✅ source가 없는 공고(이전 방식으로 수집된 dict)의 수집 사이트
+DEFAULT_SOURCE = "jumpit"
+# ✅ 내용 해시 대상 컬럼 (is_active는 크롤링 결과에서 항상 True이므로 제외)
+HASH_COLUMNS = tuple(column for column in JOB_COLUMNS if column != "is_active")
+
+# ✅ 임시 테이블 컬럼 = 저장 컬럼 + 내용 해시
+STAGING_COLUMNS = JOB_COLUMNS + ("content_hash",)
+
+_COLUMN_LIST = ", ".join(JOB_COLUMNS)
+_STAGING_COLUMN_LIST = ", ".join(STAGING_COLUMNS)
+_UPDATE_SET = ",\n                ".join(
+    f"{column} = EXCLUDED.{column}" for column in STAGING_COLUMNS if column != "url"
+)
+# 해시가 같고 이미 활성인 공고는 갱신하지 않음 (dead tuple / 인덱스 갱신 방지)
+_ON_CONFLICT = f"""ON CONFLICT (url) DO UPDATE SET
+                {_UPDATE_SET},
+                changed_generation = EXCLUDED.changed_generation,
+                last_seen_at = NOW()
+            WHERE jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+               OR jobs.is_active = FALSE"""
+
+
+@contextmanager
+def _phase(timings: Dict[str, float], name: str):
+    """단계별 소요 시간(초)을 timings[name]에 기록합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - started
+
+
+def content_hash(job: dict) -> str:
+    """공고 내용(HASH_COLUMNS)의 해시 (32자 hex) - 값이 같으면 같은 해시"""
+    payload = json.dumps([job.get(column) for column in HASH_COLUMNS], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _to_rows(jobs: List[dict]) -> List[tuple]:
+    """
+    공고 dict 목록을 STAGING_COLUMNS 순서의 튜플로 변환합니다.
+    - 같은 URL이 여러 번 수집된 경우 마지막 값만 사용 (ON CONFLICT는 한 문장에서 같은 행을 두 번 갱신할 수 없음)
+    - 원본 dict는 변경하지 않음
+    """
+    by_url = {}
+    for job in jobs:
+        if not job.get("source"):
+            job = dict(job, source=DEFAULT_SOURCE)
+        row = dict(
+            job,
+            tech_stack=json.dumps(job.get("tech_stack") or [], ensure_ascii=False),
+            content_hash=content_hash(job),
+        )
+        by_url[job["url"]] = tuple(row.get(column) for column in STAGING_COLUMNS)
+    return list(by_url.values())
+
+
+# ✅ COPY 텍스트 형식 이스케이프 (백슬래시 / 탭 / 줄바꿈)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_line(row: tuple) -> str:
+    """
+    COPY 텍스트 형식 1행: None → \\N(NULL), 그 외는 이스케이프한 문자열
+    (CSV 형식은 빈 문자열과 NULL이 모두 빈 필드가 되어 ''가 NULL로 저장됨 → execute_values 결과와 달라짐)
+    """
+    return "\t".join("\\N" if value is None else str(value).translate(_COPY_ESCAPES) for value in row) + "\n"
+
+
+def _load_staging(cursor, rows: List[tuple]):
+    """
+    이번 크롤링 결과를 임시 테이블(jobs_staging)에 적재합니다. (트랜잭션 종료 시 자동 삭제)
+    - COPY_THRESHOLD건 이상: COPY (텍스트 형식 스트림)
+    - 그 외: execute_values로 UPSERT_PAGE_SIZE행씩 묶어 INSERT
+    - 두 방식 모두 None은 NULL, 빈 문자열은 빈 문자열로 저장
+    """
+    cursor.execute(f"""
+        CREATE TEMP TABLE jobs_staging ON COMMIT DROP AS
+        SELECT {_STAGING_COLUMN_LIST} FROM jobs WITH NO DATA
+    """)
+
+    if len(rows) >= COPY_THRESHOLD:
+        buffer = io.StringIO("".join(_copy_line(row) for row in rows))
+        cursor.copy_expert(f"COPY jobs_staging ({_STAGING_COLUMN_LIST}) FROM STDIN", buffer)
+    else:
+        execute_values(
+            cursor,
+            f"INSERT INTO jobs_staging ({_STAGING_COLUMN_LIST}) VALUES %s",
+            rows,
+            page_size=UPSERT_PAGE_SIZE,
+        )
+
+    # 안티 조인 계획 수립용 통계 (임시 테이블은 autovacuum 대상이 아님)
+    cursor.execute("ANALYZE jobs_staging")
+
+
+def _upsert_from_staging(cursor, generation: int) -> Tuple[int, int]:
+    """
+    jobs_staging → jobs 를 한 번의 INSERT ... SELECT ... ON CONFLICT (url) 로 반영합니다.
+    - 내용 해시가 같은 활성 공고는 건너뜀 (RETURNING에도 포함되지 않음)
+
+    Returns:
+        tuple: (신규 공고 수, 갱신된 공고 수) - xmax = 0 이면 INSERT된 행
+    """
+    cursor.execute(
+        f"""
+        INSERT INTO jobs ({_STAGING_COLUMN_LIST}, changed_generation)
+        SELECT {_STAGING_COLUMN_LIST}, %(generation)s FROM jobs_staging
+        {_ON_CONFLICT}
+        RETURNING (xmax = 0)
+        """,
+        {"generation": generation},
+    )
+    results = cursor.fetchall()
+    inserted = sum(1 for (is_insert,) in results if is_insert)
+    return inserted, len(results) - inserted
+
+
+def _touch_unchanged(cursor) -> int:
+    """
+    내용이 바뀌지 않은 공고는 last_seen_at만 한 번의 UPDATE로 갱신합니다.
+    (인덱스 없는 컬럼만 바꾸므로 HOT 업데이트 → 인덱스 갱신 없음)
 
+    Returns:
+        int: 변경 없이 확인만 된 공고 수
+    """
+    cursor.execute("""
+        UPDATE jobs
+        SET last_seen_at = NOW()
+        FROM jobs_staging s
+        WHERE jobs.url = s.url
+          AND jobs.content_hash = s.content_hash
+          AND jobs.last_seen_at < NOW()
+    """)
+    return cursor.rowcount
+
+
+def _record_checkpoint(cursor):
+    """이번 배치의 URL을 crawl_checkpoint에 기록합니다. (upsert와 같은 트랜잭션 → 저장된 배치만 기록됨)"""
+    cursor.execute("""
+        INSERT INTO crawl_checkpoint (url, source)
+        SELECT url, source FROM jobs_staging
+        ON CONFLICT (url) DO NOTHING
+    """)
+
+
+def _checkpoint_filter(sources: Optional[List[str]], keyword: str = "AND") -> str:
+    """sources가 있으면 체크포인트를 해당 사이트로 제한하는 조건 (:sources 파라미터 사용)"""
+    return f"{keyword} source = ANY(:sources)" if sources is not None else ""
+
+
+def _clear_checkpoint(conn, sources: Optional[List[str]]):
+    """체크포인트 비우기 (sources가 있으면 해당 사이트 것만 삭제)"""
+    if sources is None:
+        conn.execute(text("TRUNCATE crawl_checkpoint"))
+    else:
+        conn.execute(text("DELETE FROM crawl_checkpoint WHERE source = ANY(:sources)"), {"sources": sources})
+
+
+def load_checkpoint(
+    sources: Optional[List[str]] = None, max_age_hours: float = CHECKPOINT_MAX_AGE_HOURS
+) -> Set[str]:
+    """
+    중단된 이전 크롤링에서 이미 저장된 URL 집합을 반환합니다. (재시작 시 건너뛰기용)
+    - 마지막 기록이 max_age_hours보다 오래됐으면 체크포인트를 비우고 빈 집합 반환
+    - sources를 주면 해당 사이트의 체크포인트만 사용 (다른 사이트 크롤링과 동시에 실행 가능)
+    """
+    params = {"max_age": max_age_hours * 3600, "sources": sources}
+    with engine.begin() as conn:
+        count, is_stale = conn.execute(
+            text(f"""
+                SELECT COUNT(*), MAX(saved_at) < NOW() - make_interval(secs => :max_age)
+                FROM crawl_checkpoint
+                {_checkpoint_filter(sources, "WHERE")}
+            """),
+            params,
+        ).one()
+        if count == 0:
+            return set()
+        if is_stale:
+            _clear_checkpoint(conn, sources)
+            print("🧹 오래된 크롤링 체크포인트를 비웠습니다.")
+            return set()
+
+        return {
+            row[0] for row in conn.execute(
+                text(f"SELECT url FROM crawl_checkpoint {_checkpoint_filter(sources, 'WHERE')}"), params
+            )
+        }
+
+
+def save_job_batch(jobs: List[dict], generation: int) -> Dict[str, object]:
+    """
+    공고 한 배치를 저장합니다. (스트리밍 파이프라인에서 N건마다 호출)
+
+    - 배치를 임시 테이블에 적재한 뒤 INSERT ... SELECT ... ON CONFLICT (url) DO UPDATE 로 한 번에 반영
+      (내용 해시가 같은 공고는 다시 쓰지 않고 last_seen_at만 갱신)
+    - 같은 트랜잭션에서 배치 URL을 crawl_checkpoint에 기록 → 도중에 중단돼도 저장된 배치는 유지되고,
+      마감 처리(close_unseen_jobs)에서 이번 크롤링에 포함된 것으로 취급됨
+
+    Parameters:
+        jobs: 공고 dict 목록
+        generation: 이번 크롤링의 세대 번호 (변경된 공고의 changed_generation으로 기록)
+
+    Returns:
+        dict: inserted / updated / unchanged 건수 + timings(단계별 소요 시간, 초)
+    """
+    timings: Dict[str, float] = {}
+    result: Dict[str, object] = {"inserted": 0, "updated": 0, "unchanged": 0, "timings": timings}
+    if not jobs:
+        return result
 
-def save_jobs_to_db(jobs: List[dict]):
-    """
-    크롤링된 채용 공고 리스트를 DB에 저장합니다.
-
-    - URL 기준으로 기존 공고 존재 여부 판단
-    - 기존 공고면 UPDATE, 신규 공고면 INSERT
-    - 공통적으로 'is_active=True'로 저장 (모집 중 상태)
-    - 기존 공고 중 이번에 발견되지 않은 URL은 is_active=False + due_date_text='모집마감' 처리
-    """
-
-    # ✅ 이번에 크롤링된 URL 리스트 추출
-    crawled_urls = [job["url"] for job in jobs]
-
-    with engine.connect() as conn:
-        # ✅ 1. 기존 DB에서 사라진 공고 → 마감 처리 + 마감 텍스트 변경
-        inactive_stmt = text("""
-            UPDATE jobs
-            SET is_active = FALSE,
-                due_date_text = '모집마감'
-            WHERE is_active = TRUE
-              AND url NOT IN :crawled_urls
-        """)
-        conn.execute(inactive_stmt, {"crawled_urls": tuple(crawled_urls)})
-
-        # ✅ 2. 현재 공고 목록 insert 또는 update
-        for job in jobs:
-            job["tech_stack"] = json.dumps(job["tech_stack"])  # list → JSON 문자열
-
-            existing = conn.execute(
-                text("SELECT COUNT(*) FROM jobs WHERE url = :url"),
-                {"url": job["url"]}
-            ).scalar()
-
-            if existing == 0:
-                stmt = text("""
-                    INSERT INTO jobs (
-                        title, company, location, experience,
-                        tech_stack, due_date_text, url, job_type, is_active
-                    ) VALUES (
-                        :title, :company, :location, :experience,
-                        :tech_stack, :due_date_text, :url, :job_type, :is_active
-                    )
-                """)
+    # ✅ total: 커밋까지 포함한 전체 소요 시간
+    with _phase(timings, "total"):
+        with _phase(timings, "prepare"):
+            rows = _to_rows(jobs)
+
+        with engine.begin() as conn:
+            cursor = conn.connection.cursor()
+            try:
+                # ✅ 1. 배치 → 임시 테이블
+                with _phase(timings, "stage"):
+                    _load_staging(cursor, rows)
+
+                # ✅ 2. 신규/변경 공고 upsert → 변경 없는 공고는 last_seen_at만 갱신 → 체크포인트 기록
+                with _phase(timings, "upsert"):
+                    result["inserted"], result["updated"] = _upsert_from_staging(cursor, generation)
+                with _phase(timings, "touch"):
+                    result["unchanged"] = _touch_unchanged(cursor)
+                    _record_checkpoint(cursor)
+            finally:
+                cursor.close()
+
+    return result
+
+
+def close_unseen_jobs(generation: int, sources: Optional[List[str]] = None) -> int:
+    """
+    활성 공고 중 이번 크롤링(crawl_checkpoint)에 없는 공고를 마감 처리하고 체크포인트를 비웁니다.
+    - SQL 안티 조인 한 번으로 처리 (URL 목록을 파라미터로 보내지 않음)
+    - 체크포인트가 비어 있으면(크롤링 실패 등) 전체 공고가 마감되지 않도록 아무것도 하지 않음
+    - sources를 주면 해당 사이트의 공고만 마감하고 해당 사이트의 체크포인트만 비움
+      (수집에 실패한 사이트의 공고는 그대로 유지, 체크포인트는 남아 다음 실행에서 이어서 진행)
+
+    Parameters:
+        generation: 이번 크롤링의 세대 번호 (마감된 공고의 changed_generation으로 기록)
+        sources: 끝까지 수집한 사이트 이름 목록 (None이면 전체 사이트, 빈 목록이면 마감 처리 없음)
+
+    Returns:
+        int: 마감 처리된 공고 수
+    """
+    with engine.begin() as conn:
+        if sources is not None and not sources:
+            print("⚠️ 끝까지 수집한 사이트가 없어 마감 처리를 건너뜁니다.")
+            return 0
+        if conn.execute(
+            text(f"SELECT 1 FROM crawl_checkpoint {_checkpoint_filter(sources, 'WHERE')} LIMIT 1"),
+            {"sources": sources},
+        ).first() is None:
+            print("⚠️ 이번 크롤링에서 저장된 공고가 없어 마감 처리를 건너뜁니다.")
+            return 0
+
+        closed = conn.execute(
+            text(f"""
+                UPDATE jobs
+                SET is_active = FALSE,
+                    due_date_text = '모집마감',
+                    changed_generation = :generation
+                WHERE is_active = TRUE
+                  {_checkpoint_filter(sources)}
+                  AND NOT EXISTS (
+                      SELECT 1 FROM crawl_checkpoint c WHERE c.url = jobs.url
+                  )
+            """),
+            {"generation": generation, "sources": sources},
+        ).rowcount
+        _clear_checkpoint(conn, sources)
+
+    print(f"📛 모집 마감 처리 완료: {closed}건")
+    return closed
+
+
+def save_jobs_to_db(jobs: List[dict]) -> Dict[str, object]:
+    """
+    크롤링된 채용 공고 리스트 전체를 한 번에 저장하고, 사라진 공고를 마감 처리합니다.
+    (스트리밍 파이프라인을 쓰지 않는 일회성 적재용: save_job_batch + close_unseen_jobs)
+    - 세대 번호는 크롤링과 같은 방식으로 예약/확정 (start_crawl_run / finish_crawl_run)
+
+    Returns:
+        dict: inserted / updated / unchanged / closed 건수 + timings(단계별 소요 시간, 초)
+    """
+    with crawl_locks([DEFAULT_SOURCE]) as locked:
+        if not locked:
+            raise RuntimeError(f"다른 크롤링이 실행 중입니다: {DEFAULT_SOURCE}")
+
+        run_id, generation = start_crawl_run([DEFAULT_SOURCE])
+        try:
+            result = save_job_batch(jobs, generation)
+            if jobs:
+                result["closed"] = close_unseen_jobs(generation)
             else:
-                stmt = text("""
-                    UPDATE jobs
-                    SET title = :title,
-                        company = :company,
-                        location = :location,
-                        experience = :experience,
-                        tech_stack = :tech_stack,
-                        due_date_text = :due_date_text,
-                        job_type = :job_type,
-                        is_active = :is_active
-                    WHERE url = :url
-                """)
-
-            conn.execute(stmt, job)
-
-        conn.commit()
-
-    print("✅ 크롤링 데이터 저장 + 마감 처리 완료")
+                print("⚠️ 수집된 공고가 없어 저장/마감 처리를 건너뜁니다.")
+                result["closed"] = 0
+        except BaseException as e:
+            finish_crawl_run(run_id, "failed", {}, {}, {}, error=repr(e))
+            raise
+
+        finish_crawl_run(run_id, "succeeded", result["timings"], result, {})
+    return result
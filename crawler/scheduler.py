@@ -0,0 +1,103 @@
+# ⏰ 크롤링 스케줄러 (장기 실행 프로세스)
+# - 설정한 주기(cron 또는 고정 간격)마다 crawler_main.main() 실행, 실행 시각에 무작위 지연(jitter) 추가
+# - 실패하거나 일부 사이트를 끝까지 수집하지 못하면 지수 백오프로 재시도 (체크포인트로 이어서 진행)
+# - 사이트별 잠금(crawl_lock.py)으로 여러 서버에서 실행해도 같은 사이트는 한 번에 하나만 크롤링
+#
+# 사용법 (crawler 디렉터리에서 실행):
+#   python scheduler.py                                  # 6시간마다 (CRAWLER_SCHEDULE_INTERVAL_MINUTES)
+#   python scheduler.py --cron "0 */6 * * *"             # cron 표현식 (CRAWLER_SCHEDULE_CRON)
+#   python scheduler.py --run-now                        # 시작하자마자 1회 실행 후 주기 실행
+#   python scheduler.py --once                           # 1회만 실행 (재시도 포함) 후 종료
+
+import argparse
+import os
+import signal
+import threading
+from datetime import datetime
+from typing import Optional
+
+from crawler_main import main as run_crawl
+from services.schedule import backoff_seconds, jittered, parse_schedule
+
+# ✅ 기본 설정 (명령행 인자로 덮어쓸 수 있음)
+SCHEDULE_CRON = os.getenv("CRAWLER_SCHEDULE_CRON")
+SCHEDULE_INTERVAL_MINUTES = float(os.getenv("CRAWLER_SCHEDULE_INTERVAL_MINUTES", "360"))
+SCHEDULE_JITTER_SECONDS = float(os.getenv("CRAWLER_SCHEDULE_JITTER_SECONDS", "300"))
+RETRY_ATTEMPTS = int(os.getenv("CRAWLER_RETRY_ATTEMPTS", "3"))
+RETRY_BASE_SECONDS = float(os.getenv("CRAWLER_RETRY_BASE_SECONDS", "60"))
+RETRY_MAX_SECONDS = float(os.getenv("CRAWLER_RETRY_MAX_SECONDS", "1800"))
+
+# ✅ 종료 신호(SIGTERM/SIGINT) → 대기 중이면 바로, 크롤링 중이면 끝난 뒤 종료
+_stop = threading.Event()
+
+
+def _request_stop(signum, frame):
+    print("🛑 종료 신호 수신: 진행 중인 크롤링이 끝나면 종료합니다.")
+    _stop.set()
+
+
+def run_with_retry(source_names: Optional[str], attempts: int, base_seconds: float, max_seconds: float):
+    """
+    크롤링 1회 + 실패 시 재시도
+    - 예외: 같은 사이트 목록으로 재시도 / 일부 사이트 미완료: 미완료 사이트만 재시도
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            incomplete = run_crawl(source_names)
+            if not incomplete:
+                return
+            print(f"⚠️ 끝까지 수집하지 못한 사이트: {', '.join(incomplete)}")
+            source_names = ",".join(incomplete)
+        except Exception as e:
+            print(f"❌ 크롤링 실패 ({attempt}/{attempts}): {e!r}")
+
+        if attempt == attempts:
+            print("❌ 재시도 횟수 초과: 다음 예정 시각에 다시 실행합니다.")
+            return
+        delay = backoff_seconds(attempt, base_seconds, max_seconds)
+        print(f"🔁 {delay:.0f}초 후 재시도 ({attempt + 1}/{attempts})")
+        if _stop.wait(delay):
+            return
+
+
+def serve(args):
+    schedule = parse_schedule(args.cron, args.interval_minutes)
+    print(f"⏰ 크롤링 스케줄러 시작: {schedule} (jitter 최대 {args.jitter_seconds:g}초)")
+
+    next_run = datetime.now() if args.run_now else schedule.next_after(datetime.now())
+    while not _stop.is_set():
+        wait_seconds = jittered(max(0.0, (next_run - datetime.now()).total_seconds()), args.jitter_seconds)
+        print(f"🕒 다음 크롤링: {next_run:%Y-%m-%d %H:%M} (+jitter, {wait_seconds:.0f}초 후)")
+        if _stop.wait(wait_seconds):
+            break
+
+        started = datetime.now()
+        run_with_retry(args.sources, args.retry_attempts, args.retry_base_seconds, args.retry_max_seconds)
+        # 실행이 다음 예정 시각을 넘겨 끝났으면 밀린 회차는 건너뛰고 그다음 시각으로
+        next_run = schedule.next_after(max(started, next_run))
+        while next_run <= datetime.now():
+            next_run = schedule.next_after(next_run)
+
+    print("👋 크롤링 스케줄러 종료")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="채용 공고 크롤링 스케줄러")
+    parser.add_argument("--cron", default=SCHEDULE_CRON, help='cron 표현식 (예: "0 */6 * * *")')
+    parser.add_argument("--interval-minutes", type=float, default=SCHEDULE_INTERVAL_MINUTES)
+    parser.add_argument("--jitter-seconds", type=float, default=SCHEDULE_JITTER_SECONDS)
+    parser.add_argument("--retry-attempts", type=int, default=RETRY_ATTEMPTS)
+    parser.add_argument("--retry-base-seconds", type=float, default=RETRY_BASE_SECONDS)
+    parser.add_argument("--retry-max-seconds", type=float, default=RETRY_MAX_SECONDS)
+    parser.add_argument("--sources", default=None, help="수집할 사이트 (쉼표 구분, 기본: CRAWLER_SOURCES 또는 전체)")
+    parser.add_argument("--run-now", action="store_true", help="시작하자마자 1회 실행")
+    parser.add_argument("--once", action="store_true", help="1회만 실행 후 종료")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    if args.once:
+        run_with_retry(args.sources, args.retry_attempts, args.retry_base_seconds, args.retry_max_seconds)
+    else:
+        serve(args)
@@ -0,0 +1,33 @@
+# 🗜️ 공고 상세 본문 압축 저장 (zstd, 미설치 시 gzip)
+# - 저장한 압축 방식(encoding)을 함께 기록 → 설치 환경이 달라도 기존 행을 그대로 읽을 수 있음
+
+import gzip
+from typing import Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard 미설치 시 gzip 사용
+    zstandard = None
+
+# ✅ 압축 레벨 (zstd 3 ≈ gzip 6 수준 속도로 더 작은 결과)
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+
+def compress_text(text: str) -> Tuple[bytes, str]:
+    """본문 텍스트 → (압축 바이트, encoding) / encoding: "zstd" | "gzip" """
+    data = text.encode("utf-8")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data), "zstd"
+    return gzip.compress(data, compresslevel=GZIP_LEVEL), "gzip"
+
+
+def decompress_text(data: bytes, encoding: str) -> str:
+    """compress_text 결과 → 본문 텍스트 (zstd 행을 읽으려면 zstandard 필요)"""
+    if encoding == "gzip":
+        return gzip.decompress(data).decode("utf-8")
+    if encoding == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd로 저장된 본문을 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"알 수 없는 압축 방식: {encoding}")
@@ -0,0 +1,179 @@
+# 🏃 여러 채용 사이트를 asyncio로 동시에 수집하는 실행기
+# - 사이트(플러그인)마다 수집 작업 1개: fetch → parse → normalize → classify → 큐
+# - 저장 작업 1개: 큐에서 batch_size건씩 모아 save_batch 호출 (DB 저장은 스레드에서 실행)
+# - 같은 호스트를 쓰는 플러그인은 토큰 버킷 1개를 공유 → 호스트 단위 요청 속도 제한
+
+import asyncio
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List
+
+import httpx
+
+from sources import JobSource
+
+from .job_classifier import classify_posting  # 🔍 직무 분류 + 경력 범위 계산
+from .rate_limit import TokenBucket  # 🚦 호스트별 요청 속도 제한
+
+REQUEST_TIMEOUT_SECONDS = 10.0
+HEADERS = {"User-Agent": "Mozilla/5.0 (job-navigator crawler)"}
+
+# ✅ 수집 → 저장 사이 큐 크기 (저장이 밀리면 수집이 기다림 → 메모리 사용량 상한)
+QUEUE_BATCHES = 4
+
+_DONE = object()
+
+
+class CrawlRunner:
+    """
+    Parameters:
+        sources: 수집할 플러그인 목록
+        save_batch: 공고 묶음을 저장하는 함수 → {"inserted", "updated", "unchanged"} 반환
+        batch_size: 몇 건씩 묶어 저장할지
+        skip_urls: 이미 저장된 공고 URL (중단된 크롤링을 이어서 할 때 건너뜀)
+    """
+
+    def __init__(
+        self,
+        sources: List[JobSource],
+        save_batch: Callable[[List[dict]], dict],
+        batch_size: int,
+        skip_urls: Iterable[str] = (),
+    ):
+        self.sources = sources
+        self.save_batch = save_batch
+        self.batch_size = batch_size
+        self.skip_urls = frozenset(skip_urls)
+        self.limiters: Dict[str, TokenBucket] = {}
+        self.totals = Counter()
+        # 사이트별 결과: 수집 완료 여부 + 원본/내보낸/건너뛴/파싱 실패 건수
+        self.source_stats: Dict[str, Counter] = {source.name: Counter() for source in sources}
+        # 단계별 누적 소요 시간(초): fetch / parse / classify / upsert
+        # (fetch는 사이트별 대기 시간의 합 → 여러 사이트를 동시에 수집하면 실제 경과 시간보다 클 수 있음)
+        self.stage_seconds: Dict[str, float] = Counter()
+
+    @contextmanager
+    def timed(self, stage: str):
+        """with 블록 소요 시간을 stage_seconds[stage]에 누적합니다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[stage] += time.perf_counter() - started
+
+    def limiter_for(self, source: JobSource) -> TokenBucket:
+        """호스트별 토큰 버킷 (처음 등록한 플러그인의 rate/burst 사용)"""
+        if source.host not in self.limiters:
+            self.limiters[source.host] = TokenBucket(source.rate_per_second, source.burst)
+        return self.limiters[source.host]
+
+    async def _produce(self, source: JobSource, client: httpx.AsyncClient, queue: asyncio.Queue):
+        """플러그인 1개 수집 (실패 시 fallback 플러그인으로 이어서 수집, 이미 내보낸 공고는 건너뜀)"""
+        stats = self.source_stats[source.name]
+        emitted = set()
+        current = source
+        while current is not None:
+            current.skip_urls = self.skip_urls | emitted
+            try:
+                records = current.fetch(client, self.limiter_for(current)).__aiter__()
+                while True:
+                    try:
+                        with self.timed("fetch"):
+                            raw = await records.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    stats["cards_seen"] += 1
+
+                    with self.timed("parse"):
+                        job = current.parse(raw)
+                        job = current.normalize(job) if job is not None else None
+                    if job is None:
+                        stats["failed"] += 1
+                        continue
+                    if job["url"] in self.skip_urls:
+                        stats["skipped"] += 1
+                        continue
+                    if job["url"] in emitted:
+                        continue
+                    emitted.add(job["url"])
+                    stats["emitted"] += 1
+
+                    with self.timed("classify"):
+                        job = classify_posting(job)
+                    await queue.put(job)
+                stats["completed"] = 1
+                return
+            except (httpx.HTTPError, ValueError) as e:
+                current = current.fallback()
+                print(f"⚠️ [{source.name}] 수집 실패{' → 대체 수집으로 이어서 진행' if current else ''}: {e}")
+
+    async def _consume(self, queue: asyncio.Queue):
+        """큐에서 batch_size건씩 모아 저장 (DB 저장은 블로킹 → 스레드에서 실행)"""
+        batch: List[dict] = []
+
+        async def flush():
+            with self.timed("upsert"):
+                result = await asyncio.to_thread(self.save_batch, batch)
+            self.totals.update(
+                saved=len(batch),
+                inserted=result["inserted"],
+                updated=result["updated"],
+                unchanged=result["unchanged"],
+            )
+            print(
+                f"💾 저장 {self.totals['saved']}건 "
+                f"(신규 {self.totals['inserted']}, 갱신 {self.totals['updated']}, 변경 없음 {self.totals['unchanged']})"
+            )
+
+        while (job := await queue.get()) is not _DONE:
+            batch.append(job)
+            if len(batch) >= self.batch_size:
+                await flush()
+                batch = []
+        if batch:
+            await flush()
+
+    async def run(self) -> Counter:
+        """모든 플러그인을 동시에 수집 + 저장하고 전체 저장 건수를 반환합니다."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.batch_size * QUEUE_BATCHES)
+        consumer = asyncio.create_task(self._consume(queue))
+        async with httpx.AsyncClient(headers=HEADERS, timeout=REQUEST_TIMEOUT_SECONDS) as client:
+            producers = asyncio.gather(*(self._produce(source, client, queue) for source in self.sources))
+            try:
+                # 저장 작업이 먼저 끝났다면 저장 오류 → 큐가 막혀 수집이 멈추기 전에 중단
+                await asyncio.wait({producers, consumer}, return_when=asyncio.FIRST_COMPLETED)
+                if consumer.done():
+                    producers.cancel()
+                    await asyncio.gather(producers, return_exceptions=True)
+                    consumer.result()
+                await producers
+            finally:
+                # 수집 오류여도 이미 모은 공고는 저장하고 종료
+                if not consumer.done():
+                    done_marker = asyncio.ensure_future(queue.put(_DONE))
+                    await asyncio.wait({done_marker, consumer}, return_when=asyncio.FIRST_COMPLETED)
+                    done_marker.cancel()
+                await consumer
+        return self.totals
+
+    def counts(self) -> Dict[str, int]:
+        """전체 사이트 합계: 원본/파싱 실패/건너뜀 건수 + 저장 결과(신규/갱신/변경 없음)"""
+        return {
+            "cards_seen": sum(stats["cards_seen"] for stats in self.source_stats.values()),
+            "parse_failures": sum(stats["failed"] for stats in self.source_stats.values()),
+            "skipped": sum(stats["skipped"] for stats in self.source_stats.values()),
+            "inserted": self.totals["inserted"],
+            "updated": self.totals["updated"],
+            "unchanged": self.totals["unchanged"],
+        }
+
+    def completed_sources(self) -> List[str]:
+        """
+        끝까지 수집한 사이트 이름 목록 → 이 사이트들만 마감 처리 대상
+        (수집 실패 또는 0건이면 제외 → 일시적 장애로 전체 공고가 마감되는 것 방지)
+        """
+        return [
+            name for name, stats in self.source_stats.items()
+            if stats["completed"] and (stats["emitted"] or stats["skipped"])
+        ]
@@ -0,0 +1,152 @@
+# 📄 공고 상세 페이지 동시 수집 (신규/변경 공고만)
+# - 전체 동시 요청 수 제한(Semaphore) + 호스트별 토큰 버킷 → 같은 사이트에 요청이 몰리지 않음
+# - 조건부 요청: 이전 응답의 ETag / Last-Modified를 보내 304면 본문을 받지 않음
+# - 조건부 요청을 지원하지 않는 서버는 본문 해시로 비교 → 같으면 다시 저장하지 않음
+# - 본문은 텍스트만 추출해 zstd(미설치 시 gzip)로 압축 저장
+# - 실패(요청 오류 / 200·304 외 응답 / 본문 추출 실패)는 fail로 넘겨 재시도 대기 시간을 기록
+#   → 계속 실패하는 공고가 매번 대상 앞쪽을 차지하지 않도록
+
+import asyncio
+import hashlib
+import os
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from sources import JobSource
+
+from .body_codec import compress_text  # 🗜️ 본문 압축
+from .rate_limit import TokenBucket  # 🚦 호스트별 요청 속도 제한
+
+# ✅ 전체 동시 요청 수
+DETAIL_CONCURRENCY = int(os.getenv("CRAWLER_DETAIL_CONCURRENCY", "8"))
+
+# ✅ 몇 건마다 DB에 저장할지 (= 한 번에 요청을 예약하는 건수)
+DETAIL_BATCH_SIZE = 100
+
+REQUEST_TIMEOUT_SECONDS = 15.0
+HEADERS = {"User-Agent": "Mozilla/5.0 (job-navigator crawler)", "Accept": "text/html"}
+
+
+def body_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class DetailFetcher:
+    """
+    Parameters:
+        sources: 사이트 이름 → 수집 플러그인 (parse_detail / 상세 요청 속도 설정 사용)
+        save: 새 본문 목록 저장 함수 (job_details upsert)
+        touch: 본문이 바뀌지 않은 공고 목록({"job_post_id", "etag", "last_modified"}) 처리 함수
+               (fetched_at + 조건부 요청 값 갱신)
+        fail: 실패한 공고 목록({"job_post_id", "error"}) 처리 함수 (재시도 대기 시간 기록)
+        concurrency: 전체 동시 요청 수
+        transport: httpx 전송 계층 (테스트에서 httpx.MockTransport 주입, 기본: 실제 네트워크)
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, JobSource],
+        save: Callable[[List[dict]], None],
+        touch: Callable[[List[dict]], None],
+        fail: Callable[[List[dict]], None],
+        concurrency: int = DETAIL_CONCURRENCY,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.sources = sources
+        self.save = save
+        self.touch = touch
+        self.fail = fail
+        self.concurrency = concurrency
+        self.transport = transport
+        self.limiters: Dict[str, TokenBucket] = {}
+        # 건수: fetched(새 본문 저장) / not_modified(304·같은 해시) / failed(요청·파싱 실패)
+        self.stats = Counter()
+
+    def limiter_for(self, url: str, source: JobSource) -> TokenBucket:
+        """상세 페이지 호스트별 토큰 버킷"""
+        host = urlparse(url).netloc
+        if host not in self.limiters:
+            self.limiters[host] = TokenBucket(source.detail_rate_per_second, source.detail_burst)
+        return self.limiters[host]
+
+    async def _fetch_one(
+        self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, target: dict
+    ) -> dict:
+        """
+        상세 페이지 1건 요청
+        Returns: 새 본문이면 저장할 dict / 실패하면 {"job_post_id", "error"}
+                 / 바뀌지 않았으면 {"job_post_id", "etag", "last_modified"} (다음 조건부 요청에 보낼 최신 값)
+        """
+        job_post_id = target["job_post_id"]
+        source = self.sources[target["source"]]
+        headers = {}
+        if target.get("etag"):
+            headers["If-None-Match"] = target["etag"]
+        if target.get("last_modified"):
+            headers["If-Modified-Since"] = target["last_modified"]
+
+        try:
+            async with semaphore:
+                await self.limiter_for(target["url"], source).acquire()
+                response = await client.get(target["url"], headers=headers)
+        except httpx.HTTPError as e:
+            print(f"❌ 상세 페이지 요청 실패: {target['url']} ({e!r})")
+            return {"job_post_id": job_post_id, "error": repr(e)}
+
+        if response.status_code == 304:
+            # 304에 새 값이 없으면 이전 값 유지
+            return {
+                "job_post_id": job_post_id,
+                "etag": response.headers.get("ETag") or target.get("etag"),
+                "last_modified": response.headers.get("Last-Modified") or target.get("last_modified"),
+            }
+        if response.status_code != 200:
+            print(f"❌ 상세 페이지 응답 오류: {target['url']} ({response.status_code})")
+            return {"job_post_id": job_post_id, "error": f"HTTP {response.status_code}"}
+
+        text = source.parse_detail(response.text)
+        if not text:
+            return {"job_post_id": job_post_id, "error": "본문 추출 실패"}
+        validators = {
+            "job_post_id": job_post_id,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        digest = body_hash(text)
+        if digest == target.get("body_hash"):
+            # 본문은 같아도 200 응답의 ETag / Last-Modified로 교체 (이전 값을 계속 보내면 304를 받지 못함)
+            return validators
+
+        body, encoding = compress_text(text)
+        return {**validators, "body": body, "encoding": encoding, "body_hash": digest}
+
+    async def run(self, targets: List[dict]) -> Counter:
+        """대상 공고의 상세 페이지를 DETAIL_BATCH_SIZE건씩 동시에 요청하고 저장합니다."""
+        targets = [target for target in targets if target["source"] in self.sources]
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        async with httpx.AsyncClient(
+            headers=HEADERS, limits=limits, timeout=REQUEST_TIMEOUT_SECONDS, follow_redirects=True,
+            transport=self.transport,
+        ) as client:
+            for start in range(0, len(targets), DETAIL_BATCH_SIZE):
+                results = await asyncio.gather(*(
+                    self._fetch_one(client, semaphore, target)
+                    for target in targets[start:start + DETAIL_BATCH_SIZE]
+                ))
+                fetched = [result for result in results if "body" in result]
+                failed = [result for result in results if "error" in result]
+                unchanged = [result for result in results if "body" not in result and "error" not in result]
+                self.stats.update(fetched=len(fetched), not_modified=len(unchanged), failed=len(failed))
+                # DB 저장은 블로킹 → 스레드에서 실행
+                await asyncio.to_thread(self.save, fetched)
+                await asyncio.to_thread(self.touch, unchanged)
+                await asyncio.to_thread(self.fail, failed)
+                print(
+                    f"📄 상세 수집 {min(start + DETAIL_BATCH_SIZE, len(targets))}/{len(targets)}건 "
+                    f"(저장 {self.stats['fetched']}, 변경 없음 {self.stats['not_modified']}, 실패 {self.stats['failed']})"
+                )
+        return self.stats
@@ -0,0 +1,54 @@
+# 📄 경력 요건 텍스트 → (최소 경력, 최대 경력) 연수 변환 로직
+
+import re
+from typing import Optional, Tuple
+
+# ✅ 상한이 없는 경력 요건("경력 무관", "5년 이상")에 사용하는 최대 연수
+# - NULL 대신 큰 값을 저장해야 jobs.max_experience >= N 같은 범위 조건이 인덱스로 처리됨
+MAX_EXPERIENCE_YEARS = 99
+
+_NUMBER = re.compile(r"\d+")
+
+
+def parse_experience(text: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Jumpit 카드의 경력 요건 문자열을 (min_experience, max_experience)로 변환합니다.
+
+    예시:
+        "신입"          → (0, 0)
+        "신입-3년"      → (0, 3)
+        "경력 3~5년"    → (3, 5)
+        "경력 5년↑"     → (5, 99)
+        "경력 무관"     → (0, 99)
+        알 수 없는 형식 → (None, None)
+
+    Parameters:
+        text (str): 경력 요건 텍스트
+
+    Returns:
+        tuple: (최소 경력, 최대 경력) - 연 단위
+    """
+    if not text:
+        return None, None
+
+    normalized = text.replace(" ", "")
+    if "무관" in normalized:
+        return 0, MAX_EXPERIENCE_YEARS
+
+    years = [int(number) for number in _NUMBER.findall(normalized)]
+
+    if "신입" in normalized:
+        return 0, max(years) if years else 0
+
+    if len(years) >= 2:
+        return min(years), max(years)
+
+    if len(years) == 1:
+        (year,) = years
+        if any(mark in normalized for mark in ("이상", "↑", "+")):
+            return year, MAX_EXPERIENCE_YEARS
+        if any(mark in normalized for mark in ("이하", "↓", "미만")):
+            return 0, year
+        return year, year
+
+    return None, None
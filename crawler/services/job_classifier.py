@@ -1,5 +1,7 @@
 # 📄 직무 분류 로직 (텍스트 기반 키워드 매칭 방식)
 
+from .experience_parser import parse_experience  # 🧮 경력 텍스트 → 연수 범위 변환
+
 # ✅ 4가지 직무 카테고리별 키워드 정의
 # - 추후 확장을 고려하여 범위를 넓게 설정
 # - 대소문자 구분 없이 처리됨
@@ -49,3 +51,19 @@ def classify_job(title: str, tech_stack: str) -> str:
                 return job_type
 
     return "other"
+
+
+def classify_posting(job: dict) -> dict:
+    """
+    파싱된 공고 dict에 직무 분류(job_type)와 경력 범위(min/max_experience)를 채워 반환합니다.
+    - 수집 방식(Selenium / 목록 API)과 관계없이 같은 분류 단계를 사용
+    - 기본적으로 모든 공고는 is_active=True로 저장
+    """
+    min_experience, max_experience = parse_experience(job["experience"])
+    return {
+        **job,
+        "min_experience": min_experience,
+        "max_experience": max_experience,
+        "job_type": classify_job(job["title"], ", ".join(job["tech_stack"])),
+        "is_active": True,
+    }
@@ -0,0 +1,60 @@
+# 📄 중복 공고 판별용 SimHash 지문 (회사 + 정규화 제목 + 기술스택)
+
+import hashlib
+import re
+from typing import Iterable, List, Optional
+
+# ✅ 지문 비트 수 / 중복으로 판단하는 최대 해밍 거리
+FINGERPRINT_BITS = 64
+MAX_HAMMING_DISTANCE = 3
+
+# ✅ 제목에서 공고마다 달라지는 머리말 제거 (예: "[급구]", "(재공고)")
+_NOISE = re.compile(r"[\[(【](?:급구|재공고|재오픈|마감임박|채용|신규)[\])】]")
+_WORD = re.compile(r"[a-z0-9+#.]+|[가-힣]+")
+_HANGUL_SPACE = re.compile(r"(?<=[가-힣]) (?=[가-힣])")
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """
+    재게시 공고에서 흔히 달라지는 표기(머리말, 괄호, 한글 사이 띄어쓰기, 대소문자)를 제거한 제목을 반환합니다.
+
+    예시:
+        "[급구] 백엔드 개발자 (Python)" → "백엔드개발자 python"
+    """
+    if not title:
+        return ""
+    text = _NOISE.sub(" ", title.lower())
+    return _HANGUL_SPACE.sub("", " ".join(_WORD.findall(text)))
+
+
+def _features(title: str, tech_stack: Iterable[str]) -> List[str]:
+    features = []
+    for word in title.split():
+        # 한글은 음절 바이그램으로 → 글자 한두 개 차이에 둔감
+        if "가" <= word[0] <= "힣" and len(word) > 1:
+            features.extend(f"b:{word[i:i + 2]}" for i in range(len(word) - 1))
+        else:
+            features.append(f"w:{word}")
+    features.extend(f"t:{tech.strip().lower()}" for tech in tech_stack if tech and tech.strip())
+    return features
+
+
+def simhash(title: Optional[str], tech_stack: Optional[Iterable[str]]) -> int:
+    """
+    정규화 제목 + 기술스택의 64비트 SimHash 지문을 계산합니다.
+    비슷한 공고일수록 지문의 해밍 거리가 작습니다.
+    """
+    weights = [0] * FINGERPRINT_BITS
+    for feature in _features(normalize_title(title), tech_stack or []):
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def is_near_duplicate(a: int, b: int) -> bool:
+    return hamming_distance(a, b) <= MAX_HAMMING_DISTANCE
@@ -0,0 +1,105 @@
+# 📁 파일 경로: ai/crawler/services/jumpit_api.py
+# 🌐 Jumpit 목록 API(JSON)를 httpx로 직접 페이지 단위 수집 (Selenium 없이)
+# - 첫 페이지로 전체 건수를 확인한 뒤, 나머지 페이지를 커넥션 풀을 공유하는 asyncio 요청으로 동시에 수집
+# - 응답 JSON을 바로 파싱하므로 카드마다 WebDriver 왕복이 없음
+# - 수집 플러그인(sources/jumpit.py)에서 사용
+
+import asyncio
+import os
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from .rate_limit import TokenBucket  # 🚦 호스트별 요청 속도 제한
+
+# ✅ 목록 API 주소 (오프라인 벤치마크 시 fixture_server.py 주소로 교체)
+JUMPIT_API_URL = os.getenv("JUMPIT_API_URL", "https://jumpit-api.saramin.co.kr/api/positions")
+JUMPIT_POSITION_URL = "https://jumpit.saramin.co.kr/position/{id}"
+
+# ✅ 동시에 요청할 페이지 수 (= 커넥션 풀 크기)
+DEFAULT_CONCURRENCY = 8
+
+REQUEST_TIMEOUT_SECONDS = 10.0
+HEADERS = {"Accept": "application/json"}
+
+
+def _experience_text(position: dict) -> str:
+    """API의 경력 필드(newcomer/minCareer/maxCareer)를 카드와 같은 형식의 텍스트로 변환합니다."""
+    min_career = position.get("minCareer") or 0
+    max_career = position.get("maxCareer")
+    if position.get("newcomer"):
+        return f"신입-{max_career}년" if max_career else "신입"
+    if max_career and max_career >= min_career:
+        return f"경력 {min_career}~{max_career}년"
+    if min_career:
+        return f"경력 {min_career}년↑"
+    return "경력 무관"
+
+
+def _due_date_text(position: dict) -> str:
+    if position.get("alwaysOpen"):
+        return "상시채용"
+    closed_at = position.get("closedAt")
+    return closed_at[:10] if closed_at else "마감일 미정"
+
+
+def parse_position(position: dict) -> Optional[dict]:
+    """
+    [parse] 목록 API의 공고 1건을 Selenium 파싱 결과(parse_card)와 같은 형태의 dict로 변환합니다.
+    """
+    try:
+        locations = position.get("locations") or []
+        return {
+            "title": position["title"].strip(),
+            "company": position["companyName"].strip(),
+            "location": locations[0] if locations else "미상",
+            "experience": _experience_text(position),
+            "tech_stack": [tech.strip() for tech in position.get("techStacks") or [] if tech and tech.strip()],
+            "due_date_text": _due_date_text(position),
+            "url": JUMPIT_POSITION_URL.format(id=position["id"]),
+        }
+    except (KeyError, TypeError, AttributeError) as e:
+        print(f"❌ 공고 파싱 오류: {e}")
+        return None
+
+
+async def fetch_page(client: httpx.AsyncClient, api_url: str, page: int, limiter: TokenBucket) -> dict:
+    """[fetch] 목록 API 한 페이지 요청 → result 객체(totalCount, positions) 반환 (호스트 속도 제한 적용)"""
+    await limiter.acquire()
+    response = await client.get(api_url, params={"sort": "rsp_rate", "highlight": "false", "page": page}, headers=HEADERS)
+    response.raise_for_status()
+    return response.json().get("result") or {}
+
+
+async def iter_positions(
+    client: httpx.AsyncClient,
+    limiter: TokenBucket,
+    api_url: str = JUMPIT_API_URL,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> AsyncIterator[dict]:
+    """
+    Jumpit 목록 API를 페이지 단위로 동시에 요청해 원본 공고(position)를 한 건씩 내보냅니다.
+    - 첫 페이지로 전체 건수를 확인한 뒤, concurrency개 페이지씩 asyncio.gather로 요청
+    - 페이지 순서대로 내보냄 → 메모리에는 최대 concurrency 페이지만 유지
+
+    Parameters:
+        client: 커넥션 풀을 공유하는 httpx.AsyncClient
+        limiter: 목록 API 호스트의 토큰 버킷
+        api_url: 목록 API 주소
+        concurrency: 동시에 요청할 페이지 수
+    """
+    first = await fetch_page(client, api_url, 1, limiter)
+    positions = first.get("positions") or []
+    for position in positions:
+        yield position
+    if not positions:
+        return
+
+    page_size = len(positions)
+    total_pages = -(-int(first.get("totalCount") or 0) // page_size)
+    for start in range(2, total_pages + 1, concurrency):
+        pages = range(start, min(start + concurrency, total_pages + 1))
+        results = await asyncio.gather(*(fetch_page(client, api_url, page, limiter) for page in pages))
+        for result in results:
+            for position in result.get("positions") or []:
+                yield position
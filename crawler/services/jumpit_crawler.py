@@ -1,27 +1,38 @@
 # 📁 파일 경로: ai/crawler/services/jumpit_crawler.py
+# 📡 Jumpit 채용 공고 수집 (제너레이터 파이프라인: fetch → parse → classify)
+# - html 모드(기본): 끝까지 스크롤한 뒤 page_source를 한 번 받아 lxml로 모든 카드를 파싱
+# - webdriver 모드: 스크롤할 때마다 새로 나타난 카드를 find_element로 바로 파싱
+
+import os
+from typing import Iterable, Iterator, Optional
+from urllib.parse import urljoin
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.webdriver import Options
 from time import sleep
-from .job_classifier import classify_job  # 🔍 직무 분류 함수 import
-
-
-def get_jumpit_jobs() -> list[dict]:
-    """
-    Jumpit 웹사이트에서 채용 공고를 크롤링하여 dict 리스트로 반환합니다.
-    - title, company, location, experience, tech_stack(list), deadline, url 등 포함
-    - classify_job() 함수를 통해 job_type 자동 분류
-    - 기본적으로 모든 공고는 is_active=True로 저장
-    """
-
-    options = Options()
-    # options.add_argument("--headless")  # GUI 없애려면 주석 해제
-    driver = webdriver.Chrome(options=options)
-
+from .job_classifier import classify_posting  # 🔍 직무 분류 + 경력 범위 계산
+from .jumpit_html import (  # ⚡ page_source 일괄 파싱 + 공통 CSS 선택자
+    CARD_SELECTOR,
+    COMPANY_SELECTOR,
+    COMPANY_WRAPPER_SELECTOR,
+    DEADLINE_SELECTOR,
+    INFO_SELECTOR,
+    JUMPIT_BASE_URL,
+    TECH_SELECTOR,
+    TITLE_SELECTOR,
+    iter_listing_cards,
+)
+
+# ✅ 카드 파싱 방식: "html" (page_source를 한 번 받아 lxml로 파싱) | "webdriver" (카드마다 find_element)
+PARSE_MODE = os.getenv("CRAWLER_PARSE_MODE", "html")
+
+
+def open_listing(driver):
+    """Jumpit 채용 페이지를 열고 팝업을 닫습니다."""
     # ✅ Jumpit 채용 페이지 열기
-    driver.get("https://jumpit.saramin.co.kr/positions?sort=rsp_rate")
+    driver.get(f"{JUMPIT_BASE_URL}/positions?sort=rsp_rate")
     sleep(3)
 
     # ✅ 팝업 닫기 (존재하면)
@@ -32,63 +43,152 @@ def get_jumpit_jobs() -> list[dict]:
     except Exception:
         pass
 
-    # ✅ 페이지 끝까지 스크롤 다운
+
+def scroll_pages(driver) -> Iterator[None]:
+    """
+    페이지 끝까지 한 번씩 스크롤하며, 새 카드가 로드될 때마다 한 번씩 내보냅니다.
+    - 페이지 높이가 더 이상 늘지 않으면 종료
+    """
     last_height = driver.execute_script("return document.body.scrollHeight")
     while True:
+        yield
         driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
         sleep(1.5)
         new_height = driver.execute_script("return document.body.scrollHeight")
         if new_height == last_height:
-            break
+            return
         last_height = new_height
 
-    # ✅ 공고 수집
-    jobs = []
-    cards = driver.find_elements(By.CSS_SELECTOR, "a[href^='/position/']")
-    print(f"📦 수집된 공고 수: {len(cards)}개")
 
-    for card in cards:
+def fetch_cards(driver) -> Iterator:
+    """
+    [fetch] Jumpit 채용 페이지를 스크롤하며 새로 로드된 공고 카드(WebElement)를 순서대로 내보냅니다.
+    """
+    open_listing(driver)
+
+    # ✅ 스크롤할 때마다 이번에 추가된 카드만 내보냄
+    emitted = 0
+    for _ in scroll_pages(driver):
+        cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+        yield from cards[emitted:]
+        emitted = len(cards)
+
+    # 마지막 스크롤에서 추가된 카드
+    cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+    yield from cards[emitted:]
+
+
+def fetch_page_source(driver) -> str:
+    """
+    [fetch] 페이지 끝까지 스크롤한 뒤 렌더링된 HTML 전체를 한 번에 가져옵니다.
+    (카드마다 WebDriver 왕복 없이 iter_listing_cards로 파싱)
+    """
+    open_listing(driver)
+    for _ in scroll_pages(driver):
+        pass
+    return driver.page_source
+
+
+def card_url(card) -> str:
+    # get_attribute("href")는 이미 절대 URL을 반환하므로 urljoin으로 결합 (접두어 중복 방지)
+    return urljoin(JUMPIT_BASE_URL, card.get_attribute("href"))
+
+
+def _card_url_or_none(card) -> Optional[str]:
+    try:
+        return card_url(card)
+    except Exception:
+        return None
+
+
+def parse_card(card) -> Optional[dict]:
+    """
+    [parse] 공고 카드 1개에서 제목/회사/지역/경력/기술스택/마감일/URL을 추출합니다. (실패 시 None)
+    """
+    try:
+        title = card.find_element(By.CSS_SELECTOR, TITLE_SELECTOR).text.strip()
+
+        # ✅ 정확한 회사명 추출 (wrapper 내 첫 번째 div > span)
+        wrapper = card.find_element(By.CSS_SELECTOR, COMPANY_WRAPPER_SELECTOR)
+        company = wrapper.find_element(By.CSS_SELECTOR, COMPANY_SELECTOR).text.strip()
+
+        tech_list = card.find_elements(By.CSS_SELECTOR, TECH_SELECTOR)
+        tech_stack = [li.text.strip() for li in tech_list if li.text.strip()]
+
+        info_list = card.find_elements(By.CSS_SELECTOR, INFO_SELECTOR)
+        location = info_list[0].text.strip() if len(info_list) > 0 else "미상"
+        experience = info_list[1].text.strip() if len(info_list) > 1 else "경력 무관"
+
         try:
-            full_url = "https://jumpit.saramin.co.kr" + card.get_attribute("href")
-
-            title = card.find_element(By.CSS_SELECTOR, "h2").text.strip()
-
-            # ✅ 정확한 회사명 추출 (wrapper 내 첫 번째 div > span)
-            wrapper = card.find_element(By.CSS_SELECTOR, "div.sc-15ba67b8-0.kkQQfR")
-            company = wrapper.find_element(By.CSS_SELECTOR, "div:nth-of-type(1) > span").text.strip()
-
-            tech_list = card.find_elements(By.CSS_SELECTOR, "ul.sc-15ba67b8-1.iFMgIl > li")
-            tech_stack = [li.text.strip() for li in tech_list if li.text.strip()]
-
-            info_list = card.find_elements(By.CSS_SELECTOR, "ul.sc-15ba67b8-1.cdeuol > li")
-            location = info_list[0].text.strip() if len(info_list) > 0 else "미상"
-            experience = info_list[1].text.strip() if len(info_list) > 1 else "경력 무관"
-
-            try:
-                deadline = card.find_element(
-                    By.CSS_SELECTOR,
-                    "div.img_box > div.sc-d609d44f-3.hwTKyC > span"
-                ).text.strip()
-            except Exception:
-                deadline = "마감일 미정"
-
-            job_type = classify_job(title, ", ".join(tech_stack))
-
-            jobs.append({
-                "title": title,
-                "company": company,
-                "location": location,
-                "experience": experience,
-                "tech_stack": tech_stack,
-                "due_date_text": deadline,
-                "url": full_url,
-                "job_type": job_type,
-                "is_active": True,
-            })
-
-        except Exception as e:
-            print(f"❌ 크롤링 오류: {e}")
-            continue
-
-    driver.quit()
+            deadline = card.find_element(By.CSS_SELECTOR, DEADLINE_SELECTOR).text.strip()
+        except Exception:
+            deadline = "마감일 미정"
+
+        return {
+            "title": title,
+            "company": company,
+            "location": location,
+            "experience": experience,
+            "tech_stack": tech_stack,
+            "due_date_text": deadline,
+            "url": card_url(card),
+        }
+
+    except Exception as e:
+        print(f"❌ 크롤링 오류: {e}")
+        return None
+
+
+def iter_jumpit_postings(skip_urls: Iterable[str] = ()) -> Iterator[dict]:
+    """
+    Jumpit 채용 공고를 한 건씩 수집해 파싱 결과(분류 전)를 내보냅니다. (fetch → parse)
+    - 수집 플러그인(sources/jumpit.py)의 Selenium 대체 수집에서 사용
+    - 파싱에 실패한 카드는 None으로 내보냄 → 크롤링 실행기가 parse_failures로 집계
+
+    Parameters:
+        skip_urls: 이미 저장된 공고 URL (중단된 크롤링을 이어서 할 때 파싱 생략)
+    """
+    skip_urls = set(skip_urls)
+    options = Options()
+    # options.add_argument("--headless")  # GUI 없애려면 주석 해제
+    driver = webdriver.Chrome(options=options)
+    try:
+        if PARSE_MODE == "html":
+            # ⚡ page_source 한 번 + lxml 파싱 (카드당 WebDriver 왕복 없음)
+            jobs = (
+                job for job in iter_listing_cards(fetch_page_source(driver))
+                if job is None or job["url"] not in skip_urls
+            )
+        else:
+            jobs = (
+                parse_card(card) for card in fetch_cards(driver)
+                if _card_url_or_none(card) not in skip_urls
+            )
+        yield from jobs
+    finally:
+        driver.quit()
+
+
+def iter_jumpit_jobs(skip_urls: Iterable[str] = ()) -> Iterator[dict]:
+    """
+    Jumpit 채용 공고를 한 건씩 수집해 내보냅니다. (fetch → parse → classify)
+
+    Parameters:
+        skip_urls: 이미 저장된 공고 URL (중단된 크롤링을 이어서 할 때 파싱 생략)
+    """
+    for job in iter_jumpit_postings(skip_urls):
+        if job is not None:
+            yield classify_posting(job)
+
+
+def get_jumpit_jobs() -> list[dict]:
+    """
+    Jumpit 웹사이트에서 채용 공고를 크롤링하여 dict 리스트로 반환합니다.
+    - title, company, location, experience, tech_stack(list), deadline, url 등 포함
+    - classify_job() 함수를 통해 job_type 자동 분류
+    - parse_experience() 함수를 통해 min_experience / max_experience 계산
+    - 한 번에 전체 목록이 필요할 때만 사용 (크롤링 파이프라인은 iter_jumpit_jobs 사용)
+    """
+    jobs = list(iter_jumpit_jobs())
+    print(f"📦 수집된 공고 수: {len(jobs)}개")
     return jobs
@@ -0,0 +1,94 @@
+# 📁 파일 경로: ai/crawler/services/jumpit_html.py
+# ⚡ 렌더링된 Jumpit 목록 HTML(page_source)에서 공고 카드를 한 번에 파싱 (lxml)
+# - WebDriver 없이 순수 함수로 동작 → 저장해 둔 HTML 파일로 단독 검증 가능
+#   예) python -m services.jumpit_html saved_page.html
+
+from typing import Iterator, List, Optional
+from urllib.parse import urljoin
+
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
+
+JUMPIT_BASE_URL = "https://jumpit.saramin.co.kr"
+
+# ✅ 공고 카드 CSS 선택자 (WebDriver / lxml 파서 공통)
+CARD_SELECTOR = "a[href^='/position/']"
+TITLE_SELECTOR = "h2"
+COMPANY_WRAPPER_SELECTOR = "div.sc-15ba67b8-0.kkQQfR"
+COMPANY_SELECTOR = "div:nth-of-type(1) > span"
+TECH_SELECTOR = "ul.sc-15ba67b8-1.iFMgIl > li"
+INFO_SELECTOR = "ul.sc-15ba67b8-1.cdeuol > li"
+DEADLINE_SELECTOR = "div.img_box > div.sc-d609d44f-3.hwTKyC > span"
+
+# ✅ 선택자는 XPath로 한 번만 컴파일해 모든 카드에 재사용
+_cards = CSSSelector(CARD_SELECTOR)
+_title = CSSSelector(TITLE_SELECTOR)
+_company_wrapper = CSSSelector(COMPANY_WRAPPER_SELECTOR)
+_company = CSSSelector(COMPANY_SELECTOR)
+_techs = CSSSelector(TECH_SELECTOR)
+_infos = CSSSelector(INFO_SELECTOR)
+_deadline = CSSSelector(DEADLINE_SELECTOR)
+
+
+def _text(element) -> str:
+    # 브라우저의 innerText처럼 연속 공백을 하나로 합침
+    return " ".join(element.text_content().split())
+
+
+def _first_text(selector: CSSSelector, element) -> Optional[str]:
+    matches = selector(element)
+    return _text(matches[0]) if matches else None
+
+
+def parse_card_element(card) -> Optional[dict]:
+    """
+    [parse] lxml 카드 요소 1개 → 공고 dict (WebDriver 파서 parse_card와 같은 형태, 필수 항목이 없으면 None)
+    """
+    title = _first_text(_title, card)
+    wrappers = _company_wrapper(card)
+    company = _first_text(_company, wrappers[0]) if wrappers else None
+    if not title or not company:
+        return None
+
+    infos = [_text(li) for li in _infos(card)]
+    return {
+        "title": title,
+        "company": company,
+        "location": infos[0] if len(infos) > 0 else "미상",
+        "experience": infos[1] if len(infos) > 1 else "경력 무관",
+        "tech_stack": [tech for tech in (_text(li) for li in _techs(card)) if tech],
+        "due_date_text": _first_text(_deadline, card) or "마감일 미정",
+        "url": urljoin(JUMPIT_BASE_URL, card.get("href")),
+    }
+
+
+def iter_listing_cards(page_source: str) -> Iterator[Optional[dict]]:
+    """
+    Jumpit 목록 페이지 HTML 전체에서 공고 카드를 하나씩 파싱해 내보냅니다.
+    - 파싱 실패 카드는 None → 호출 측(크롤링 실행기)이 파싱 실패 건수로 집계
+    """
+    if not page_source:
+        return
+    document = lxml_html.fromstring(page_source)
+    for card in _cards(document):
+        job = parse_card_element(card)
+        if job is None:
+            print(f"❌ 카드 파싱 실패: {card.get('href')}")
+        yield job
+
+
+def parse_listing_html(page_source: str) -> List[dict]:
+    """
+    Jumpit 목록 페이지 HTML 전체에서 모든 공고 카드를 파싱합니다. (파싱 실패 카드는 제외)
+    """
+    return [job for job in iter_listing_cards(page_source) if job is not None]
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    with open(sys.argv[1], encoding="utf-8") as f:
+        parsed = parse_listing_html(f.read())
+    print(json.dumps(parsed, ensure_ascii=False, indent=2))
+    print(f"📦 파싱된 공고 수: {len(parsed)}개", file=sys.stderr)
@@ -0,0 +1,30 @@
+# 🚦 호스트별 요청 속도 제한 (asyncio 토큰 버킷)
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓이는 토큰 버킷.
+    - acquire()는 토큰이 생길 때까지 기다린 뒤 1개를 소비
+    - 같은 호스트를 쓰는 수집 작업이 하나의 버킷을 공유 → 호스트 단위 요청 속도 제한
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
@@ -0,0 +1,106 @@
+# ⏰ 크롤링 실행 주기 계산 (cron 표현식 / 고정 간격) + 지터 + 재시도 대기 시간
+# - cron: "분 시 일 월 요일" 5개 필드 (*, */n, a-b, a-b/n, a,b,c 지원 / 요일 0·7 = 일요일)
+
+import random
+from datetime import datetime, timedelta
+from typing import Optional, Set
+
+# ✅ cron 필드별 허용 범위 (분, 시, 일, 월, 요일)
+_FIELD_RANGES = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+# ✅ 다음 실행 시각을 찾을 최대 범위 (존재하지 않는 날짜 조합 방지, 예: 2월 30일)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(field: str, low: int, high: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start, end = (int(value) for value in base.split("-", 1))
+        else:
+            start = int(base)
+            end = high if step_text else start
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"cron 필드 범위 오류: {field!r} (허용 {low}-{high})")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """5필드 cron 표현식 (예: "0 */6 * * *" → 6시간마다 정각)"""
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 표현식은 5개 필드여야 합니다: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            _parse_field(field, low, high) for field, (low, high) in zip(fields, _FIELD_RANGES)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        # 일/요일 중 하나만 제한하면 그 필드만, 둘 다 제한하면 둘 중 하나만 맞아도 실행 (표준 cron 규칙)
+        # - "*"로 시작하는 필드(*, */2 등)는 제한하지 않은 것으로 취급 (cronie/Vixie cron과 동일)
+        self.any_day = fields[2].startswith("*")
+        self.any_weekday = fields[4].startswith("*")
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays  # Python 월=0 → cron 일=0
+        if self.any_day or self.any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=_MAX_SEARCH_DAYS)
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            elif candidate.hour not in self.hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 표현식: {self.expression!r}")
+
+    def __str__(self) -> str:
+        return f"cron {self.expression!r}"
+
+
+class IntervalSchedule:
+    """고정 간격 (이전 실행 시작 기준)"""
+
+    def __init__(self, minutes: float):
+        if minutes <= 0:
+            raise ValueError("실행 간격은 0보다 커야 합니다.")
+        self.interval = timedelta(minutes=minutes)
+
+    def next_after(self, moment: datetime) -> datetime:
+        return moment + self.interval
+
+    def __str__(self) -> str:
+        return f"{self.interval.total_seconds() / 60:g}분마다"
+
+
+def parse_schedule(cron: Optional[str], interval_minutes: float):
+    """cron 표현식이 있으면 cron, 없으면 고정 간격"""
+    return CronSchedule(cron) if cron else IntervalSchedule(interval_minutes)
+
+
+def jittered(seconds: float, jitter_seconds: float) -> float:
+    """여러 서버가 같은 시각에 몰리지 않도록 0~jitter_seconds초 무작위 지연 추가"""
+    return seconds + random.uniform(0, jitter_seconds) if jitter_seconds > 0 else seconds
+
+
+def backoff_seconds(attempt: int, base_seconds: float, max_seconds: float) -> float:
+    """재시도 대기 시간: base × 2^(attempt-1) ±20% 무작위 (최대 max_seconds)"""
+    delay = base_seconds * 2 ** (attempt - 1) * random.uniform(0.8, 1.2)
+    return min(delay, max_seconds)
@@ -0,0 +1,26 @@
+# 🧩 채용 사이트 수집 플러그인 등록
+# - 새 사이트 추가: JobSource를 상속한 플러그인을 만들고 SOURCES에 "이름": 생성 함수 등록
+# - CRAWLER_SOURCES=jumpit,wanted 처럼 쉼표로 수집할 사이트 선택 (기본: 전체)
+
+import os
+from typing import Callable, Dict, List, Optional
+
+from .base import JobSource
+from .jumpit import jumpit_source
+
+SOURCES: Dict[str, Callable[[], JobSource]] = {
+    "jumpit": jumpit_source,
+}
+
+
+def get_sources(names: Optional[str] = None) -> List[JobSource]:
+    """이름 목록(쉼표 구분)에 해당하는 수집 플러그인 생성 (없는 이름이면 ValueError)"""
+    names = names if names is not None else os.getenv("CRAWLER_SOURCES", ",".join(SOURCES))
+    selected = [name.strip() for name in names.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in SOURCES]
+    if unknown:
+        raise ValueError(f"알 수 없는 수집 사이트: {', '.join(unknown)} (가능: {', '.join(SOURCES)})")
+    return [SOURCES[name]() for name in selected]
+
+
+__all__ = ["JobSource", "SOURCES", "get_sources"]
@@ -0,0 +1,95 @@
+# 🧩 채용 사이트 수집 플러그인 인터페이스 (fetch → parse → normalize)
+
+import asyncio
+from typing import Any, AsyncIterator, FrozenSet, Iterator, Optional
+
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+
+from services.rate_limit import TokenBucket
+
+
+class JobSource:
+    """
+    채용 사이트 1곳의 수집 플러그인.
+
+    - fetch(): 원본 레코드(JSON 객체, HTML 카드 등)를 비동기로 하나씩 내보냄
+               (요청마다 limiter.acquire()로 호스트별 속도 제한을 지켜야 함)
+    - parse(): 원본 레코드 → 공통 공고 dict (title, company, location, experience,
+               tech_stack, due_date_text, url) / 파싱 실패 시 None
+    - normalize(): 사이트별 표기 차이 정리 + source 기록 (기본 구현 제공)
+    - fallback(): 수집 실패 시 대신 사용할 플러그인 (없으면 None)
+    - parse_detail(): 상세 페이지 HTML → 본문 텍스트 (기본 구현 제공, 상세 수집 단계에서 사용)
+
+    skip_urls는 실행기가 fetch 전에 채워 주는 "이미 저장된 공고 URL"입니다.
+    fetch 단계에서 상세 파싱을 생략하는 데 써도 되고, 무시해도 실행기가 다시 걸러냄.
+    """
+
+    # 저장 시 jobs.source 값
+    name: str = "base"
+
+    # 속도 제한 단위 호스트 / 초당 요청 수 / 순간 최대 요청 수
+    host: str = ""
+    rate_per_second: float = 2.0
+    burst: int = 2
+
+    # 상세 페이지 호스트별 초당 요청 수 / 순간 최대 요청 수 (공고마다 1회 요청 → 목록보다 보수적으로)
+    detail_rate_per_second: float = 2.0
+    detail_burst: int = 2
+
+    skip_urls: FrozenSet[str] = frozenset()
+
+    async def fetch(self, client: httpx.AsyncClient, limiter: TokenBucket) -> AsyncIterator[Any]:
+        raise NotImplementedError
+        yield  # pragma: no cover (async generator 표시용)
+
+    def parse(self, raw: Any) -> Optional[dict]:
+        raise NotImplementedError
+
+    def normalize(self, job: dict) -> dict:
+        """공통 정리: 공백 정리, 기술스택 중복 제거, 빈 값 기본값 채우기, source 기록"""
+        tech_stack = list(dict.fromkeys(tech.strip() for tech in job.get("tech_stack") or [] if tech and tech.strip()))
+        return {
+            **job,
+            "title": " ".join(job["title"].split()),
+            "company": job["company"].strip(),
+            "location": job.get("location") or "미상",
+            "experience": job.get("experience") or "경력 무관",
+            "tech_stack": tech_stack,
+            "due_date_text": job.get("due_date_text") or "마감일 미정",
+            "source": self.name,
+        }
+
+    def fallback(self) -> Optional["JobSource"]:
+        return None
+
+    def parse_detail(self, body: str) -> Optional[str]:
+        """상세 페이지 HTML → 본문 텍스트 (기본: <main> 또는 <body>의 블록별 텍스트, 스크립트/메뉴 제외)"""
+        try:
+            document = lxml_html.fromstring(body)
+        except (ValueError, etree.ParserError):
+            return None
+        for element in document.xpath("//script | //style | //noscript | //header | //footer | //nav"):
+            element.drop_tree()
+        roots = document.xpath("//main") or document.xpath("//body") or [document]
+        lines = (" ".join(line.split()) for line in roots[0].itertext())
+        text = "\n".join(line for line in lines if line)
+        return text or None
+
+
+_END = object()
+
+
+async def iterate_in_thread(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """
+    동기 제너레이터(Selenium 등 블로킹 수집)를 스레드에서 한 건씩 꺼내 비동기로 내보냅니다.
+    - 이벤트 루프를 막지 않으므로 다른 사이트 수집과 동시에 진행 가능
+    """
+    try:
+        while (item := await asyncio.to_thread(next, iterator, _END)) is not _END:
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await asyncio.to_thread(close)
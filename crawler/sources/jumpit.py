@@ -0,0 +1,63 @@
+# 🧩 Jumpit 수집 플러그인 (목록 API 기본 / Selenium 대체)
+
+import os
+from typing import Any, AsyncIterator, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from services.jumpit_api import DEFAULT_CONCURRENCY, JUMPIT_API_URL, iter_positions, parse_position
+from services.rate_limit import TokenBucket
+
+from .base import JobSource, iterate_in_thread
+
+# ✅ 수집 방식: "http" (목록 API, 실패 시 Selenium으로 대체) | "selenium"
+FETCH_MODE = os.getenv("CRAWLER_FETCH_MODE", "http")
+
+
+class JumpitApiSource(JobSource):
+    """Jumpit 목록 API(JSON)를 페이지 단위로 동시에 수집"""
+
+    name = "jumpit"
+    rate_per_second = 10.0
+    burst = DEFAULT_CONCURRENCY
+
+    def __init__(self, api_url: str = JUMPIT_API_URL, concurrency: int = DEFAULT_CONCURRENCY):
+        self.api_url = api_url
+        self.concurrency = concurrency
+        self.host = urlparse(api_url).netloc
+
+    async def fetch(self, client: httpx.AsyncClient, limiter: TokenBucket) -> AsyncIterator[Any]:
+        async for position in iter_positions(client, limiter, self.api_url, self.concurrency):
+            yield position
+
+    def parse(self, raw: Any) -> Optional[dict]:
+        return parse_position(raw)
+
+    def fallback(self) -> Optional[JobSource]:
+        return JumpitSeleniumSource()
+
+
+class JumpitSeleniumSource(JobSource):
+    """
+    Jumpit 채용 페이지를 Selenium으로 스크롤하며 수집 (블로킹 → 스레드에서 실행)
+    - 브라우저 1개가 페이지를 직접 여는 방식이라 요청 속도 제한은 스크롤 간격(sleep)이 대신함
+    """
+
+    name = "jumpit"
+    host = "jumpit.saramin.co.kr"
+
+    async def fetch(self, client: httpx.AsyncClient, limiter: TokenBucket) -> AsyncIterator[Any]:
+        # selenium 미설치 환경에서도 API 수집은 가능하도록 사용할 때만 import
+        from services.jumpit_crawler import iter_jumpit_postings
+
+        async for job in iterate_in_thread(iter_jumpit_postings(self.skip_urls)):
+            yield job
+
+    def parse(self, raw: Any) -> Optional[dict]:
+        return raw  # iter_jumpit_postings가 이미 카드 파싱까지 마친 dict를 내보냄 (파싱 실패 카드는 None)
+
+
+def jumpit_source() -> JobSource:
+    """CRAWLER_FETCH_MODE에 맞는 Jumpit 수집 플러그인"""
+    return JumpitSeleniumSource() if FETCH_MODE == "selenium" else JumpitApiSource()
@@ -0,0 +1,32 @@
+# 📄 파일명: tests/test_crawl_lock_pg.py
+# - 실제 PostgreSQL에서 사이트별 advisory lock 확인 (CRAWLER_TEST_DATABASE_URL이 없으면 건너뜀)
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("CRAWLER_TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("CRAWLER_TEST_DATABASE_URL 미설정 → PostgreSQL 테스트 건너뜀", allow_module_level=True)
+
+os.environ["CRAWLER_DATABASE_URL"] = TEST_DATABASE_URL
+
+from repository.crawl_lock import crawl_locks, lock_key  # noqa: E402
+
+
+def test_lock_key_is_stable_signed_64bit():
+    assert lock_key("jumpit") == lock_key("jumpit")
+    assert lock_key("jumpit") != lock_key("wanted")
+    assert -2**63 <= lock_key("jumpit") < 2**63
+
+
+def test_locked_source_is_skipped_until_released():
+    with crawl_locks(["pgtest-a", "pgtest-b"]) as first:
+        assert first == ["pgtest-a", "pgtest-b"]
+        # 다른 연결(= 다른 크롤링)에서는 이미 잠긴 사이트를 얻지 못함
+        with crawl_locks(["pgtest-b", "pgtest-c"]) as second:
+            assert second == ["pgtest-c"]
+
+    # with 블록이 끝나면 해제 → 다시 잠글 수 있음
+    with crawl_locks(["pgtest-a", "pgtest-b"]) as again:
+        assert again == ["pgtest-a", "pgtest-b"]
@@ -0,0 +1,74 @@
+# 📄 파일명: tests/test_dedup_jobs_pg.py
+# - 실제 PostgreSQL에서 중복 공고 연결 확인 (CRAWLER_TEST_DATABASE_URL이 없으면 건너뜀)
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("CRAWLER_TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("CRAWLER_TEST_DATABASE_URL 미설정 → PostgreSQL 테스트 건너뜀", allow_module_level=True)
+
+os.environ["CRAWLER_DATABASE_URL"] = TEST_DATABASE_URL
+
+from sqlalchemy import text  # noqa: E402
+
+from repository.database import engine  # noqa: E402
+from repository.dedup_jobs import link_duplicate_jobs  # noqa: E402
+
+COMPANY = "pgtest 중복 회사"
+URL_PREFIX = "https://pgtest.invalid/dedup/"
+
+
+def insert_job(number, is_active=True):
+    with engine.begin() as conn:
+        return conn.execute(
+            text("""
+                INSERT INTO jobs (title, company, tech_stack, url, source, is_active, changed_generation)
+                VALUES ('백엔드 개발자 (Python)', :company, CAST(:tech_stack AS jsonb), :url, 'pgtest', :is_active, 1)
+                RETURNING job_post_id
+            """),
+            {
+                "company": COMPANY,
+                "tech_stack": '["Python", "FastAPI", "PostgreSQL"]',
+                "url": f"{URL_PREFIX}{number}",
+                "is_active": is_active,
+            },
+        ).scalar()
+
+
+def fetch(job_post_id):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT canonical_job_id, changed_generation FROM jobs WHERE job_post_id = :id"),
+            {"id": job_post_id},
+        ).one()
+
+
+@pytest.fixture(autouse=True)
+def clean_rows():
+    def delete():
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM jobs WHERE url LIKE :prefix"), {"prefix": f"{URL_PREFIX}%"})
+
+    delete()
+    yield
+    delete()
+
+
+def test_changed_links_record_generation():
+    first, repost = insert_job(1), insert_job(2)
+
+    link_duplicate_jobs(generation=201)
+    assert fetch(first) == (None, 1)  # 대표 공고는 그대로 → 변경 피드에 포함하지 않음
+    assert fetch(repost) == (first, 201)
+
+    # 다시 실행해도 바뀐 것이 없으면 세대를 기록하지 않음
+    link_duplicate_jobs(generation=202)
+    assert fetch(repost) == (first, 201)
+
+    # 대표 공고가 마감되면 재게시 공고가 대표로 승격 → 목록에 다시 나타나므로 세대 기록
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE jobs SET is_active = FALSE WHERE job_post_id = :id"), {"id": first})
+    link_duplicate_jobs(generation=203)
+    assert fetch(repost) == (None, 203)
@@ -0,0 +1,103 @@
+# 📄 파일명: tests/test_detail_fetcher.py
+
+import asyncio
+
+import httpx
+
+from services.body_codec import decompress_text
+from services.detail_fetcher import DetailFetcher, body_hash
+from sources import JobSource
+
+PAGE = "<html><body><nav>메뉴</nav><main><h1>백엔드 개발자</h1><p>Python, FastAPI</p></main></body></html>"
+
+
+class FakeSource(JobSource):
+    name = "fake"
+    detail_rate_per_second = 1000.0
+    detail_burst = 100
+
+
+def run_fetcher(handler, targets):
+    saved, touched, failed = [], [], []
+    fetcher = DetailFetcher(
+        {"fake": FakeSource()}, saved.extend, touched.extend, failed.extend,
+        transport=httpx.MockTransport(handler),
+    )
+    stats = asyncio.run(fetcher.run(targets))
+    return stats, saved, touched, failed
+
+
+def target(job_post_id, **previous):
+    return {"job_post_id": job_post_id, "url": f"https://jobs.example.com/{job_post_id}", "source": "fake", **previous}
+
+
+def test_new_body_is_compressed_and_saved():
+    def handler(request):
+        return httpx.Response(200, text=PAGE, headers={"ETag": '"v1"', "Last-Modified": "Sat, 17 Oct 2026 00:00:00 GMT"})
+
+    stats, saved, touched, failed = run_fetcher(handler, [target(1)])
+
+    assert stats["fetched"] == 1 and touched == [] and failed == []
+    (detail,) = saved
+    assert decompress_text(detail["body"], detail["encoding"]) == "백엔드 개발자\nPython, FastAPI"
+    assert detail["etag"] == '"v1"'
+    assert detail["last_modified"] == "Sat, 17 Oct 2026 00:00:00 GMT"
+
+
+def test_conditional_request_not_modified():
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        return httpx.Response(304)
+
+    stats, saved, touched, failed = run_fetcher(
+        handler, [target(1, etag='"v1"', last_modified="Sat, 17 Oct 2026 00:00:00 GMT")]
+    )
+
+    assert seen_headers[0]["If-None-Match"] == '"v1"'
+    assert seen_headers[0]["If-Modified-Since"] == "Sat, 17 Oct 2026 00:00:00 GMT"
+    assert stats["not_modified"] == 1
+    assert saved == [] and failed == []
+    # 304에 새 값이 없으면 이전 값 유지
+    assert touched == [{"job_post_id": 1, "etag": '"v1"', "last_modified": "Sat, 17 Oct 2026 00:00:00 GMT"}]
+
+
+def test_same_body_hash_is_not_saved_again_but_refreshes_validators():
+    def handler(request):
+        return httpx.Response(200, text=PAGE, headers={"ETag": '"v2"'})
+
+    stats, saved, touched, failed = run_fetcher(
+        handler, [target(1, etag='"v1"', body_hash=body_hash("백엔드 개발자\nPython, FastAPI"))]
+    )
+
+    assert stats["not_modified"] == 1
+    assert saved == []
+    assert touched == [{"job_post_id": 1, "etag": '"v2"', "last_modified": None}]
+
+
+def test_error_responses_are_reported_as_failures():
+    def handler(request):
+        job_post_id = int(request.url.path.rsplit("/", 1)[1])
+        if job_post_id == 1:
+            return httpx.Response(404)
+        if job_post_id == 2:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(200, text="<html><body><script>only()</script></body></html>")
+
+    stats, saved, touched, failed = run_fetcher(handler, [target(1), target(2), target(3)])
+
+    assert stats["failed"] == 3
+    assert saved == [] and touched == []
+    errors = {failure["job_post_id"]: failure["error"] for failure in failed}
+    assert errors[1] == "HTTP 404"
+    assert "ConnectError" in errors[2]
+    assert errors[3] == "본문 추출 실패"
+
+
+def test_targets_for_unknown_sources_are_skipped():
+    def handler(request):
+        raise AssertionError("요청하면 안 됨")
+
+    stats, saved, touched, failed = run_fetcher(handler, [{**target(1), "source": "other"}])
+    assert sum(stats.values()) == 0 and failed == []
@@ -0,0 +1,29 @@
+# 📄 파일명: tests/test_experience_parser.py
+
+import pytest
+
+from services.experience_parser import MAX_EXPERIENCE_YEARS, parse_experience
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("신입", (0, 0)),
+        ("신입~3년", (0, 3)),
+        ("신입-3년", (0, 3)),
+        ("경력 3~5년", (3, 5)),
+        ("경력 5년↑", (5, MAX_EXPERIENCE_YEARS)),
+        ("5년 이상", (5, MAX_EXPERIENCE_YEARS)),
+        ("경력 무관", (0, MAX_EXPERIENCE_YEARS)),
+        ("무관", (0, MAX_EXPERIENCE_YEARS)),
+        ("3년 이하", (0, 3)),
+        ("경력 2년", (2, 2)),
+    ],
+)
+def test_parse_experience(text, expected):
+    assert parse_experience(text) == expected
+
+
+@pytest.mark.parametrize("text", ["경력", "협의 후 결정", "", None])
+def test_parse_experience_unparseable(text):
+    assert parse_experience(text) == (None, None)
@@ -0,0 +1,74 @@
+# 📄 파일명: tests/test_jumpit_html.py
+
+import asyncio
+from pathlib import Path
+
+from services.crawl_runner import CrawlRunner
+from services.jumpit_html import iter_listing_cards, parse_listing_html
+from sources.base import JobSource, iterate_in_thread
+
+LISTING_HTML = (Path(__file__).parent / "fixtures" / "jumpit_listing.html").read_text(encoding="utf-8")
+
+
+def test_parse_listing_html_extracts_cards():
+    jobs = parse_listing_html(LISTING_HTML)
+
+    assert [job["url"] for job in jobs] == [
+        "https://jumpit.saramin.co.kr/position/51234",
+        "https://jumpit.saramin.co.kr/position/51235",
+        "https://jumpit.saramin.co.kr/position/51237",
+    ]
+    assert jobs[0] == {
+        "title": "백엔드 개발자 (Python)",
+        "company": "테스트랩스",
+        "location": "서울 강남구",
+        "experience": "경력 3~5년",
+        "tech_stack": ["Python", "FastAPI", "PostgreSQL"],
+        "due_date_text": "D-12",
+        "url": "https://jumpit.saramin.co.kr/position/51234",
+    }
+
+
+def test_parse_listing_html_defaults_for_missing_fields():
+    frontend = parse_listing_html(LISTING_HTML)[1]
+    assert frontend["tech_stack"] == ["React", "TypeScript"]  # 빈 항목 제외
+    assert frontend["experience"] == "경력 무관"
+    assert frontend["due_date_text"] == "마감일 미정"
+
+
+def test_iter_listing_cards_reports_failed_cards_as_none():
+    cards = list(iter_listing_cards(LISTING_HTML))
+    assert len(cards) == 4
+    assert cards[2] is None
+    assert list(iter_listing_cards("")) == []
+
+
+class SavedPageSource(JobSource):
+    """Selenium 대체 수집과 같은 방식: 블로킹 파서 결과(실패 카드는 None)를 스레드에서 내보냄"""
+
+    name = "jumpit"
+    host = "jumpit.saramin.co.kr"
+
+    async def fetch(self, client, limiter):
+        async for job in iterate_in_thread(iter_listing_cards(LISTING_HTML)):
+            yield job
+
+    def parse(self, raw):
+        return raw
+
+
+def test_runner_counts_html_parse_failures():
+    saved = []
+
+    def save_batch(batch):
+        saved.extend(batch)
+        return {"inserted": len(batch), "updated": 0, "unchanged": 0}
+
+    runner = CrawlRunner([SavedPageSource()], save_batch, batch_size=10)
+    asyncio.run(runner.run())
+
+    counts = runner.counts()
+    assert counts["cards_seen"] == 4
+    assert counts["parse_failures"] == 1
+    assert len(saved) == 3
+    assert runner.completed_sources() == ["jumpit"]
@@ -0,0 +1,123 @@
+# 📄 파일명: tests/test_save_jobs_pg.py
+# - 실제 PostgreSQL에서 save_jobs 저장/마감 처리 확인 (COPY / execute_values / ON CONFLICT / 안티 조인)
+# - CRAWLER_TEST_DATABASE_URL이 없으면 건너뜀 (스키마: backend/sql 마이그레이션을 모두 적용한 DB)
+#   예: CRAWLER_TEST_DATABASE_URL=postgresql+psycopg2://postgres@/jobnav_test?host=/tmp/pgdata pytest tests/test_save_jobs_pg.py
+
+import os
+
+import pytest
+
+TEST_DATABASE_URL = os.getenv("CRAWLER_TEST_DATABASE_URL")
+if not TEST_DATABASE_URL:
+    pytest.skip("CRAWLER_TEST_DATABASE_URL 미설정 → PostgreSQL 테스트 건너뜀", allow_module_level=True)
+
+os.environ["CRAWLER_DATABASE_URL"] = TEST_DATABASE_URL
+
+from sqlalchemy import text  # noqa: E402
+
+from repository import save_jobs  # noqa: E402
+from repository.database import engine  # noqa: E402
+
+SOURCE = "pgtest"
+URL_PREFIX = "https://pgtest.invalid/jobs/"
+
+
+def make_job(number, **overrides):
+    job = {
+        "title": f"백엔드 개발자 {number}",
+        "company": "테스트 회사",
+        "location": "",  # 빈 문자열 → 빈 문자열로 저장되어야 함
+        "experience": "경력 3~5년",
+        "min_experience": 3,
+        "max_experience": 5,
+        "tech_stack": ["Python"],
+        "due_date_text": None,  # None → NULL
+        "url": f"{URL_PREFIX}{number}",
+        "job_type": None,
+        "source": SOURCE,
+        "is_active": True,
+    }
+    job.update(overrides)
+    return job
+
+
+def fetch_rows():
+    with engine.connect() as conn:
+        rows = conn.execute(
+            text("""
+                SELECT url, title, location, due_date_text, job_type, is_active, changed_generation
+                FROM jobs WHERE url LIKE :prefix ORDER BY url
+            """),
+            {"prefix": f"{URL_PREFIX}%"},
+        ).mappings().all()
+    return {row["url"]: dict(row) for row in rows}
+
+
+@pytest.fixture(autouse=True)
+def clean_rows():
+    def delete():
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM jobs WHERE url LIKE :prefix"), {"prefix": f"{URL_PREFIX}%"})
+            conn.execute(text("DELETE FROM crawl_checkpoint WHERE source = :source"), {"source": SOURCE})
+
+    delete()
+    yield
+    delete()
+
+
+@pytest.mark.parametrize("copy_threshold", [1, 10_000], ids=["copy", "execute_values"])
+def test_staging_paths_store_same_values(monkeypatch, copy_threshold):
+    monkeypatch.setattr(save_jobs, "COPY_THRESHOLD", copy_threshold)
+    jobs = [
+        make_job(1),
+        make_job(2, title="탭\t줄바꿈\n역슬래시\\N", job_type="정규직", due_date_text=""),
+    ]
+
+    result = save_jobs.save_job_batch(jobs, generation=101)
+
+    assert (result["inserted"], result["updated"], result["unchanged"]) == (2, 0, 0)
+    rows = fetch_rows()
+    first, second = rows[f"{URL_PREFIX}1"], rows[f"{URL_PREFIX}2"]
+    assert first["location"] == ""
+    assert first["due_date_text"] is None
+    assert first["job_type"] is None
+    assert second["title"] == "탭\t줄바꿈\n역슬래시\\N"
+    assert second["due_date_text"] == ""
+    assert {row["changed_generation"] for row in rows.values()} == {101}
+
+
+def test_resave_skips_unchanged_and_updates_changed():
+    save_jobs.save_job_batch([make_job(1), make_job(2)], generation=101)
+
+    result = save_jobs.save_job_batch([make_job(1), make_job(2, title="프론트엔드 개발자")], generation=102)
+
+    assert (result["inserted"], result["updated"], result["unchanged"]) == (0, 1, 1)
+    rows = fetch_rows()
+    assert rows[f"{URL_PREFIX}1"]["changed_generation"] == 101
+    assert rows[f"{URL_PREFIX}2"]["changed_generation"] == 102
+    assert rows[f"{URL_PREFIX}2"]["title"] == "프론트엔드 개발자"
+
+
+def test_close_unseen_jobs_closes_only_missing_postings():
+    save_jobs.save_job_batch([make_job(1), make_job(2)], generation=101)
+    save_jobs.close_unseen_jobs(101, sources=[SOURCE])  # 첫 크롤링의 체크포인트 정리
+
+    # 두 번째 크롤링에서는 1번만 수집됨
+    save_jobs.save_job_batch([make_job(1)], generation=102)
+    closed = save_jobs.close_unseen_jobs(102, sources=[SOURCE])
+
+    assert closed == 1
+    rows = fetch_rows()
+    assert rows[f"{URL_PREFIX}1"]["is_active"] is True
+    assert rows[f"{URL_PREFIX}2"]["is_active"] is False
+    assert rows[f"{URL_PREFIX}2"]["due_date_text"] == "모집마감"
+    assert rows[f"{URL_PREFIX}2"]["changed_generation"] == 102
+    assert save_jobs.load_checkpoint([SOURCE]) == set()
+
+
+def test_close_unseen_jobs_without_checkpoint_closes_nothing():
+    save_jobs.save_job_batch([make_job(1)], generation=101)
+    save_jobs.close_unseen_jobs(101, sources=[SOURCE])
+
+    assert save_jobs.close_unseen_jobs(102, sources=[SOURCE]) == 0
+    assert fetch_rows()[f"{URL_PREFIX}1"]["is_active"] is True
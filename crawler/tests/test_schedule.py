@@ -0,0 +1,84 @@
+# 📄 파일명: tests/test_schedule.py
+
+from datetime import datetime
+
+import pytest
+
+from services.schedule import CronSchedule, IntervalSchedule, backoff_seconds, parse_schedule
+
+
+@pytest.mark.parametrize(
+    "expression, moment, expected",
+    [
+        # 6시간마다 정각 (현재 시각이 정각이면 다음 주기)
+        ("0 */6 * * *", datetime(2026, 10, 18, 6, 0), datetime(2026, 10, 18, 12, 0)),
+        ("0 */6 * * *", datetime(2026, 10, 18, 22, 30), datetime(2026, 10, 19, 0, 0)),
+        # 초/마이크로초는 버리고 다음 분부터
+        ("* * * * *", datetime(2026, 10, 18, 9, 15, 59, 999), datetime(2026, 10, 18, 9, 16)),
+        # 목록 + 범위/간격
+        ("15,45 9-17/4 * * *", datetime(2026, 10, 18, 13, 50), datetime(2026, 10, 18, 17, 15)),
+        # 월말 → 다음 달 1일
+        ("30 2 1 * *", datetime(2026, 10, 31, 23, 59), datetime(2026, 11, 1, 2, 30)),
+        # 연말 → 다음 해
+        ("0 0 1 1 *", datetime(2026, 12, 31, 12, 0), datetime(2027, 1, 1, 0, 0)),
+        # 31일이 없는 달은 건너뜀
+        ("0 0 31 * *", datetime(2026, 4, 1, 0, 0), datetime(2026, 5, 31, 0, 0)),
+        # 2월 29일: 다음 윤년까지
+        ("0 0 29 2 *", datetime(2026, 3, 1, 0, 0), datetime(2028, 2, 29, 0, 0)),
+    ],
+)
+def test_cron_next_after(expression, moment, expected):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+def test_cron_weekday_only():
+    # 2026-10-18은 일요일 → 다음 월요일
+    assert CronSchedule("0 9 * * 1").next_after(datetime(2026, 10, 18, 9, 0)) == datetime(2026, 10, 19, 9, 0)
+    # 요일 0과 7은 모두 일요일
+    assert CronSchedule("0 9 * * 7").next_after(datetime(2026, 10, 18, 8, 0)) == datetime(2026, 10, 18, 9, 0)
+
+
+def test_cron_day_and_weekday_both_restricted_match_either():
+    # 매월 1일 또는 금요일: 2026-10-20(화) 이후 첫 금요일(23일)이 11월 1일보다 먼저
+    schedule = CronSchedule("0 0 1 * 5")
+    assert schedule.next_after(datetime(2026, 10, 20, 0, 0)) == datetime(2026, 10, 23, 0, 0)
+    # 2026-10-31(토) → 11월 1일(일)이 금요일이 아니어도 실행
+    assert schedule.next_after(datetime(2026, 10, 31, 0, 0)) == datetime(2026, 11, 1, 0, 0)
+
+
+@pytest.mark.parametrize(
+    "expression, moment, expected",
+    [
+        # 일 필드가 */2(홀수일) → "*"처럼 취급하여 요일(월)과 둘 다 만족해야 함 (OR 아님)
+        # 10-19(월, 홀수일) 다음은 10-26·11-02(짝수일)를 건너뛴 11-09
+        ("0 0 */2 * 1", datetime(2026, 10, 18, 0, 0), datetime(2026, 10, 19, 0, 0)),
+        ("0 0 */2 * 1", datetime(2026, 10, 19, 0, 0), datetime(2026, 11, 9, 0, 0)),
+        # 요일 필드가 */2(일·화·목·토) → 15일(목)까지 기다림 (OR였다면 10-03(토)에 실행)
+        ("0 0 15 * */2", datetime(2026, 10, 1, 0, 0), datetime(2026, 10, 15, 0, 0)),
+    ],
+)
+def test_cron_step_wildcard_is_unrestricted(expression, moment, expected):
+    assert CronSchedule(expression).next_after(moment) == expected
+
+
+@pytest.mark.parametrize("expression", ["0 0 * *", "60 * * * *", "0 24 * * *", "0 0 0 * *", "*/0 * * * *"])
+def test_cron_invalid_expression(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression)
+
+
+def test_cron_impossible_date():
+    with pytest.raises(ValueError):
+        CronSchedule("0 0 30 2 *").next_after(datetime(2026, 1, 1))
+
+
+def test_parse_schedule_and_interval():
+    assert isinstance(parse_schedule("0 * * * *", 60), CronSchedule)
+    interval = parse_schedule(None, 90)
+    assert isinstance(interval, IntervalSchedule)
+    assert interval.next_after(datetime(2026, 10, 18, 23, 0)) == datetime(2026, 10, 19, 0, 30)
+
+
+def test_backoff_seconds_is_capped():
+    assert 80 <= backoff_seconds(3, 25, 600) <= 120
+    assert backoff_seconds(20, 25, 600) == 600